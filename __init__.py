@@ -46,6 +46,8 @@ try:
     from . import preferences
     from . import properties
     from . import operators
+    from . import animation
+    from . import exchange
     from . import panels
     from . import utils
 
@@ -54,6 +56,8 @@ try:
         preferences,
         properties,
         operators,
+        animation,
+        exchange,
         panels,
         utils
     ]
@@ -0,0 +1,504 @@
+# ===============================================
+# FICHIER: animation.py (Équations animées : mise à jour par image et précalcul)
+# ===============================================
+#
+# Une équation qui contient le symbole 'frame' (image courante) ou 'time'
+# (secondes) est animée : la courbe générée est marquée, puis un handler
+# frame_change_post réécrit ses points sur place à chaque image.
+#
+# Modes (propriété ANIMATION_KEY de l'objet) :
+#   LIVE        évaluation de la fonction compilée à chaque image
+#   CACHE       lecture d'un tableau (images, points, 3) précalculé en .npy
+#   SHAPE_KEYS  clés de forme absolues, lues par Blender sans Python
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from bpy.types import Context, Curve, Object, Scene
+
+import os
+import re
+import time
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy.props import EnumProperty
+from bpy.types import Operator
+
+from . import throughput
+from .compiler import compile_expression
+from .preferences import get_text
+from .recipes import Recipe, read_recipe
+
+try:
+    import sympy as sp
+except ImportError:
+    sp = None
+
+# Type aliases
+OperatorReturn = Set[str]
+PositionFunction = Callable[[np.ndarray, np.ndarray], np.ndarray]  # (images, secondes) -> (F, N, 3)
+
+# Symboles de temps autorisés dans les équations
+TIME_SYMBOLS: Tuple[str, ...] = ('frame', 'time')
+
+# Propriétés personnalisées des objets animés
+ANIMATION_KEY: str = "plan_curves_animation"
+BAKE_PATH_KEY: str = "plan_curves_bake_path"
+BAKE_START_KEY: str = "plan_curves_bake_start"
+
+# Types de courbes animables (nombre de points fixe d'une image à l'autre)
+ANIMATED_CURVE_TYPES: Tuple[str, ...] = ('EXPLICIT', 'PARAMETRIC', 'POLAR')
+
+# Réglages reproduits par l'évaluation à chaque image ; les autres figent la courbe
+LIVE_SETTINGS: Tuple[Tuple[str, object], ...] = (
+    ('output_mode', 'POLY'),
+    ('sampling_mode', 'UNIFORM'),
+    ('simplify_enabled', False),
+)
+
+# Nombre d'images évaluées ensemble pendant le précalcul
+BAKE_CHUNK_FRAMES: int = 256
+
+# Noms des objets animés, et fonctions / caches chargés par objet
+_animated: Set[str] = set()
+_functions: Dict[Tuple, PositionFunction] = {}
+_caches: Dict[str, np.ndarray] = {}
+
+
+def is_animated(expressions: Iterable) -> bool:
+    """
+    Indique si des expressions dépendent du temps.
+
+    Args:
+        expressions: Expressions SymPy
+
+    Returns:
+        True si 'frame' ou 'time' apparaît dans l'une d'elles
+    """
+    return any(str(symbol) in TIME_SYMBOLS
+               for expr in expressions for symbol in getattr(expr, 'free_symbols', ()))
+
+
+def mentions_time(equations: Iterable[str]) -> bool:
+    """
+    Indique, sans analyse SymPy, si des équations nomment un symbole de temps.
+
+    Args:
+        equations: Textes des équations
+
+    Returns:
+        True si 'frame' ou 'time' y apparaît comme mot entier
+    """
+    pattern: str = r"\b(" + "|".join(TIME_SYMBOLS) + r")\b"
+    return any(re.search(pattern, text) for text in equations)
+
+
+def frozen_settings(settings) -> List[str]:
+    """
+    Réglages de génération que l'évaluation à chaque image ne reproduit pas.
+
+    L'aperçu direct échantillonne uniformément et écrit des splines POLY
+    sans simplification : une sortie Bézier, un échantillonnage en
+    longueur d'arc ou une simplification ne peuvent être animés.
+
+    Args:
+        settings: Propriétés de l'addon ou recette
+
+    Returns:
+        Noms des réglages incompatibles (vide si la courbe est animable)
+    """
+    if isinstance(settings, dict):
+        return [name for name, value in LIVE_SETTINGS if settings.get(name, value) != value]
+    return [name for name, value in LIVE_SETTINGS if getattr(settings, name, value) != value]
+
+
+def frame_rate(scene: Scene) -> float:
+    """Images par seconde de la scène."""
+    return scene.render.fps / scene.render.fps_base
+
+
+def time_values(scene: Scene, frame: Optional[float] = None) -> Dict[str, float]:
+    """
+    Valeurs des symboles de temps à une image.
+
+    Args:
+        scene: Scène Blender
+        frame: Image (défaut: image courante)
+
+    Returns:
+        {'frame': image, 'time': secondes}
+    """
+    frame = scene.frame_current if frame is None else frame
+    return {'frame': float(frame), 'time': float(frame) / frame_rate(scene)}
+
+
+def position_function(recipe: Recipe) -> PositionFunction:
+    """
+    Compile la recette d'une courbe animée en fonction des positions.
+
+    La fonction est diffusée : images et secondes en colonne (F, 1) contre
+    le paramètre en ligne (1, N) donnent toutes les images d'un coup.
+    Les fonctions sont gardées en cache par équations et domaine. Les
+    échantillons non finis sont laissés tels quels : comme à la génération,
+    write_points les retire et relie les points finis qui les entourent.
+
+    Args:
+        recipe: Recette tamponnée sur l'objet
+
+    Returns:
+        Fonction (images (F, 1), secondes (F, 1)) -> positions (F, N, 3)
+
+    Raises:
+        ValueError: Si le type de courbe ou ses réglages ne sont pas animables
+    """
+    curve_type: str = recipe.get('curve_type', '')
+    if curve_type not in ANIMATED_CURVE_TYPES:
+        raise ValueError(f"type de courbe non animable: {curve_type}")
+    frozen: List[str] = frozen_settings(recipe)
+    if frozen:
+        raise ValueError(f"réglages non animables: {', '.join(frozen)}")
+
+    explicit: bool = curve_type == 'EXPLICIT'
+    low: float = recipe['x_min'] if explicit else recipe['t_min']
+    high: float = recipe['x_max'] if explicit else recipe['t_max']
+    key: Tuple = (curve_type, recipe['equation1'], recipe.get('equation2', ''),
+                  low, high, recipe['resolution'])
+    func: Optional[PositionFunction] = _functions.get(key)
+    if func is not None:
+        return func
+
+    variable = sp.Symbol({'EXPLICIT': 'x', 'PARAMETRIC': 't', 'POLAR': 'theta'}[curve_type])
+    args = (variable, *(sp.Symbol(name) for name in TIME_SYMBOLS))
+    parameter: np.ndarray = np.linspace(low, high, recipe['resolution'])[None, :]
+    first: Callable = compile_expression(args, sp.sympify(recipe['equation1']))
+    second: Optional[Callable] = None
+    if curve_type == 'PARAMETRIC':
+        second = compile_expression(args, sp.sympify(recipe['equation2']))
+
+    def positions(frames: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+        shape = (len(frames), parameter.shape[1])
+        with np.errstate(all='ignore'):
+            u = np.broadcast_to(np.asarray(first(parameter, frames, seconds), dtype=np.float64), shape)
+            if curve_type == 'EXPLICIT':
+                x, y = np.broadcast_to(parameter, shape), u
+            elif curve_type == 'PARAMETRIC':
+                x = u
+                y = np.broadcast_to(np.asarray(second(parameter, frames, seconds), dtype=np.float64), shape)
+            else:
+                x, y = u * np.cos(parameter), u * np.sin(parameter)
+        result = np.zeros(shape + (3,))
+        result[..., 0] = x
+        result[..., 1] = y
+        return result
+
+    _functions[key] = positions
+    return positions
+
+
+def fill_non_finite(points: np.ndarray) -> np.ndarray:
+    """
+    Remplace les points non finis par le point fini précédent (ou suivant en tête).
+
+    Le nombre de points des clés de forme ne peut pas varier : un trou
+    devient un segment de longueur nulle, et la courbe tracée est la même
+    que celle de write_points, qui retire ces points.
+
+    Args:
+        points: Positions (F, N, 3), modifiées sur place
+
+    Returns:
+        Les mêmes positions
+    """
+    valid: np.ndarray = np.isfinite(points).all(axis=-1)
+    if valid.all():
+        return points
+    count: int = points.shape[1]
+    index: np.ndarray = np.where(valid, np.arange(count), 0)
+    np.maximum.accumulate(index, axis=1, out=index)
+    first: np.ndarray = np.argmax(valid, axis=1)
+    index = np.where(valid.any(axis=1)[:, None] & ~valid[np.arange(len(points))[:, None], index],
+                     first[:, None], index)
+    points[:] = np.take_along_axis(points, index[..., None], axis=1)
+    points[~np.isfinite(points)] = 0.0
+    return points
+
+
+def write_points(curve_data: Curve, points: np.ndarray) -> None:
+    """
+    Envoie des positions dans la spline POLY d'un datablock.
+
+    Comme à la génération (emit_curves), les positions non finies (pôles,
+    hors domaine) sont retirées et leurs voisines finies reliées ; la
+    spline n'est recréée que si le nombre de points restants change d'une
+    image à l'autre, sinon un seul foreach_set suffit.
+
+    Args:
+        curve_data: Datablock courbe
+        points: Positions (N, 3)
+    """
+    valid: np.ndarray = np.isfinite(points).all(axis=-1)
+    count: int = int(np.count_nonzero(valid))
+    if count < 2:
+        count = 0
+    splines = curve_data.splines
+    if [(spline.type, len(spline.points)) for spline in splines] != ([('POLY', count)] if count else []):
+        splines.clear()
+        if count:
+            splines.new('POLY').points.add(count - 1)
+
+    if count:
+        co: np.ndarray = np.ones((count, 4), dtype=np.float32)
+        co[:, :3] = points[valid]
+        splines[0].points.foreach_set("co", co.ravel())
+    curve_data.update_tag()
+
+
+def mark_animated(obj: Object) -> None:
+    """
+    Marque un objet généré comme animé (mode LIVE).
+
+    Args:
+        obj: Objet portant une recette (voir recipes.stamp_object)
+    """
+    obj[ANIMATION_KEY] = 'LIVE'
+    _animated.add(obj.name)
+
+
+def cache_directory() -> str:
+    """Dossier des précalculs : à côté du .blend, sinon dans le dossier temporaire."""
+    if bpy.data.filepath:
+        return bpy.path.abspath("//plan_curves_cache")
+    return os.path.join(bpy.app.tempdir or "/tmp", "plan_curves_cache")
+
+
+def load_cache(path: str) -> Optional[np.ndarray]:
+    """
+    Ouvre un précalcul .npy en mémoire projetée (gardé ouvert entre images).
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Tableau (images, points, 3), ou None s'il est introuvable
+    """
+    cache: Optional[np.ndarray] = _caches.get(path)
+    if cache is None:
+        try:
+            cache = np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        _caches[path] = cache
+    return cache
+
+
+def update_object(obj: Object, scene: Scene) -> None:
+    """
+    Met à jour un objet animé pour l'image courante.
+
+    Args:
+        obj: Objet animé
+        scene: Scène Blender
+    """
+    mode: str = obj.get(ANIMATION_KEY, '')
+    if mode == 'CACHE':
+        cache: Optional[np.ndarray] = load_cache(obj.get(BAKE_PATH_KEY, ''))
+        if cache is None:
+            return
+        index: int = min(max(scene.frame_current - int(obj.get(BAKE_START_KEY, 0)), 0),
+                         len(cache) - 1)
+        write_points(obj.data, cache[index])
+    elif mode == 'LIVE':
+        recipe: Optional[Recipe] = read_recipe(obj)
+        if recipe is None:
+            return
+        start: float = time.perf_counter()
+        values: Dict[str, float] = time_values(scene)
+        points: np.ndarray = position_function(recipe)(
+            np.array([[values['frame']]]), np.array([[values['time']]])
+        )
+        write_points(obj.data, points[0])
+        throughput.record(throughput.LIVE, recipe['curve_type'], len(points[0]),
+                          time.perf_counter() - start)
+
+
+@persistent
+def on_frame_change(scene: Scene, depsgraph=None) -> None:
+    """Handler frame_change_post : met à jour les objets animés de la scène."""
+    for name in list(_animated):
+        obj = bpy.data.objects.get(name)
+        if obj is None or ANIMATION_KEY not in obj:
+            _animated.discard(name)
+            continue
+        if obj.type != 'CURVE' or scene.objects.get(name) is None:
+            continue
+        try:
+            update_object(obj, scene)
+        except Exception as e:
+            print(f"⚠️ Animation {name}: {e}")
+            _animated.discard(name)
+
+
+@persistent
+def on_load(*_args) -> None:
+    """Handler load_post : retrouve les objets animés du fichier chargé."""
+    _animated.clear()
+    _caches.clear()
+    _animated.update(obj.name for obj in bpy.data.objects if obj.get(ANIMATION_KEY) in ('LIVE', 'CACHE'))
+
+
+class PLAN_CURVES_OT_bake_animation(Operator):
+    """Précalcule toutes les images des courbes animées sélectionnées."""
+
+    bl_idname: str = "plan_curves.bake_animation"
+    bl_label: str = "Bake Animation"
+    bl_description: str = "Précalcule les images des courbes animées pour une lecture sans évaluation"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    target: EnumProperty(  # type: ignore
+        name="Cible",
+        items=[
+            ('CACHE', "Cache disque", "Tableau .npy projeté en mémoire, lu à chaque image"),
+            ('SHAPE_KEYS', "Clés de forme", "Clés de forme absolues, lues par Blender sans Python"),
+            ('LIVE', "Aucun (direct)", "Supprime le précalcul et revient à l'évaluation directe"),
+        ],
+        default='CACHE'
+    )
+
+    def execute(self, context: Context) -> OperatorReturn:
+        """
+        Évalue toutes les images de la plage de la scène par blocs vectorisés.
+
+        Args:
+            context: Contexte Blender
+
+        Returns:
+            Statut d'exécution
+        """
+        scene: Scene = context.scene
+        objects: List[Object] = [obj for obj in (context.selected_objects or [context.active_object])
+                                 if obj is not None and ANIMATION_KEY in obj]
+        if not objects:
+            self.report({'ERROR'}, get_text('no_animated_curve'))
+            return {'CANCELLED'}
+
+        frames: np.ndarray = np.arange(scene.frame_start, scene.frame_end + 1, dtype=np.float64)
+        start: float = time.perf_counter()
+        for obj in objects:
+            if obj.data.shape_keys is not None:
+                obj.shape_key_clear()
+            if self.target == 'LIVE':
+                obj[ANIMATION_KEY] = 'LIVE'
+                _animated.add(obj.name)
+                continue
+
+            positions: np.ndarray = self.bake_positions(obj, frames, scene)
+            if self.target == 'CACHE':
+                self.write_cache(obj, positions, scene)
+            else:
+                # Nombre de points fixe entre clés : les trous sont comblés
+                self.write_shape_keys(obj, fill_non_finite(positions), scene)
+
+        print(f"🎞️ {len(objects)} courbe(s) × {len(frames)} images précalculées en "
+              f"{time.perf_counter() - start:.2f} s ({self.target})")
+        self.report({'INFO'}, f"{get_text('animation_baked')}: {len(objects)} × {len(frames)}")
+        return {'FINISHED'}
+
+    def bake_positions(self, obj: Object, frames: np.ndarray, scene: Scene) -> np.ndarray:
+        """
+        Évalue les positions d'un objet sur toutes les images.
+
+        Args:
+            obj: Objet animé
+            frames: Images (F,)
+            scene: Scène Blender
+
+        Returns:
+            Positions (F, N, 3) en float32, non finies comprises
+        """
+        func: PositionFunction = position_function(read_recipe(obj))
+        fps: float = frame_rate(scene)
+        chunks: List[np.ndarray] = []
+        for begin in range(0, len(frames), BAKE_CHUNK_FRAMES):
+            block: np.ndarray = frames[begin:begin + BAKE_CHUNK_FRAMES, None]
+            chunks.append(func(block, block / fps).astype(np.float32))
+        return np.concatenate(chunks)
+
+    def write_cache(self, obj: Object, positions: np.ndarray, scene: Scene) -> None:
+        """
+        Écrit le précalcul .npy et bascule l'objet en lecture du cache.
+
+        Args:
+            obj: Objet animé
+            positions: Positions (F, N, 3)
+            scene: Scène Blender
+        """
+        directory: str = cache_directory()
+        os.makedirs(directory, exist_ok=True)
+        path: str = os.path.join(directory, f"{bpy.path.clean_name(obj.name)}.npy")
+        _caches.pop(path, None)
+        np.save(path, positions)
+
+        obj[ANIMATION_KEY] = 'CACHE'
+        obj[BAKE_PATH_KEY] = path
+        obj[BAKE_START_KEY] = scene.frame_start
+        _animated.add(obj.name)
+
+    def write_shape_keys(self, obj: Object, positions: np.ndarray, scene: Scene) -> None:
+        """
+        Écrit une clé de forme absolue par image et anime leur lecture.
+
+        Les clés absolues sont espacées de 10 unités d'eval_time : une
+        interpolation linéaire de 0 à 10 × (F - 1) parcourt la plage.
+
+        Args:
+            obj: Objet animé
+            positions: Positions (F, N, 3)
+            scene: Scène Blender
+        """
+        write_points(obj.data, positions[0])
+        for index, points in enumerate(positions):
+            key = obj.shape_key_add(name=f"Frame_{scene.frame_start + index:04d}", from_mix=False)
+            key.data.foreach_set("co", points.ravel())
+
+        shape_keys = obj.data.shape_keys
+        shape_keys.use_relative = False
+        shape_keys.eval_time = 0.0
+        shape_keys.keyframe_insert("eval_time", frame=scene.frame_start)
+        shape_keys.eval_time = 10.0 * (len(positions) - 1)
+        shape_keys.keyframe_insert("eval_time", frame=scene.frame_end)
+        for fcurve in shape_keys.animation_data.action.fcurves:
+            for keyframe in fcurve.keyframe_points:
+                keyframe.interpolation = 'LINEAR'
+
+        obj[ANIMATION_KEY] = 'SHAPE_KEYS'
+        _animated.discard(obj.name)
+
+
+# Classes à enregistrer
+classes: Tuple[type, ...] = (
+    PLAN_CURVES_OT_bake_animation,
+)
+
+def register() -> None:
+    """Enregistre l'opérateur de précalcul et les handlers d'animation."""
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.app.handlers.frame_change_post.append(on_frame_change)
+    bpy.app.handlers.load_post.append(on_load)
+    # bpy.data n'est pas accessible pendant l'enregistrement : analyse différée
+    bpy.app.timers.register(on_load, first_interval=0.0)
+
+def unregister() -> None:
+    """Retire les handlers d'animation et désenregistre l'opérateur."""
+    for handlers, handler in ((bpy.app.handlers.frame_change_post, on_frame_change),
+                              (bpy.app.handlers.load_post, on_load)):
+        if handler in handlers:
+            handlers.remove(handler)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    _animated.clear()
+    _functions.clear()
+    _caches.clear()
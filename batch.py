@@ -0,0 +1,249 @@
+# ===============================================
+# FICHIER: batch.py (Génération en lot sans interface depuis un manifeste JSON)
+# ===============================================
+#
+# Usage :
+#   blender --background --python <addon>/batch.py -- manifeste.json
+#           [--output courbes.blend] [--jobs N] [--blender CHEMIN]
+#
+# Manifeste :
+#   {
+#     "output": {"blend": "courbes.blend", "clear_scene": true},
+#     "recipes": [
+#       {"name": "Cercle", "curve_type": "PARAMETRIC",
+#        "equation1": "cos(t)", "equation2": "sin(t)",
+#        "t_min": 0.0, "t_max": 6.283185, "resolution": 200,
+#        "output_mode": "BEZIER"}
+#     ]
+#   }
+#
+# Chaque recette suit le schéma de PresetData ; toute autre clé portant le
+# nom d'une propriété de PlanCurvesProperties (output_mode, sweep_enabled,
+# implicit_mode...) est appliquée telle quelle.
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if __name__ == "__main__":
+    # Lancé par « blender --python batch.py » : active l'addon puis délègue
+    # au module du paquet, seul à pouvoir faire les imports relatifs.
+    import importlib
+    import os
+    import addon_utils
+
+    _here: str = os.path.dirname(os.path.abspath(__file__))
+    for _module in addon_utils.modules():
+        if os.path.dirname(os.path.abspath(_module.__file__)) == _here:
+            addon_utils.enable(_module.__name__, default_set=False)
+            raise SystemExit(importlib.import_module(f"{_module.__name__}.batch").main())
+    raise SystemExit(f"❌ Addon introuvable pour {_here}")
+
+if TYPE_CHECKING:
+    from bpy.types import Object
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import bpy
+
+from .preset_manager import PresetData
+from .recipes import apply_recipe
+
+# Type aliases
+Manifest = Dict[str, Any]
+BatchResult = Tuple[int, List[str]]  # (objets créés, recettes en échec)
+
+
+def load_manifest(path: str) -> Manifest:
+    """
+    Lit et vérifie un manifeste JSON.
+
+    Args:
+        path: Chemin du manifeste
+
+    Returns:
+        Manifeste avec 'output' et 'recipes'
+
+    Raises:
+        ValueError: Si le manifeste est mal formé
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest: Manifest = json.load(f)
+
+    recipes = manifest.get('recipes')
+    if not isinstance(recipes, list) or not recipes:
+        raise ValueError("le manifeste doit contenir une liste 'recipes' non vide")
+    for index, recipe in enumerate(recipes):
+        if 'curve_type' not in recipe or 'equation1' not in recipe:
+            raise ValueError(f"recette {index}: 'curve_type' et 'equation1' sont requis")
+    manifest.setdefault('output', {})
+    return manifest
+
+
+def generate_recipes(context, recipes: Sequence[PresetData]) -> BatchResult:
+    """
+    Génère les recettes avec l'opérateur interactif (envoi groupé, tube partagé).
+
+    Les objets créés prennent le nom de leur recette.
+
+    Args:
+        context: Contexte Blender
+        recipes: Recettes à générer
+
+    Returns:
+        Tuple (nombre d'objets créés, noms des recettes en échec)
+    """
+    props = context.scene.plan_curves_props
+    created: int = 0
+    failures: List[str] = []
+
+    for index, recipe in enumerate(recipes):
+        name: str = recipe.get('name', f"Recette_{index:03d}")
+        before = set(bpy.data.objects)
+        try:
+            apply_recipe(props, recipe)
+            result = bpy.ops.plan_curves.generate_curve()
+        except (KeyError, TypeError, ValueError, RuntimeError) as e:
+            print(f"❌ {name}: {e}")
+            failures.append(name)
+            continue
+
+        if 'FINISHED' not in result:
+            print(f"❌ {name}: génération annulée")
+            failures.append(name)
+            continue
+
+        new_objects: List[Object] = [obj for obj in bpy.data.objects if obj not in before]
+        for number, obj in enumerate(new_objects):
+            obj.name = name if number == 0 else f"{name}.{number:03d}"
+        created += len(new_objects)
+        print(f"✅ {name}: {len(new_objects)} objet(s)")
+
+    return created, failures
+
+
+def shard_output_path(path: str, shard: int, jobs: int) -> str:
+    """
+    Chemin du fichier .blend d'une part.
+
+    Args:
+        path: Chemin de sortie du manifeste
+        shard: Indice de la part
+        jobs: Nombre de parts
+
+    Returns:
+        Chemin inchangé pour une seule part, suffixé _000, _001... sinon
+    """
+    if jobs <= 1:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}_{shard:03d}{ext or '.blend'}"
+
+
+def run_shard(manifest: Manifest, output: str, shard: int = 0, jobs: int = 1) -> int:
+    """
+    Génère une part du manifeste dans la session courante et l'enregistre.
+
+    Args:
+        manifest: Manifeste chargé
+        output: Chemin du fichier .blend
+        shard: Indice de la part (recettes shard, shard + jobs, ...)
+        jobs: Nombre de parts
+
+    Returns:
+        Code de sortie (0 si toutes les recettes ont abouti)
+    """
+    recipes: List[PresetData] = manifest['recipes'][shard::jobs]
+    context = bpy.context
+
+    if manifest['output'].get('clear_scene', True):
+        bpy.data.batch_remove(list(bpy.data.objects))
+
+    start: float = time.perf_counter()
+    created, failures = generate_recipes(context, recipes)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(output))
+    print(
+        f"📦 Part {shard + 1}/{jobs}: {len(recipes) - len(failures)}/{len(recipes)} recettes, "
+        f"{created} objets en {time.perf_counter() - start:.2f} s → {output}"
+    )
+    return 1 if failures else 0
+
+
+def run_parallel(manifest_path: str, output: str, jobs: int,
+                 blender: Optional[str] = None) -> int:
+    """
+    Répartit le manifeste sur plusieurs processus Blender en arrière-plan.
+
+    Args:
+        manifest_path: Chemin du manifeste
+        output: Chemin de sortie (suffixé par part)
+        jobs: Nombre de processus
+        blender: Exécutable Blender (défaut: celui de la session courante)
+
+    Returns:
+        Code de sortie (0 si toutes les parts ont abouti)
+    """
+    executable: str = blender or bpy.app.binary_path
+    processes: List[subprocess.Popen] = []
+    for shard in range(jobs):
+        command: List[str] = [
+            executable, '--background', '--python', os.path.abspath(__file__), '--',
+            manifest_path, '--shard', f"{shard}/{jobs}",
+            '--output', shard_output_path(output, shard, jobs),
+        ]
+        processes.append(subprocess.Popen(command))
+
+    codes: List[int] = [process.wait() for process in processes]
+    failed: List[int] = [shard for shard, code in enumerate(codes) if code != 0]
+    if failed:
+        print(f"❌ Parts en échec: {failed}")
+    return 1 if failed else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Point d'entrée en ligne de commande (arguments après « -- »).
+
+    Args:
+        argv: Arguments (défaut: ceux de sys.argv après « -- »)
+
+    Returns:
+        Code de sortie
+    """
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="batch.py",
+                                     description="Génération de courbes en lot")
+    parser.add_argument('manifest', help="Manifeste JSON des recettes")
+    parser.add_argument('--output', default=None, help="Fichier .blend de sortie")
+    parser.add_argument('--jobs', type=int, default=1, help="Nombre de processus Blender")
+    parser.add_argument('--shard', default=None, help="Part à générer, « k/N » (usage interne)")
+    parser.add_argument('--blender', default=None, help="Exécutable Blender des sous-processus")
+    arguments = parser.parse_args(argv)
+
+    manifest_path: str = os.path.abspath(arguments.manifest)
+    try:
+        manifest: Manifest = load_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Manifeste invalide: {e}")
+        return 2
+
+    output: str = arguments.output or manifest['output'].get('blend', "courbes.blend")
+    if not os.path.isabs(output):
+        output = os.path.join(os.path.dirname(manifest_path), output)
+
+    if arguments.shard:
+        shard, jobs = (int(part) for part in arguments.shard.split('/'))
+        return run_shard(manifest, output, shard, jobs)
+
+    jobs: int = max(1, min(arguments.jobs, len(manifest['recipes'])))
+    if jobs == 1:
+        return run_shard(manifest, output)
+    return run_parallel(manifest_path, output, jobs, arguments.blender)
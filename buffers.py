@@ -0,0 +1,163 @@
+# ===============================================
+# FICHIER: buffers.py (Réserve de tableaux NumPy réutilisés)
+# ===============================================
+
+from __future__ import annotations
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+# Type aliases
+BufferKey = Tuple[Tuple[int, ...], str]  # (forme, dtype)
+TrigTable = Tuple[np.ndarray, np.ndarray, np.ndarray]  # (θ, cos θ, sin θ)
+
+# Taille maximale conservée entre deux générations (octets)
+MAX_POOL_BYTES: int = 256 * 1024 * 1024
+
+# Nombre de tables trigonométriques polaires gardées en cache
+TRIG_TABLE_CACHE_SIZE: int = 16
+
+
+class BufferPool:
+    """
+    Réserve de tableaux NumPy indexée par (forme, dtype).
+
+    Les tableaux pris pendant une génération lui sont prêtés, puis rendus à
+    la réserve à la fin de celle-ci : la génération suivante, de même
+    résolution, retrouve les mêmes tampons au lieu d'en allouer de nouveaux.
+    Un tableau pris ne doit donc pas survivre à sa génération.
+    """
+
+    def __init__(self, max_bytes: int = MAX_POOL_BYTES) -> None:
+        """
+        Initialise une réserve vide.
+
+        Args:
+            max_bytes: Taille maximale conservée entre deux générations
+        """
+        self.max_bytes: int = max_bytes
+        self._free: Dict[BufferKey, List[np.ndarray]] = {}
+        self._leased: List[np.ndarray] = []
+        self._pooled_bytes: int = 0
+        self._depth: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bytes_saved: int = 0
+
+    def take(self, shape, dtype=np.float64) -> np.ndarray:
+        """
+        Fournit un tableau non initialisé de la forme et du type demandés.
+
+        Args:
+            shape: Forme du tableau
+            dtype: Type des éléments
+
+        Returns:
+            Tableau réutilisé si disponible, sinon nouvellement alloué
+        """
+        shape = tuple(int(n) for n in np.atleast_1d(shape))
+        key: BufferKey = (shape, np.dtype(dtype).str)
+        stack = self._free.get(key)
+        if stack:
+            buffer = stack.pop()
+            self._pooled_bytes -= buffer.nbytes
+            self.hits += 1
+            self.bytes_saved += buffer.nbytes
+        else:
+            buffer = np.empty(shape, dtype=dtype)
+            self.misses += 1
+
+        if self._depth:
+            self._leased.append(buffer)
+        return buffer
+
+    def cast(self, array: np.ndarray, dtype=np.float32) -> np.ndarray:
+        """
+        Équivalent de array.astype(dtype) dans un tampon de la réserve.
+
+        Args:
+            array: Tableau source
+            dtype: Type cible
+
+        Returns:
+            Copie convertie
+        """
+        buffer = self.take(np.shape(array), dtype)
+        np.copyto(buffer, array, casting='unsafe')
+        return buffer
+
+    @contextmanager
+    def generation(self) -> Iterator[BufferPool]:
+        """
+        Délimite une génération : les tableaux pris sont rendus à la sortie.
+
+        Les générations imbriquées sont rendues avec la plus externe.
+        """
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._recycle()
+
+    def _recycle(self) -> None:
+        """Rend les tableaux prêtés, dans la limite de max_bytes."""
+        for buffer in self._leased:
+            if self._pooled_bytes + buffer.nbytes > self.max_bytes:
+                continue
+            key: BufferKey = (buffer.shape, buffer.dtype.str)
+            self._free.setdefault(key, []).append(buffer)
+            self._pooled_bytes += buffer.nbytes
+        self._leased.clear()
+
+    def clear(self) -> None:
+        """Libère tous les tableaux conservés."""
+        self._free.clear()
+        self._pooled_bytes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion des demandes servies depuis la réserve."""
+        requests: int = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def summary(self) -> str:
+        """Résumé des statistiques pour la console."""
+        trig = trig_table.cache_info()
+        trig_requests: int = trig.hits + trig.misses
+        return (
+            f"Réserve de tampons: {self.hit_rate:.0%} réutilisés "
+            f"({self.hits}/{self.hits + self.misses}), "
+            f"{self.bytes_saved / (1024 * 1024):.1f} Mo d'allocations évitées, "
+            f"{self._pooled_bytes / (1024 * 1024):.1f} Mo conservés ; "
+            f"tables trigonométriques: {trig.hits}/{trig_requests} en cache"
+        )
+
+
+@lru_cache(maxsize=TRIG_TABLE_CACHE_SIZE)
+def trig_table(t_min: float, t_max: float, resolution: int) -> TrigTable:
+    """
+    Table (θ, cos θ, sin θ) mise en cache par (intervalle, résolution).
+
+    Les tableaux sont en lecture seule puisqu'ils sont partagés.
+
+    Args:
+        t_min: Angle minimal
+        t_max: Angle maximal
+        resolution: Nombre d'échantillons
+
+    Returns:
+        Tuple (θ, cos θ, sin θ) de forme (resolution,)
+    """
+    theta: np.ndarray = np.linspace(t_min, t_max, resolution)
+    table: TrigTable = (theta, np.cos(theta), np.sin(theta))
+    for array in table:
+        array.setflags(write=False)
+    return table
+
+
+# Réserve partagée par les opérateurs
+BUFFER_POOL: BufferPool = BufferPool()
@@ -0,0 +1,293 @@
+# ===============================================
+# FICHIER: compiler.py (Compilation optimisée des expressions SymPy)
+# ===============================================
+
+from __future__ import annotations
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+import time
+from functools import lru_cache
+import numpy as np
+
+try:
+    import sympy as sp
+except ImportError:
+    sp = None
+
+# Type aliases
+Replacements = List[Tuple["sp.Symbol", "sp.Expr"]]
+BenchmarkResult = Tuple[float, float, float]  # (lambdify seul, compilé, accélération)
+
+# Budget de temps total de la passe d'optimisation (secondes)
+COMPILE_TIME_BUDGET: float = 0.25
+
+# Nombre de fonctions compilées gardées en cache
+COMPILE_CACHE_SIZE: int = 128
+
+# Au-delà de ce nombre d'opérations, on compile sans optimiser
+COMPILE_MAX_OPS: int = 4000
+
+# Les réécritures SymPy ne sont pas interruptibles : réservées aux petites expressions
+SIMPLIFY_MAX_OPS: int = 400
+
+# sympy.cse non plus : bornée en taille, et lancée seulement si son coût
+# estimé (environ 0,2 ms par opération) tient dans le budget restant
+CSE_MAX_OPS: int = 1200
+CSE_SECONDS_PER_OP: float = 2e-4
+
+# Puissances entières développées en produits de carrés (x**4 -> x**2*x**2).
+# x**2 est laissé tel quel : NumPy l'évalue déjà avec np.square.
+MAX_POWER_EXPANSION: int = 4
+
+
+def _is_expensive(expr) -> bool:
+    """
+    Indique si une sous-expression vaut une variable temporaire.
+
+    Les temporaires nommés empêchent NumPy de réutiliser ses tableaux
+    intermédiaires : factoriser un simple produit coûte plus cher que de le
+    recalculer. Seuls les appels de fonctions et les puissances non entières
+    sont conservés.
+
+    Args:
+        expr: Sous-expression SymPy
+
+    Returns:
+        True si la sous-expression est coûteuse à évaluer
+    """
+    return any(
+        isinstance(node, sp.Function) or (node.is_Pow and not node.exp.is_Integer)
+        for node in sp.preorder_traversal(expr)
+    )
+
+
+def _expand_powers(expr, hoisted: Replacements, names: Iterator) -> "sp.Expr":
+    """
+    Réécrit les petites puissances entières en produits de carrés.
+
+    Une base composée est d'abord sortie dans une sous-expression, pour
+    n'être évaluée qu'une fois.
+
+    Args:
+        expr: Expression à réécrire
+        hoisted: Sous-expressions extraites, complétée en place
+        names: Générateur de symboles pour les bases extraites
+
+    Returns:
+        Expression réécrite
+    """
+    def expandable(node) -> bool:
+        return (node.is_Pow and node.exp.is_Integer
+                and 3 <= int(node.exp) <= MAX_POWER_EXPANSION)
+
+    def expand(node):
+        base = node.base
+        if not base.is_Symbol:
+            symbol = next(names)
+            hoisted.append((symbol, base))
+            base = symbol
+        squares, remainder = divmod(int(node.exp), 2)
+        factors = [base ** 2] * squares + [base] * remainder
+        return sp.Mul(*factors, evaluate=False)
+
+    return expr.replace(expandable, expand)
+
+
+def _bounded_simplify(expr, deadline: float) -> "sp.Expr":
+    """
+    Applique des réécritures bon marché, retenues seulement si elles réduisent le coût.
+
+    Args:
+        expr: Expression SymPy
+        deadline: Instant limite (time.perf_counter)
+
+    Returns:
+        Expression la moins coûteuse trouvée avant l'échéance
+    """
+    best, best_cost = expr, sp.count_ops(expr)
+    for rewrite in (sp.factor_terms, sp.powsimp):
+        if time.perf_counter() >= deadline:
+            break
+        candidate = rewrite(best)
+        cost = sp.count_ops(candidate)
+        if cost < best_cost:
+            best, best_cost = candidate, cost
+    return best
+
+
+def optimize_expressions(exprs: Sequence, budget: float = COMPILE_TIME_BUDGET
+                         ) -> Tuple[Replacements, List]:
+    """
+    Prépare des expressions pour la génération de code.
+
+    Étapes, chacune sautée si le budget de temps est épuisé :
+    simplification bornée, élimination des sous-expressions communes
+    (sympy.cse, qui sort aussi les appels trigonométriques répétés) limitée
+    aux sous-expressions coûteuses, puis développement des petites
+    puissances entières. Ni la simplification ni cse ne s'interrompent :
+    elles ne sont lancées que sous leur seuil d'opérations et si leur coût
+    estimé tient dans le budget ; sinon l'expression est lambdifiée telle quelle.
+
+    Args:
+        exprs: Expressions SymPy
+        budget: Budget de temps en secondes
+
+    Returns:
+        Tuple (sous-expressions [(symbole, expression)], expressions réduites)
+    """
+    exprs = [sp.sympify(expr) for expr in exprs]
+    cost: int = sum(sp.count_ops(expr) for expr in exprs)
+    if cost > COMPILE_MAX_OPS:
+        return [], exprs
+
+    deadline: float = time.perf_counter() + budget
+    if cost <= SIMPLIFY_MAX_OPS:
+        exprs = [_bounded_simplify(expr, deadline) for expr in exprs]
+        if time.perf_counter() >= deadline:
+            return [], exprs
+
+    cost = sum(sp.count_ops(expr) for expr in exprs)
+    if cost > CSE_MAX_OPS or time.perf_counter() + cost * CSE_SECONDS_PER_OP > deadline:
+        return [], exprs
+
+    names = sp.numbered_symbols('_cse')
+    candidates, reduced = sp.cse(exprs, symbols=names, optimizations=None)
+
+    # Réinjecte les sous-expressions bon marché
+    replacements: Replacements = []
+    inlined: Dict = {}
+    for symbol, sub_expr in candidates:
+        sub_expr = sub_expr.xreplace(inlined)
+        if _is_expensive(sub_expr):
+            replacements.append((symbol, sub_expr))
+        else:
+            inlined[symbol] = sub_expr
+    reduced = [expr.xreplace(inlined) for expr in reduced]
+    if time.perf_counter() >= deadline:
+        return replacements, reduced
+
+    # Développement des puissances : abandonné entier si l'échéance tombe en cours
+    expanded: Replacements = []
+    for symbol, sub_expr in replacements:
+        if time.perf_counter() >= deadline:
+            return replacements, reduced
+        sub_expr = _expand_powers(sub_expr, expanded, names)
+        expanded.append((symbol, sub_expr))
+    if time.perf_counter() >= deadline:
+        return replacements, reduced
+    reduced = [_expand_powers(expr, expanded, names) for expr in reduced]
+    return expanded, reduced
+
+
+def compile_expression(args: Sequence, expr, budget: float = COMPILE_TIME_BUDGET) -> Callable:
+    """
+    Remplace sp.lambdify(args, expr, modules=['numpy']) par une version optimisée.
+
+    Les fonctions compilées sont gardées en cache : régénérer plusieurs
+    objets de même équation ne compile qu'une fois.
+
+    Args:
+        args: Symboles d'entrée
+        expr: Expression SymPy, ou séquence d'expressions
+        budget: Budget de temps de l'optimisation en secondes
+
+    Returns:
+        Fonction NumPy vectorisée
+    """
+    multiple: bool = isinstance(expr, (list, tuple))
+    exprs: Tuple = tuple(expr) if multiple else (expr,)
+    try:
+        return _compile_cached(tuple(args), exprs, multiple, budget)
+    except TypeError:
+        # Arguments non hachables : pas de cache
+        return _compile(tuple(args), exprs, multiple, budget)
+
+
+def _compile(args: Tuple, exprs: Tuple, multiple: bool, budget: float) -> Callable:
+    """Compile sans cache (voir compile_expression)."""
+    exprs = list(exprs)
+    expr = exprs if multiple else exprs[0]
+
+    def optimized_cse(_exprs) -> Tuple[Replacements, object]:
+        replacements, reduced = optimize_expressions(exprs, budget)
+        return replacements, reduced if multiple else reduced[0]
+
+    try:
+        func = sp.lambdify(args, exprs if multiple else exprs[0],
+                           modules=['numpy'], cse=optimized_cse)
+    except TypeError:
+        # SymPy < 1.9 : pas de paramètre cse
+        func = sp.lambdify(args, expr, modules=['numpy'])
+    return func
+
+
+_compile_cached = lru_cache(maxsize=COMPILE_CACHE_SIZE)(_compile)
+
+
+def benchmark_compilation(args: Sequence, expr, samples: int = 1000000,
+                          repeat: int = 5) -> BenchmarkResult:
+    """
+    Compare l'évaluation de sp.lambdify seul et de la version compilée.
+
+    Args:
+        args: Symboles d'entrée
+        expr: Expression SymPy
+        samples: Nombre de points évalués par appel
+        repeat: Nombre de mesures (la meilleure est retenue)
+
+    Returns:
+        Tuple (temps lambdify, temps compilé, accélération)
+    """
+    plain = sp.lambdify(args, expr, modules=['numpy'])
+    compiled = compile_expression(args, expr)
+    rng = np.random.default_rng(0)
+    values = [rng.uniform(0.1, 2.0, samples) for _ in args]
+
+    def best_time(func: Callable) -> float:
+        timings = []
+        with np.errstate(all='ignore'):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func(*values)
+                timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    plain_time, compiled_time = best_time(plain), best_time(compiled)
+    return plain_time, compiled_time, plain_time / max(compiled_time, 1e-12)
+
+
+def benchmark_presets(presets: Dict[str, Dict[str, dict]], samples: int = 1000000
+                      ) -> Dict[str, BenchmarkResult]:
+    """
+    Mesure l'accélération de la compilation pour chaque preset.
+
+    Utilisable sans Blender, ex: benchmark_presets(SimplePresetManager().default_presets).
+
+    Args:
+        presets: Presets par type de courbe
+        samples: Nombre de points évalués par appel
+
+    Returns:
+        Dictionnaire "TYPE/nom" -> (temps lambdify, temps compilé, accélération)
+    """
+    x, y, t, theta = sp.symbols('x y t theta')
+    arguments: Dict[str, Tuple] = {
+        'EXPLICIT': (x,), 'PARAMETRIC': (t,), 'POLAR': (theta,), 'IMPLICIT': (x, y),
+        'SURFACE': (x, y),
+    }
+
+    results: Dict[str, BenchmarkResult] = {}
+    for curve_type, collection in presets.items():
+        args = arguments.get(curve_type)
+        if args is None:
+            continue
+        for name, data in collection.items():
+            exprs: List = [sp.sympify(data['equation1'])]
+            if curve_type == 'PARAMETRIC':
+                exprs.append(sp.sympify(data['equation2']))
+            expr = exprs if len(exprs) > 1 else exprs[0]
+            results[f"{curve_type}/{name}"] = benchmark_compilation(args, expr, samples)
+            plain_time, compiled_time, speedup = results[f"{curve_type}/{name}"]
+            print(f"⏱️ {curve_type}/{name}: {plain_time * 1e3:.2f} ms -> "
+                  f"{compiled_time * 1e3:.2f} ms (x{speedup:.2f})")
+    return results
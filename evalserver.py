@@ -0,0 +1,348 @@
+# ===============================================
+# FICHIER: evalserver.py (Serveur d'évaluation local, réutilisé entre sessions)
+# ===============================================
+#
+# Lancement : python evalserver.py [--socket CHEMIN] [--idle-timeout SECONDES]
+#
+# Protocole : une requête JSON par ligne sur un socket Unix, une réponse JSON
+# par ligne. Les tableaux transitent par multiprocessing.shared_memory, au
+# format de sandbox.pack_inputs.
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+try:
+    from .sandbox import pack_inputs, unpack_outputs, evaluate_job, release
+    from .compiler import compile_expression
+except ImportError:
+    # Exécuté comme script : modules voisins importés directement
+    from sandbox import pack_inputs, unpack_outputs, evaluate_job, release
+    from compiler import compile_expression
+
+# Nombre d'expressions compilées gardées par le serveur
+SERVER_CACHE_SIZE: int = 256
+
+# Délai de connexion et de réponse du client (secondes)
+CONNECT_TIMEOUT: float = 0.2
+REQUEST_TIMEOUT: float = 60.0
+
+
+def default_socket_path() -> str:
+    """Chemin du socket par défaut, propre à l'utilisateur."""
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(tempfile.gettempdir(), f"plan_curves_eval_{user}.sock")
+
+
+class EvalServerError(Exception):
+    """Erreur renvoyée par le serveur ou communication impossible."""
+
+
+class EvalServerUnavailable(EvalServerError):
+    """Serveur injoignable : aucune requête n'a pu lui parvenir."""
+
+
+class EvalServerClient:
+    """Client du serveur d'évaluation ; une connexion par requête."""
+
+    def __init__(self, path: Optional[str] = None, timeout: float = REQUEST_TIMEOUT) -> None:
+        """
+        Args:
+            path: Chemin du socket (défaut: default_socket_path())
+            timeout: Délai maximal d'une requête en secondes
+        """
+        self.path: str = path or default_socket_path()
+        self.timeout: float = timeout
+
+    def request(self, message: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Envoie une requête et attend la réponse.
+
+        Args:
+            message: Requête JSON
+            timeout: Délai propre à la requête
+
+        Returns:
+            Réponse JSON
+
+        Raises:
+            EvalServerUnavailable: Connexion impossible
+            EvalServerError: Délai dépassé, réponse illisible ou en erreur
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            raise EvalServerUnavailable("sockets Unix indisponibles")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            try:
+                conn.settimeout(CONNECT_TIMEOUT)
+                conn.connect(self.path)
+            except OSError as e:
+                raise EvalServerUnavailable(f"serveur injoignable: {e}")
+            try:
+                conn.settimeout(timeout or self.timeout)
+                conn.sendall(json.dumps(message).encode() + b"\n")
+                with conn.makefile('rb') as stream:
+                    line = stream.readline()
+            except socket.timeout:
+                raise EvalServerError(f"pas de réponse en {timeout or self.timeout:.0f} s")
+            except OSError as e:
+                raise EvalServerError(f"communication interrompue: {e}")
+
+        if not line:
+            raise EvalServerError("connexion fermée par le serveur")
+        try:
+            reply: Dict[str, Any] = json.loads(line)
+        except ValueError as e:
+            raise EvalServerError(f"réponse illisible: {e}")
+        if not isinstance(reply, dict):
+            raise EvalServerError("réponse illisible")
+        if not reply.get('ok'):
+            raise EvalServerError(reply.get('error', "erreur inconnue"))
+        return reply
+
+    def ping(self) -> Optional[Dict[str, Any]]:
+        """
+        Vérifie que le serveur répond.
+
+        Returns:
+            Statistiques du serveur, ou None s'il est indisponible
+        """
+        try:
+            return self.request({'op': 'ping'}, timeout=CONNECT_TIMEOUT * 5)
+        except EvalServerError:
+            return None
+
+    def evaluate(self, expressions: Sequence[str], symbols: Sequence[str],
+                 inputs: Sequence[np.ndarray]) -> List[np.ndarray]:
+        """
+        Évalue des expressions sur le serveur.
+
+        Args:
+            expressions: Expressions (chaînes SymPy ou srepr)
+            symbols: Noms des symboles d'entrée
+            inputs: Valeurs des entrées, diffusées entre elles
+
+        Returns:
+            Un tableau float64 par expression
+
+        Raises:
+            EvalServerError: Serveur injoignable ou erreur d'évaluation
+        """
+        block, job = pack_inputs(expressions, symbols, inputs)
+        try:
+            self.request(dict(job, op='evaluate'))
+            return unpack_outputs(block, job)
+        finally:
+            release(block)
+
+
+class RemoteFunction:
+    """
+    Fonction évaluée par le serveur, avec repli dans le processus.
+
+    Si le serveur est injoignable, l'expression est compilée localement et
+    toutes les évaluations suivantes restent locales. Un délai dépassé ou
+    une erreur d'évaluation est une vraie erreur : elle est propagée.
+    """
+
+    def __init__(self, client: EvalServerClient, symbols: Sequence, expression) -> None:
+        """
+        Args:
+            client: Client du serveur
+            symbols: Symboles d'entrée SymPy
+            expression: Expression SymPy
+        """
+        from sympy import srepr
+        self.client: EvalServerClient = client
+        self.args: Tuple = tuple(symbols)
+        self.expression = expression
+        self.text: str = srepr(expression)
+        self.names: List[str] = [str(symbol) for symbol in symbols]
+        self.local: Optional[Callable] = None
+
+    def __call__(self, *values: np.ndarray) -> np.ndarray:
+        if self.local is None:
+            try:
+                return self.client.evaluate([self.text], self.names, values)[0]
+            except EvalServerUnavailable as e:
+                print(f"⚠️ Serveur d'évaluation: {e} — évaluation locale")
+                self.local = compile_expression(self.args, self.expression)
+        return self.local(*values)
+
+
+# ===============================================
+# SERVEUR
+# ===============================================
+
+class CompiledCache:
+    """Cache LRU des expressions compilées, partagé entre connexions."""
+
+    def __init__(self, size: int = SERVER_CACHE_SIZE) -> None:
+        self.size: int = size
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, symbols: Tuple[str, ...], text: str) -> Callable:
+        """
+        Renvoie la fonction compilée de (symboles, expression), compilée au besoin.
+
+        Args:
+            symbols: Noms des symboles d'entrée
+            text: Expression (chaîne SymPy ou srepr)
+
+        Returns:
+            Fonction NumPy vectorisée
+        """
+        import sympy as sp
+
+        key = (symbols, text)
+        with self.lock:
+            func = self.entries.get(key)
+            if func is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return func
+            self.misses += 1
+            func = compile_expression([sp.Symbol(name) for name in symbols], sp.sympify(text))
+            self.entries[key] = func
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+            return func
+
+
+class EvalRequestHandler(socketserver.StreamRequestHandler):
+    """Traite les requêtes d'une connexion, une par ligne."""
+
+    def handle(self) -> None:
+        server: EvalServer = self.server  # type: ignore
+        for line in self.rfile:
+            server.touch()
+            try:
+                message: Dict[str, Any] = json.loads(line)
+                reply: Dict[str, Any] = server.dispatch(message)
+            except Exception as e:
+                reply = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class EvalServer(socketserver.ThreadingUnixStreamServer):
+        """Serveur d'évaluation : SymPy chargé une fois, cache de compilation partagé."""
+
+        daemon_threads: bool = True
+
+        def __init__(self, path: str) -> None:
+            self.cache: CompiledCache = CompiledCache()
+            self.started: float = time.time()
+            self.last_request: float = self.started
+            self.evaluations: int = 0
+            super().__init__(path, EvalRequestHandler)
+
+        def touch(self) -> None:
+            self.last_request = time.time()
+
+        def dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Exécute une requête.
+
+            Args:
+                message: Requête ('ping', 'evaluate' ou 'shutdown')
+
+            Returns:
+                Réponse JSON
+            """
+            op: str = message.get('op', '')
+            if op == 'ping':
+                return {
+                    'ok': True, 'pid': os.getpid(), 'uptime': time.time() - self.started,
+                    'evaluations': self.evaluations, 'cached': len(self.cache.entries),
+                    'cache_hits': self.cache.hits, 'cache_misses': self.cache.misses,
+                }
+            if op == 'evaluate':
+                evaluate_job(message, self.cache.get)
+                self.evaluations += 1
+                return {'ok': True}
+            if op == 'shutdown':
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return {'ok': True}
+            return {'ok': False, 'error': f"opération inconnue: {op}"}
+
+
+def serve(path: Optional[str] = None, idle_timeout: float = 0.0) -> None:
+    """
+    Lance le serveur jusqu'à 'shutdown' ou inactivité prolongée.
+
+    Args:
+        path: Chemin du socket (défaut: default_socket_path())
+        idle_timeout: Arrêt après ce nombre de secondes sans requête (0: jamais)
+    """
+    path = path or default_socket_path()
+    if os.path.exists(path):
+        if EvalServerClient(path).ping() is not None:
+            print(f"Serveur déjà actif sur {path}")
+            return
+        os.unlink(path)  # Socket orphelin d'un serveur arrêté
+
+    import sympy  # noqa: F401  Chargé une fois pour toutes les sessions
+
+    server = EvalServer(path)
+    os.chmod(path, 0o600)
+
+    if idle_timeout > 0:
+        def watchdog() -> None:
+            while True:
+                time.sleep(min(idle_timeout, 5.0))
+                if time.time() - server.last_request > idle_timeout:
+                    server.shutdown()
+                    return
+        threading.Thread(target=watchdog, daemon=True).start()
+
+    print(f"✅ Serveur d'évaluation prêt sur {path}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def start_server(path: Optional[str] = None, idle_timeout: float = 0.0) -> None:
+    """
+    Démarre le serveur en arrière-plan, détaché du processus courant.
+
+    Args:
+        path: Chemin du socket
+        idle_timeout: Arrêt après inactivité (secondes, 0: jamais)
+    """
+    import subprocess
+
+    command: List[str] = [sys.executable, os.path.abspath(__file__),
+                          '--idle-timeout', str(idle_timeout)]
+    if path:
+        command += ['--socket', path]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, env=env, start_new_session=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serveur d'évaluation Courbes du Plan")
+    parser.add_argument('--socket', default=None, help="Chemin du socket Unix")
+    parser.add_argument('--idle-timeout', type=float, default=0.0,
+                        help="Arrêt après N secondes sans requête (0: jamais)")
+    arguments = parser.parse_args()
+    serve(arguments.socket, arguments.idle_timeout)
@@ -0,0 +1,539 @@
+# ===============================================
+# FICHIER: exchange.py (Échange de points : export NPY / CSV / SVG, import NPY / CSV)
+# ===============================================
+#
+# L'export rejoue la génération sans créer de datablock : chaque spline
+# évaluée est écrite sur disque dès sa production, puis oubliée.
+#
+# Formats (plusieurs splines séparées par une ligne de NaN en NPY et CSV) :
+#   NPY  tableau (N, 3) float64, une écriture tofile par spline
+#   CSV  colonnes x,y,z, écrites par blocs de CSV_CHUNK_ROWS lignes
+#   SVG  un chemin par spline (M x,y L x,y ...), axe y vers le haut
+#
+# L'import lit les mêmes formats NPY et CSV (2 ou 3 colonnes, splines
+# séparées par des lignes non finies ou vides) : .npy projeté en mémoire,
+# CSV lu par blocs, chaque spline envoyée telle quelle vers new_curve_data.
+#
+# API sans interface :
+#   from <addon>.exchange import export_curves
+#   export_curves("/tmp/courbe.npy", recipe={"curve_type": "EXPLICIT", ...})
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+if TYPE_CHECKING:
+    from bpy.types import Context, Object
+
+import os
+from abc import ABC, abstractmethod
+from itertools import islice
+
+import bpy
+import numpy as np
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, StringProperty
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+
+from .geometry import simplify_rdp
+from .operators import PLAN_CURVES_OT_generate_curve, SplineSource
+from .preferences import get_text
+from .recipes import Recipe, apply_recipe, snapshot_recipe
+
+# Type aliases
+OperatorReturn = Set[str]
+
+# Formats d'export et extensions associées
+EXPORT_FORMATS: Dict[str, str] = {'NPY': ".npy", 'CSV': ".csv", 'SVG': ".svg"}
+
+# Lignes formatées ensemble en CSV / points par bloc de données SVG
+CSV_CHUNK_ROWS: int = 65536
+SVG_CHUNK_POINTS: int = 65536
+
+# Taille réservée de l'en-tête NPY, réécrit à la fermeture avec la forme finale
+NPY_HEADER_SIZE: int = 128
+
+# Largeur réservée de l'attribut viewBox, rempli à la fermeture
+SVG_VIEWBOX_WIDTH: int = 80
+
+# Lignes examinées ensemble pour trouver les séparateurs d'un .npy projeté
+NPY_SCAN_ROWS: int = 1 << 20
+
+# Propriété personnalisée des objets importés : fichier d'origine
+SOURCE_KEY: str = "plan_curves_source"
+
+
+def npy_header(rows: int, columns: int = 3) -> bytes:
+    """
+    En-tête NPY 1.0 d'un tableau float64 (rows, columns), de taille fixe.
+
+    Args:
+        rows: Nombre de lignes
+        columns: Nombre de colonnes
+
+    Returns:
+        En-tête de NPY_HEADER_SIZE octets
+    """
+    header: str = f"{{'descr': '<f8', 'fortran_order': False, 'shape': ({rows}, {columns}), }}"
+    header = header.ljust(NPY_HEADER_SIZE - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, 'little') + header.encode('latin1')
+
+
+class SplineWriter(ABC):
+    """Écrit des splines à mesure de leur production ; mémoire constante."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: Fichier de sortie (créé ou remplacé)
+        """
+        self.path: str = path
+        self.stream: BinaryIO = open(path, 'wb')
+        self.splines: int = 0
+        self.points: int = 0
+
+    @abstractmethod
+    def write(self, points: np.ndarray, cyclic: bool) -> None:
+        """
+        Écrit une spline.
+
+        Args:
+            points: Points (N, 3)
+            cyclic: Spline fermée
+        """
+
+    def close(self) -> None:
+        """Termine le fichier."""
+        self.stream.close()
+
+    def discard(self) -> None:
+        """Ferme et supprime un fichier incomplet."""
+        self.stream.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class NpyWriter(SplineWriter):
+    """Tableau NPY (N, 3) float64 ; les splines sont séparées par une ligne de NaN."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.rows: int = 0
+        self.stream.write(npy_header(0))
+
+    def write(self, points: np.ndarray, cyclic: bool) -> None:
+        if self.splines:
+            np.full(3, np.nan).tofile(self.stream)
+            self.rows += 1
+        # Sans copie pour les tampons float64 contigus de la génération
+        np.ascontiguousarray(points, dtype='<f8').tofile(self.stream)
+        self.rows += len(points)
+        if cyclic:
+            np.asarray(points[0], dtype='<f8').tofile(self.stream)
+            self.rows += 1
+        self.splines += 1
+        self.points += len(points)
+
+    def close(self) -> None:
+        self.stream.seek(0)
+        self.stream.write(npy_header(self.rows))
+        super().close()
+
+
+class CsvWriter(SplineWriter):
+    """Colonnes x,y,z ; les splines sont séparées par une ligne nan,nan,nan."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.stream.write(b"x,y,z\n")
+
+    def write(self, points: np.ndarray, cyclic: bool) -> None:
+        if self.splines:
+            self.stream.write(b"nan,nan,nan\n")
+        for begin in range(0, len(points), CSV_CHUNK_ROWS):
+            self.write_rows(points[begin:begin + CSV_CHUNK_ROWS])
+        if cyclic:
+            self.write_rows(points[:1])
+        self.splines += 1
+        self.points += len(points)
+
+    def write_rows(self, rows: np.ndarray) -> None:
+        """Formate un bloc de lignes en une seule opération."""
+        self.stream.write((("%.9g,%.9g,%.9g\n" * len(rows)) % tuple(rows.ravel())).encode('ascii'))
+
+
+class SvgWriter(SplineWriter):
+    """Un chemin SVG par spline, dans un groupe retourné pour garder y vers le haut."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.bounds: Optional[np.ndarray] = None
+        self.stream.write(b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="')
+        self.viewbox_offset: int = self.stream.tell()
+        self.stream.write(b" " * SVG_VIEWBOX_WIDTH + b'">\n')
+        self.stream.write(b'<g transform="scale(1,-1)" fill="none" stroke="black">\n')
+
+    def write(self, points: np.ndarray, cyclic: bool) -> None:
+        if len(points) < 2:
+            return  # Un chemin d'un seul point ne trace rien (et « L » sans point est invalide)
+        xy: np.ndarray = points[:, :2]
+        low, high = xy.min(axis=0), xy.max(axis=0)
+        self.bounds = (np.stack((low, high)) if self.bounds is None else
+                       np.stack((np.minimum(self.bounds[0], low), np.maximum(self.bounds[1], high))))
+
+        self.stream.write(b'<path vector-effect="non-scaling-stroke" d="M')
+        for begin in range(0, len(xy), SVG_CHUNK_POINTS):
+            chunk: np.ndarray = xy[begin:begin + SVG_CHUNK_POINTS]
+            if begin == 0:
+                self.stream.write(b"%.6g,%.6g L" % tuple(chunk[0]))
+                chunk = chunk[1:]
+            self.stream.write(((" %.6g,%.6g" * len(chunk)) % tuple(chunk.ravel())).encode('ascii'))
+        self.stream.write(b' Z"/>\n' if cyclic else b'"/>\n')
+        self.splines += 1
+        self.points += len(points)
+
+    def close(self) -> None:
+        self.stream.write(b"</g>\n</svg>\n")
+        if self.bounds is not None:
+            (x_min, y_min), (x_max, y_max) = self.bounds
+            margin: float = 0.02 * max(x_max - x_min, y_max - y_min, 1e-9)
+            viewbox: str = "%.9g %.9g %.9g %.9g" % (
+                x_min - margin, -y_max - margin, x_max - x_min + 2 * margin, y_max - y_min + 2 * margin
+            )
+            self.stream.seek(self.viewbox_offset)
+            self.stream.write(viewbox.ljust(SVG_VIEWBOX_WIDTH).encode('ascii'))
+        super().close()
+
+
+WRITERS: Dict[str, Type[SplineWriter]] = {'NPY': NpyWriter, 'CSV': CsvWriter, 'SVG': SvgWriter}
+
+
+class ExportRecord(dict):
+    """Tient lieu d'objet pendant l'export : reçoit ses propriétés personnalisées."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name: str = name
+
+
+class PLAN_CURVES_OT_export_curves(PLAN_CURVES_OT_generate_curve, ExportHelper):
+    """Exporte les courbes évaluées sans les créer dans la scène."""
+
+    bl_idname: str = "plan_curves.export_curves"
+    bl_label: str = "Export Curves"
+    bl_description: str = "Évalue les courbes et écrit leurs points en NPY, CSV ou SVG"
+
+    filename_ext: str = ".npy"
+
+    file_format: EnumProperty(  # type: ignore
+        name="Format",
+        items=[
+            ('NPY', "NPY", "Tableau NumPy (N, 3), splines séparées par des NaN"),
+            ('CSV', "CSV", "Colonnes x,y,z, splines séparées par des NaN"),
+            ('SVG', "SVG", "Un chemin par spline"),
+        ],
+        default='NPY'
+    )
+
+    def check(self, context: Context) -> bool:
+        """Accorde l'extension du fichier au format choisi."""
+        self.filename_ext = EXPORT_FORMATS[self.file_format]
+        return super().check(context)
+
+    def execute(self, context: Context) -> OperatorReturn:
+        """
+        Rejoue la génération en écrivant chaque spline dans le fichier.
+
+        Args:
+            context: Contexte Blender
+
+        Returns:
+            Statut d'exécution
+        """
+        if context.scene.plan_curves_props.curve_type == 'SURFACE':
+            self.report({'ERROR'}, get_text('export_unsupported'))
+            return {'CANCELLED'}
+
+        path: str = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), EXPORT_FORMATS[self.file_format])
+        self.writer: SplineWriter = WRITERS[self.file_format](path)
+        try:
+            result: OperatorReturn = super().execute(context)
+        except BaseException:
+            self.writer.discard()
+            raise
+        if 'FINISHED' not in result:
+            self.writer.discard()
+            return result
+
+        self.writer.close()
+        print(f"💾 {self.writer.splines} spline(s), {self.writer.points} points → {path}")
+        self.report({'INFO'}, f"{get_text('export_done')}: {self.writer.points} points")
+        return {'FINISHED'}
+
+    def new_curve_data(self, name: str, splines: List[SplineSource], props) -> None:
+        """Écrit les splines évaluées au lieu de créer un datablock."""
+        for points, _, _, cyclic in splines:
+            self.writer.write(points, cyclic)
+
+    def link_curve_object(self, name: str, curve_data, context: Context,
+                          deselect: bool = True, tube: bool = True) -> ExportRecord:
+        """Aucun objet créé : renvoie un simple enregistrement."""
+        return ExportRecord(name)
+
+    def mark_animated(self, props) -> None:
+        """L'export fige les équations animées à l'image courante."""
+
+
+# ===============================================
+# IMPORT
+# ===============================================
+
+def separator_rows(block: np.ndarray) -> np.ndarray:
+    """Indices des lignes séparatrices (x ou y non fini) d'un bloc (N, ≥2)."""
+    return np.flatnonzero(~np.isfinite(block[:, :2]).all(axis=1))
+
+
+def npy_splines(path: str) -> Iterator[np.ndarray]:
+    """
+    Splines d'un .npy projeté en mémoire, rendues comme vues sans copie.
+
+    Args:
+        path: Fichier .npy (N, 2) ou (N, 3)
+
+    Yields:
+        Points (n, 2) ou (n, 3) de chaque spline, vues du fichier projeté
+
+    Raises:
+        ValueError: Si le tableau n'a pas 2 ou 3 colonnes
+    """
+    data: np.ndarray = np.load(path, mmap_mode='r')
+    if data.ndim != 2 or data.shape[1] not in (2, 3):
+        raise ValueError(f"tableau (N, 2) ou (N, 3) attendu, reçu {data.shape}")
+
+    start: int = 0
+    for begin in range(0, len(data), NPY_SCAN_ROWS):
+        for row in separator_rows(data[begin:begin + NPY_SCAN_ROWS]) + begin:
+            if row > start:
+                yield data[start:row]
+            start = row + 1
+    if len(data) > start:
+        yield data[start:]
+
+
+def _joined(pieces: List[np.ndarray]) -> Iterator[np.ndarray]:
+    """Réunit les morceaux d'une spline coupée par les blocs de lecture."""
+    if sum(len(piece) for piece in pieces):
+        yield pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+
+
+def csv_splines(path: str) -> Iterator[np.ndarray]:
+    """
+    Splines d'un CSV lu par blocs de CSV_CHUNK_ROWS lignes.
+
+    Une première ligne non numérique est prise pour un en-tête ; les lignes
+    vides séparent les splines comme les lignes de NaN.
+
+    Args:
+        path: Fichier CSV à 2 ou 3 colonnes (séparateur virgule ou espaces)
+
+    Yields:
+        Points (n, 2) ou (n, 3) de chaque spline
+    """
+    pieces: List[np.ndarray] = []
+    with open(path, 'r', encoding='utf-8') as f:
+        first: str = f.readline()
+        delimiter: Optional[str] = ',' if ',' in first else None
+        gap: str = (delimiter or " ").join(["nan"] * len(first.split(delimiter))) + "\n"
+        try:
+            [float(value) for value in first.split(delimiter)]
+            lines: List[str] = [first]
+        except ValueError:
+            lines = []  # En-tête
+
+        while True:
+            lines += islice(f, CSV_CHUNK_ROWS)
+            if not lines:
+                break
+            block: np.ndarray = np.loadtxt(
+                [line if line.strip() else gap for line in lines],
+                delimiter=delimiter, ndmin=2, dtype=np.float64,
+            )
+            lines = []
+
+            start: int = 0
+            for row in separator_rows(block):
+                pieces.append(block[start:row])
+                yield from _joined(pieces)
+                pieces = []
+                start = row + 1
+            pieces.append(block[start:])
+    yield from _joined(pieces)
+
+
+def spline_source(points: np.ndarray, tolerance: float = 0.0) -> Optional[Tuple[SplineSource, int]]:
+    """
+    Prépare une spline lue pour new_curve_data : fermeture, simplification, 3D.
+
+    La simplification a lieu avant la mise en 3D et la copie : seuls les
+    points conservés sont recopiés, dans un tableau propre à la spline
+    (la tranche lue, projetée ou en morceaux, peut être libérée aussitôt).
+
+    Args:
+        points: Points (n, 2) ou (n, 3)
+        tolerance: Écart maximal de la simplification (0: aucune)
+
+    Returns:
+        Tuple (spline (points (m, 3), ordonnée, tangentes, fermée), points
+        supprimés), ou None sous 2 points
+
+    Raises:
+        ValueError: Si les points ont moins de 2 colonnes
+    """
+    if points.shape[1] < 2:
+        raise ValueError(f"au moins 2 colonnes attendues, reçu {points.shape[1]}")
+    points = points[:, :3]
+    count: int = len(points)
+
+    # Une spline fermée répète son premier point (convention de l'export),
+    # gardé pendant la simplification pour ajuster le segment de fermeture
+    cyclic: bool = count > 3 and bool(np.array_equal(points[0], points[-1]))
+    keep: Optional[np.ndarray] = None
+    if tolerance > 0.0 and count >= 3:
+        keep = simplify_rdp(points, tolerance)
+    if cyclic:
+        count -= 1
+        points = points[:-1]
+        keep = keep[:-1] if keep is not None else None
+    kept: int = count if keep is None else int(np.count_nonzero(keep))
+    if kept < 2:
+        return None
+
+    result: np.ndarray = np.zeros((kept, 3))
+    result[:, :points.shape[1]] = points if keep is None else points[keep]
+    return (result, True, None, cyclic), count - kept
+
+
+class PLAN_CURVES_OT_import_points(PLAN_CURVES_OT_generate_curve, ImportHelper):
+    """Importe des polylignes échantillonnées (NPY, CSV) comme courbe."""
+
+    bl_idname: str = "plan_curves.import_points"
+    bl_label: str = "Import Points"
+    bl_description: str = "Crée une courbe à partir de points mesurés ou simulés (.npy, .csv)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filter_glob: StringProperty(default="*.npy;*.csv", options={'HIDDEN'})  # type: ignore
+
+    simplify: BoolProperty(  # type: ignore
+        name="Simplifier",
+        description="Simplifie chaque spline pendant la lecture (Ramer-Douglas-Peucker)",
+        default=False
+    )
+
+    simplify_tolerance: FloatProperty(  # type: ignore
+        name="Tolérance",
+        description="Écart maximal autorisé, en unités monde",
+        default=0.001,
+        min=0.0,
+        soft_max=1.0,
+        precision=4
+    )
+
+    def execute(self, context: Context) -> OperatorReturn:
+        """
+        Lit le fichier spline par spline et crée un seul objet courbe.
+
+        Args:
+            context: Contexte Blender
+
+        Returns:
+            Statut d'exécution
+        """
+        path: str = bpy.path.abspath(self.filepath)
+        reader = npy_splines if path.lower().endswith(".npy") else csv_splines
+        name: str = bpy.path.display_name_from_filepath(path)
+        props = context.scene.plan_curves_props
+
+        tolerance: float = self.simplify_tolerance if self.simplify else 0.0
+        splines: List[SplineSource] = []
+        removed: int = 0
+        # Hors génération : les tampons d'envoi ne sont pas retenus par la réserve
+        try:
+            for points in reader(path):
+                prepared: Optional[Tuple[SplineSource, int]] = spline_source(points, tolerance)
+                del points  # Tranche lue libérée avant la suivante
+                if prepared is not None:
+                    splines.append(prepared[0])
+                    removed += prepared[1]
+            if not splines:
+                self.report({'ERROR'}, get_text('not_enough_points'))
+                return {'CANCELLED'}
+            curve_data = self.new_curve_data(name, splines, props)
+            obj: Object = self.link_curve_object(name, curve_data, context)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"{get_text('import_failed')}: {e}")
+            return {'CANCELLED'}
+
+        count: int = sum(len(points) for points, _, _, _ in splines)
+        if removed:
+            print(f"✂️ {get_text('simplified')}: -{removed} points")
+        self.report({'INFO'}, f"{get_text('import_done')}: {obj.name} ({len(splines)} splines, {count} points)")
+        return {'FINISHED'}
+
+    def simplify_points(self, points: np.ndarray, props) -> np.ndarray:
+        """Points déjà simplifiés pendant la lecture (spline_source) : envoyés tels quels."""
+        return points
+
+    def stamp(self, obj: Object, context: Context) -> None:
+        """Aucune recette à régénérer : seul le fichier d'origine est noté."""
+        obj[SOURCE_KEY] = self.filepath
+
+
+def export_curves(path: str, recipe: Optional[Recipe] = None,
+                  file_format: Optional[str] = None) -> OperatorReturn:
+    """
+    Exporte les courbes d'une recette (ou des réglages de la scène) sans interface.
+
+    Les réglages de la scène sont rétablis après l'export d'une recette.
+
+    Args:
+        path: Fichier de sortie
+        recipe: Recette au schéma PresetData, appliquée le temps de l'export
+        file_format: 'NPY', 'CSV' ou 'SVG' (défaut: d'après l'extension)
+
+    Returns:
+        Statut de l'opérateur
+
+    Raises:
+        ValueError: Si le format est inconnu
+    """
+    if file_format is None:
+        extension: str = os.path.splitext(path)[1].lower()
+        file_format = next((key for key, ext in EXPORT_FORMATS.items() if ext == extension), None)
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"format d'export inconnu: {file_format or path}")
+
+    if recipe is None:
+        return bpy.ops.plan_curves.export_curves(filepath=os.path.abspath(path), file_format=file_format)
+
+    props = bpy.context.scene.plan_curves_props
+    scene_recipe: Recipe = snapshot_recipe(props)
+    try:
+        apply_recipe(props, recipe)
+        return bpy.ops.plan_curves.export_curves(filepath=os.path.abspath(path), file_format=file_format)
+    finally:
+        apply_recipe(props, scene_recipe)
+
+
+# Classes à enregistrer
+classes: Tuple[type, ...] = (
+    PLAN_CURVES_OT_export_curves,
+    PLAN_CURVES_OT_import_points,
+)
+
+def register() -> None:
+    """Enregistre les opérateurs d'export et d'import."""
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister() -> None:
+    """Désenregistre les opérateurs d'export et d'import."""
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
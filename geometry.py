@@ -0,0 +1,658 @@
+# ===============================================
+# FICHIER: geometry.py (Traitements géométriques NumPy des points échantillonnés)
+# ===============================================
+
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+
+def vertices_to_array(vertices) -> np.ndarray:
+    """
+    Convertit une liste de vertices en tableau NumPy (N, 3).
+
+    Args:
+        vertices: Liste de tuples (x, y, z) ou tableau existant
+
+    Returns:
+        Tableau float64 contigu de forme (N, 3)
+    """
+    points = np.ascontiguousarray(vertices, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 3:
+        points = points.reshape(-1, 3)
+    return points
+
+
+def point_segment_distances(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Distance de chaque point au segment [a, b] correspondant (vectorisé).
+
+    Args:
+        points: Points (N, 3)
+        a: Origines des segments (N, 3)
+        b: Extrémités des segments (N, 3)
+
+    Returns:
+        Distances (N,)
+    """
+    ab = b - a
+    ap = points - a
+    denom = np.einsum('ij,ij->i', ab, ab)
+    # Segments dégénérés (courbes fermées) : distance au point a
+    safe = np.where(denom > 0.0, denom, 1.0)
+    t = np.clip(np.einsum('ij,ij->i', ap, ab) / safe, 0.0, 1.0)
+    t[denom <= 0.0] = 0.0
+    proj = a + t[:, None] * ab
+    return np.linalg.norm(points - proj, axis=1)
+
+
+def simplify_rdp(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplifie une polyligne par Ramer–Douglas–Peucker.
+
+    Version itérative : à chaque passe, tous les segments ouverts sont
+    traités simultanément (distances, maximum par segment via reduceat),
+    sans récursion Python.
+
+    Args:
+        points: Points ordonnés (N, 3)
+        tolerance: Écart maximal autorisé, en unités monde
+
+    Returns:
+        Masque booléen (N,) des points conservés
+    """
+    n: int = len(points)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    if n < 3 or tolerance <= 0.0:
+        keep[:] = True
+        return keep
+
+    indices = np.arange(n)
+    while True:
+        kept = np.flatnonzero(keep)
+        left = np.maximum.accumulate(np.where(keep, indices, 0))
+        right = np.minimum.accumulate(np.where(keep, indices, n - 1)[::-1])[::-1]
+
+        dist = point_segment_distances(points, points[left], points[right])
+        dist[keep] = 0.0
+
+        # Maximum par segment [kept[k], kept[k+1])
+        seg_max = np.append(np.maximum.reduceat(dist, kept[:-1]), 0.0)
+        if not (seg_max > tolerance).any():
+            break
+
+        segment = np.cumsum(keep) - 1
+        candidates = np.flatnonzero((dist > tolerance) & (dist == seg_max[segment]))
+        _, first = np.unique(segment[candidates], return_index=True)
+        keep[candidates[first]] = True
+
+    return keep
+
+
+def simplify_polyline(points: np.ndarray, tolerance: float) -> Tuple[np.ndarray, int]:
+    """
+    Applique la simplification et retourne les points restants.
+
+    Args:
+        points: Points ordonnés (N, 3)
+        tolerance: Écart maximal autorisé, en unités monde
+
+    Returns:
+        Tuple (points simplifiés, nombre de points supprimés)
+    """
+    keep = simplify_rdp(points, tolerance)
+    simplified = points[keep]
+    return simplified, len(points) - len(simplified)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    Normalise chaque ligne d'un tableau de vecteurs (les vecteurs nuls restent nuls).
+
+    Args:
+        vectors: Vecteurs (N, 3)
+
+    Returns:
+        Vecteurs unitaires (N, 3)
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0.0)
+
+
+def estimate_tangents(points: np.ndarray) -> np.ndarray:
+    """
+    Estime les tangentes unitaires par différences centrées.
+
+    Args:
+        points: Points ordonnés (N, 3)
+
+    Returns:
+        Tangentes unitaires (N, 3)
+    """
+    if len(points) < 2:
+        return np.zeros_like(points)
+    return normalize_rows(np.gradient(points, axis=0))
+
+
+def _chord_parameters(points: np.ndarray) -> np.ndarray:
+    """Paramétrage initial par longueur de corde, normalisé sur [0, 1]."""
+    lengths = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    u = np.concatenate(([0.0], np.cumsum(lengths)))
+    if u[-1] <= 0.0:
+        return np.linspace(0.0, 1.0, len(points))
+    return u / u[-1]
+
+
+def _bernstein(u: np.ndarray) -> np.ndarray:
+    """Base de Bernstein cubique évaluée en u, forme (N, 4)."""
+    mt = 1.0 - u
+    return np.stack((mt * mt * mt, 3.0 * mt * mt * u, 3.0 * mt * u * u, u * u * u), axis=1)
+
+
+def _fit_segment(points: np.ndarray, t_start: np.ndarray, t_end: np.ndarray,
+                 u: np.ndarray) -> np.ndarray:
+    """
+    Ajuste un segment de Bézier cubique par moindres carrés à tangentes fixées.
+
+    Args:
+        points: Points du segment (N, 3)
+        t_start: Tangente unitaire au départ (sens de parcours)
+        t_end: Tangente unitaire à l'arrivée (sens inverse)
+        u: Paramètres des points sur [0, 1]
+
+    Returns:
+        Points de contrôle (4, 3)
+    """
+    p0, p3 = points[0], points[-1]
+    basis = _bernstein(u)
+    a1 = basis[:, 1:2] * t_start
+    a2 = basis[:, 2:3] * t_end
+
+    c00 = np.einsum('ij,ij->', a1, a1)
+    c01 = np.einsum('ij,ij->', a1, a2)
+    c11 = np.einsum('ij,ij->', a2, a2)
+    rest = (points
+            - (basis[:, 0:1] + basis[:, 1:2]) * p0
+            - (basis[:, 2:3] + basis[:, 3:4]) * p3)
+    x0 = np.einsum('ij,ij->', a1, rest)
+    x1 = np.einsum('ij,ij->', a2, rest)
+
+    chord: float = float(np.linalg.norm(p3 - p0))
+    det: float = c00 * c11 - c01 * c01
+    alpha1 = alpha2 = chord / 3.0
+    if abs(det) > 1e-12:
+        alpha1 = (x0 * c11 - x1 * c01) / det
+        alpha2 = (c00 * x1 - c01 * x0) / det
+    # Solution dégénérée : heuristique de Schneider
+    epsilon: float = 1e-6 * chord
+    if alpha1 < epsilon or alpha2 < epsilon:
+        alpha1 = alpha2 = chord / 3.0
+
+    return np.array((p0, p0 + alpha1 * t_start, p3 + alpha2 * t_end, p3))
+
+
+def _reparameterize(points: np.ndarray, control: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Une itération de Newton sur les paramètres u (projection sur la Bézier)."""
+    mt = 1.0 - u
+    basis = _bernstein(u)
+    q = basis @ control
+    d1 = 3.0 * np.diff(control, axis=0)
+    d2 = 2.0 * np.diff(d1, axis=0)
+    q1 = np.stack((mt * mt, 2.0 * mt * u, u * u), axis=1) @ d1
+    q2 = np.stack((mt, u), axis=1) @ d2
+
+    diff = q - points
+    numerator = np.einsum('ij,ij->i', diff, q1)
+    denominator = np.einsum('ij,ij->i', q1, q1) + np.einsum('ij,ij->i', diff, q2)
+    step = np.divide(numerator, denominator, out=np.zeros_like(u), where=denominator != 0.0)
+    return np.clip(u - step, 0.0, 1.0)
+
+
+def fit_cubic_bezier(points: np.ndarray, tolerance: float,
+                     tangents: np.ndarray | None = None,
+                     max_iterations: int = 4) -> np.ndarray:
+    """
+    Ajuste une suite de segments de Bézier cubiques sous une borne d'erreur.
+
+    Chaque segment est résolu par moindres carrés (tangentes fixées aux
+    extrémités) puis, si l'erreur reste trop grande, découpé au point
+    d'erreur maximale. Le découpage est itératif (pile explicite) et tous
+    les calculs par segment sont vectorisés.
+
+    Args:
+        points: Points ordonnés (N, 3)
+        tolerance: Distance maximale autorisée entre points et courbe
+        tangents: Tangentes analytiques (N, 3), estimées si absentes
+        max_iterations: Itérations de reparamétrage avant découpage
+
+    Returns:
+        Points de contrôle des segments, forme (S, 4, 3)
+    """
+    n: int = len(points)
+    if n < 2:
+        return np.empty((0, 4, 3))
+
+    if tangents is None:
+        tangents = estimate_tangents(points)
+    else:
+        tangents = normalize_rows(np.asarray(tangents, dtype=np.float64))
+        missing = ~np.isfinite(tangents).all(axis=1) | ~tangents.any(axis=1)
+        if missing.any():
+            tangents[missing] = estimate_tangents(points)[missing]
+
+    tolerance_sq: float = max(tolerance, 1e-12) ** 2
+    segments = []
+    stack = [(0, n - 1)]
+
+    while stack:
+        first, last = stack.pop()
+        pts = points[first:last + 1]
+
+        t_start = tangents[first]
+        t_end = -tangents[last]
+        if not t_start.any():
+            t_start = normalize_rows((pts[1] - pts[0])[None])[0]
+        if not t_end.any():
+            t_end = normalize_rows((pts[-2] - pts[-1])[None])[0]
+
+        if len(pts) == 2:
+            third = np.linalg.norm(pts[1] - pts[0]) / 3.0
+            segments.append(np.array((pts[0], pts[0] + third * t_start,
+                                      pts[1] + third * t_end, pts[1])))
+            continue
+
+        u = _chord_parameters(pts)
+        control = _fit_segment(pts, t_start, t_end, u)
+        residual = _bernstein(u) @ control - pts
+        errors = np.einsum('ij,ij->i', residual, residual)
+        split = int(np.argmax(errors))
+        max_error = float(errors[split])
+
+        # Proche de la tolérance : reparamétrage de Newton avant de découper
+        if tolerance_sq <= max_error < 4.0 * tolerance_sq:
+            for _ in range(max_iterations):
+                u = _reparameterize(pts, control, u)
+                control = _fit_segment(pts, t_start, t_end, u)
+                residual = _bernstein(u) @ control - pts
+                errors = np.einsum('ij,ij->i', residual, residual)
+                split = int(np.argmax(errors))
+                max_error = float(errors[split])
+                if max_error < tolerance_sq:
+                    break
+
+        if max_error < tolerance_sq:
+            segments.append(control)
+            continue
+
+        if split <= 0 or split >= len(pts) - 1:
+            split = len(pts) // 2
+        middle = first + split
+        # Pile LIFO : la moitié gauche est traitée en premier
+        stack.append((middle, last))
+        stack.append((first, middle))
+
+    return np.asarray(segments)
+
+
+def cumulative_arc_length(points: np.ndarray) -> np.ndarray:
+    """
+    Longueur d'arc cumulée le long d'une polyligne (cordes successives).
+
+    Les segments non finis comptent pour une longueur nulle. Les dimensions
+    de tête éventuelles (familles de courbes) sont traitées ligne à ligne.
+
+    Args:
+        points: Points ordonnés (..., N, D)
+
+    Returns:
+        Abscisses curvilignes (..., N), commençant à 0
+    """
+    lengths = np.linalg.norm(np.diff(points, axis=-2), axis=-1)
+    lengths[~np.isfinite(lengths)] = 0.0
+    zeros = np.zeros(lengths.shape[:-1] + (1,))
+    return np.concatenate((zeros, np.cumsum(lengths, axis=-1)), axis=-1)
+
+
+def cumulative_speed_integral(speed: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Intègre la vitesse |r'(t)| par la méthode des trapèzes (cumulée).
+
+    Args:
+        speed: Norme de la dérivée en chaque t (..., N)
+        t: Paramètres croissants (N,)
+
+    Returns:
+        Abscisses curvilignes (..., N), commençant à 0
+    """
+    speed = np.where(np.isfinite(speed), np.abs(speed), 0.0)
+    areas = 0.5 * (speed[..., 1:] + speed[..., :-1]) * np.diff(t)
+    zeros = np.zeros(areas.shape[:-1] + (1,))
+    return np.concatenate((zeros, np.cumsum(areas, axis=-1)), axis=-1)
+
+
+def arc_length_parameters(t: np.ndarray, cumulative: np.ndarray, count: int) -> np.ndarray:
+    """
+    Paramètres donnant exactement count points équidistants le long de la courbe.
+
+    Args:
+        t: Paramètres d'échantillonnage dense (M,)
+        cumulative: Abscisses curvilignes correspondantes (M,) ou (K, M)
+
+    Returns:
+        Paramètres (count,) ou (K, count) répartis uniformément en longueur d'arc
+    """
+    if cumulative.ndim > 1:
+        return np.stack([arc_length_parameters(t, row, count) for row in cumulative])
+
+    total: float = float(cumulative[-1])
+    if not np.isfinite(total) or total <= 0.0:
+        return np.linspace(t[0], t[-1], count)
+    return np.interp(np.linspace(0.0, total, count), cumulative, t)
+
+
+# Marching squares : coins 0=bas-gauche, 1=bas-droite, 2=haut-droite, 3=haut-gauche
+# et arêtes 0=bas, 1=droite, 2=haut, 3=gauche. Une ligne par cas (bits des coins
+# au-dessus du niveau), deux segments au plus, -1 si absent.
+_MS_SEGMENTS: np.ndarray = np.array([
+    [[-1, -1], [-1, -1]],  # 0
+    [[3, 0], [-1, -1]],    # 1
+    [[0, 1], [-1, -1]],    # 2
+    [[3, 1], [-1, -1]],    # 3
+    [[1, 2], [-1, -1]],    # 4
+    [[0, 1], [2, 3]],      # 5  (selle, centre au-dessus)
+    [[0, 2], [-1, -1]],    # 6
+    [[2, 3], [-1, -1]],    # 7
+    [[2, 3], [-1, -1]],    # 8
+    [[0, 2], [-1, -1]],    # 9
+    [[3, 0], [1, 2]],      # 10 (selle, centre au-dessus)
+    [[1, 2], [-1, -1]],    # 11
+    [[1, 3], [-1, -1]],    # 12
+    [[0, 1], [-1, -1]],    # 13
+    [[3, 0], [-1, -1]],    # 14
+    [[-1, -1], [-1, -1]],  # 15
+])
+
+# Selles dont le centre est sous le niveau : les coins hauts sont isolés
+_MS_SADDLES_LOW: np.ndarray = np.array([
+    [[3, 0], [1, 2]],      # 5
+    [[0, 1], [2, 3]],      # 10
+])
+
+
+def _edge_crossings(x: np.ndarray, y: np.ndarray, Z: np.ndarray, level: float,
+                    edge_ids: np.ndarray) -> np.ndarray:
+    """
+    Points de passage du niveau sur les arêtes de grille demandées.
+
+    Les arêtes horizontales sont numérotées en premier (ny * (nx - 1)),
+    puis les verticales ((ny - 1) * nx).
+
+    Args:
+        x: Abscisses de la grille (nx,)
+        y: Ordonnées de la grille (ny,)
+        Z: Valeurs F(x, y) de forme (ny, nx)
+        level: Valeur de la ligne de niveau
+        edge_ids: Identifiants d'arêtes (K,)
+
+    Returns:
+        Points (K, 2) interpolés linéairement sur chaque arête
+    """
+    nx: int = Z.shape[1]
+    horizontal: int = Z.shape[0] * (nx - 1)
+    is_vertical = edge_ids >= horizontal
+
+    local = np.where(is_vertical, edge_ids - horizontal, edge_ids)
+    width = np.where(is_vertical, nx, nx - 1)
+    row, col = local // width, local % width
+    row_end = row + is_vertical
+    col_end = col + ~is_vertical
+
+    z0, z1 = Z[row, col], Z[row_end, col_end]
+    t = (level - z0) / (z1 - z0)
+    return np.column_stack((
+        x[col] + t * (x[col_end] - x[col]),
+        y[row] + t * (y[row_end] - y[row]),
+    ))
+
+
+def marching_squares(Z: np.ndarray, level: float) -> np.ndarray:
+    """
+    Segments de la ligne de niveau, exprimés en identifiants d'arêtes de grille.
+
+    Toutes les cellules sont classées en une passe vectorisée ; les cellules
+    contenant une valeur non finie sont ignorées.
+
+    Args:
+        Z: Valeurs F(x, y) de forme (ny, nx)
+        level: Valeur de la ligne de niveau
+
+    Returns:
+        Segments (S, 2) d'identifiants d'arêtes (voir _edge_crossings)
+    """
+    ny, nx = Z.shape
+    above = Z > level
+    finite = np.isfinite(Z)
+
+    bl, br, tr, tl = above[:-1, :-1], above[:-1, 1:], above[1:, 1:], above[1:, :-1]
+    case = (bl.astype(np.intp) | (br << 1) | (tr << 2) | (tl << 3))
+    valid = finite[:-1, :-1] & finite[:-1, 1:] & finite[1:, 1:] & finite[1:, :-1]
+
+    rows, cols = np.nonzero(valid & (case != 0) & (case != 15))
+    case = case[rows, cols]
+    if len(case) == 0:
+        return np.empty((0, 2), dtype=np.intp)
+
+    # Identifiants globaux des arêtes bas, droite, haut, gauche de chaque cellule
+    horizontal: int = ny * (nx - 1)
+    edges = np.stack((
+        rows * (nx - 1) + cols,
+        horizontal + rows * nx + cols + 1,
+        (rows + 1) * (nx - 1) + cols,
+        horizontal + rows * nx + cols,
+    ), axis=1)
+
+    table = _MS_SEGMENTS[case].copy()
+    saddle = (case == 5) | (case == 10)
+    if saddle.any():
+        center = 0.25 * (Z[rows, cols] + Z[rows, cols + 1] + Z[rows + 1, cols + 1] + Z[rows + 1, cols])
+        low = saddle & (center <= level)
+        table[low] = _MS_SADDLES_LOW[(case[low] == 10).astype(np.intp)]
+
+    cell_index = np.arange(len(case))
+    first = edges[cell_index[:, None], table[:, 0]]
+    has_second = table[:, 1, 0] >= 0
+    second = edges[cell_index[has_second, None], table[has_second, 1]]
+    return np.concatenate((first, second))
+
+
+def chain_segments(segments: np.ndarray) -> list:
+    """
+    Relie des segments partageant une extrémité en polylignes ordonnées.
+
+    Args:
+        segments: Segments (S, 2) d'identifiants d'extrémités
+
+    Returns:
+        Liste de tuples (identifiants ordonnés, fermée)
+    """
+    count: int = len(segments)
+    if count == 0:
+        return []
+
+    ends = segments.ravel()
+    order = np.argsort(ends, kind='stable')
+    shared = np.flatnonzero(ends[order][1:] == ends[order][:-1])
+    partner = np.full(2 * count, -1, dtype=np.intp)
+    partner[order[shared]] = order[shared + 1]
+    partner[order[shared + 1]] = order[shared]
+
+    ends_list = ends.tolist()
+    partner_list = partner.tolist()
+    visited = [False] * count
+
+    def walk(slot: int) -> list:
+        ids = [ends_list[slot]]
+        while True:
+            visited[slot >> 1] = True
+            out = slot ^ 1
+            ids.append(ends_list[out])
+            following = partner_list[out]
+            if following < 0 or visited[following >> 1]:
+                return ids
+            slot = following
+
+    chains = []
+    # Chaînes ouvertes : départ aux extrémités libres
+    for slot in np.flatnonzero(partner < 0).tolist():
+        if not visited[slot >> 1]:
+            chains.append((walk(slot), False))
+    # Le reste forme des boucles fermées
+    for segment in range(count):
+        if not visited[segment]:
+            ids = walk(2 * segment)
+            chains.append((ids[:-1], True))
+    return chains
+
+
+def contour_polylines(x: np.ndarray, y: np.ndarray, Z: np.ndarray, level: float) -> list:
+    """
+    Extrait les polylignes de la ligne de niveau F(x, y) = level.
+
+    Args:
+        x: Abscisses de la grille (nx,)
+        y: Ordonnées de la grille (ny,)
+        Z: Valeurs F(x, y) de forme (ny, nx), évaluées une seule fois
+        level: Valeur de la ligne de niveau
+
+    Returns:
+        Liste de tuples (points (K, 2), fermée)
+    """
+    segments = marching_squares(Z, level)
+    if len(segments) == 0:
+        return []
+
+    # Interpolation limitée aux arêtes effectivement traversées
+    used, inverse = np.unique(segments, return_inverse=True)
+    crossings = _edge_crossings(x, y, Z, level, used)
+    local = inverse.reshape(segments.shape)
+    return [(crossings[np.asarray(ids)], closed)
+            for ids, closed in chain_segments(local)
+            if len(ids) >= 2]
+
+
+def newton_project(points: np.ndarray, func, gradient, level: float = 0.0,
+                   steps: int = 3, max_step: float = np.inf) -> Tuple[np.ndarray, float, float]:
+    """
+    Projette des points sur la ligne de niveau F(x, y) = level par Newton.
+
+    Chaque itération applique p <- p - (F(p) - level) * ∇F / |∇F|² à tous
+    les points à la fois. Le déplacement est borné par max_step (typiquement
+    le pas de grille) et les points à gradient nul restent en place.
+
+    Args:
+        points: Points (N, 2) proches de la courbe
+        func: F(x, y) vectorisée
+        gradient: Fonction (x, y) -> (∂F/∂x, ∂F/∂y) vectorisée
+        level: Valeur de la ligne de niveau
+        steps: Nombre maximal d'itérations
+        max_step: Déplacement maximal par itération
+
+    Returns:
+        Tuple (points projetés, |F - level| max avant, |F - level| max après)
+    """
+    projected = np.array(points, dtype=np.float64, copy=True)
+    x, y = projected[:, 0], projected[:, 1]
+
+    residual = func(x, y) - level
+    initial: float = float(np.nanmax(np.abs(residual))) if len(residual) else 0.0
+
+    for _ in range(steps):
+        gx, gy = gradient(x, y)
+        norm_sq = gx * gx + gy * gy
+        usable = np.isfinite(residual) & np.isfinite(norm_sq) & (norm_sq > 1e-24)
+        scale = np.divide(residual, norm_sq, out=np.zeros_like(residual), where=usable)
+        dx, dy = scale * gx, scale * gy
+
+        length = np.hypot(dx, dy)
+        clamp = np.divide(max_step, length, out=np.ones_like(length), where=length > max_step)
+        x -= np.where(usable, dx * clamp, 0.0)
+        y -= np.where(usable, dy * clamp, 0.0)
+
+        residual = func(x, y) - level
+        if not np.any(np.abs(residual) > 1e-12):
+            break
+
+    final: float = float(np.nanmax(np.abs(residual))) if len(residual) else 0.0
+    return projected, initial, final
+
+
+def surface_mesh(x: np.ndarray, y: np.ndarray, Z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Construit les tableaux d'un maillage de quads z = f(x, y) sur une grille.
+
+    Un quad n'est gardé que si ses quatre sommets sont finis : les
+    échantillons non finis deviennent des trous. Seuls les sommets utilisés
+    par un quad sont émis, renumérotés par somme cumulée.
+
+    Args:
+        x: Abscisses de la grille (nx,)
+        y: Ordonnées de la grille (ny,)
+        Z: Valeurs f(x, y) de forme (ny, nx)
+
+    Returns:
+        Tuple (sommets (V, 3) float32, indices des coins (F, 4) int32,
+        dans le sens trigonométrique vu de +z)
+    """
+    ny, nx = Z.shape
+    valid: np.ndarray = np.isfinite(Z)
+    quads: np.ndarray = valid[:-1, :-1] & valid[:-1, 1:] & valid[1:, 1:] & valid[1:, :-1]
+
+    used: np.ndarray = np.zeros_like(valid)
+    used[:-1, :-1] |= quads
+    used[:-1, 1:] |= quads
+    used[1:, 1:] |= quads
+    used[1:, :-1] |= quads
+
+    rows, cols = np.nonzero(used)
+    vertices: np.ndarray = np.empty((len(rows), 3), dtype=np.float32)
+    vertices[:, 0] = x[cols]
+    vertices[:, 1] = y[rows]
+    vertices[:, 2] = Z[rows, cols]
+
+    remap: np.ndarray = np.cumsum(used.ravel(), dtype=np.int32) - 1
+    rows, cols = np.nonzero(quads)
+    base: np.ndarray = (rows * nx + cols).astype(np.int32)
+    corners: np.ndarray = np.stack((base, base + 1, base + nx + 1, base + nx), axis=1)
+    return vertices, remap[corners]
+
+
+def polyline_edges(lengths: np.ndarray, cyclic: np.ndarray) -> np.ndarray:
+    """
+    Indices des arêtes de polylignes mises bout à bout dans un seul tableau.
+
+    Args:
+        lengths: Nombre de points de chaque polyligne (P,)
+        cyclic: Polylignes fermées (P,) ; une arête relie alors le dernier point au premier
+
+    Returns:
+        Arêtes (E, 2) int32
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    starts: np.ndarray = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    total: int = int(lengths.sum())
+
+    # Arêtes consécutives, sauf celles qui enjamberaient deux polylignes
+    inner: np.ndarray = np.ones(max(total - 1, 0), dtype=bool)
+    inner[starts[1:] - 1] = False
+    first: np.ndarray = np.nonzero(inner)[0]
+
+    closing: np.ndarray = np.asarray(cyclic, dtype=bool) & (lengths > 2)
+    edges: np.ndarray = np.concatenate((
+        np.stack((first, first + 1), axis=1),
+        np.stack((starts[closing] + lengths[closing] - 1, starts[closing]), axis=1),
+    ))
+    return edges.astype(np.int32)
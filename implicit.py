@@ -0,0 +1,524 @@
+# ===============================================
+# FICHIER: implicit.py (Suivi de courbes implicites F(x,y) = 0)
+# ===============================================
+
+from __future__ import annotations
+from typing import Callable, List, Optional, Tuple
+
+import math
+import numpy as np
+
+# Type aliases
+Polyline = Tuple[np.ndarray, bool]  # (points (K, 2), fermée)
+Bounds = Tuple[float, float, float, float]  # (x_min, x_max, y_min, y_max)
+
+# Itérations de Newton maximales par correction
+CORRECTOR_ITERATIONS: int = 6
+
+# Sécurité : nombre maximal de points par branche
+MAX_BRANCH_POINTS: int = 200000
+
+
+def scan_seeds(func: Callable, x_vals: np.ndarray, y_vals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recherche des points de départ par changement de signe sur une grille grossière.
+
+    Args:
+        func: F(x, y) vectorisée
+        x_vals: Abscisses de la grille grossière (nx,)
+        y_vals: Ordonnées de la grille grossière (ny,)
+
+    Returns:
+        Tuple (graines (K, 2), cellules (K, 2) en indices (ligne, colonne))
+    """
+    X, Y = np.meshgrid(x_vals, y_vals)
+    Z = np.broadcast_to(np.asarray(func(X, Y), dtype=np.float64), X.shape)
+    sign = np.sign(Z)
+    finite = np.isfinite(Z)
+
+    seeds = []
+    cells = []
+    # Arêtes horizontales puis verticales
+    for axis in (1, 0):
+        a = [slice(None), slice(None)]
+        b = [slice(None), slice(None)]
+        a[axis], b[axis] = slice(None, -1), slice(1, None)
+        a, b = tuple(a), tuple(b)
+
+        rows, cols = np.nonzero((sign[a] != sign[b]) & finite[a] & finite[b])
+        z0, z1 = np.abs(Z[a][rows, cols]), np.abs(Z[b][rows, cols])
+        t = z0 / (z0 + z1)
+        r1, c1 = rows + (axis == 0), cols + (axis == 1)
+        seeds.append(np.column_stack((
+            X[rows, cols] * (1 - t) + X[r1, c1] * t,
+            Y[rows, cols] * (1 - t) + Y[r1, c1] * t,
+        )))
+        cells.append(np.column_stack((
+            np.minimum(rows, len(y_vals) - 2), np.minimum(cols, len(x_vals) - 2)
+        )))
+
+    return np.concatenate(seeds), np.concatenate(cells)
+
+
+class ImplicitCurveTracer:
+    """
+    Suivi prédicteur–correcteur d'une courbe implicite F(x, y) = 0.
+
+    Le prédicteur avance le long de la tangente (orthogonale au gradient),
+    le correcteur projette sur la courbe par Newton. Le pas s'adapte :
+    il diminue quand la correction échoue ou que la tangente tourne trop,
+    et augmente après chaque succès. Le coût est proportionnel à la
+    longueur de la courbe, pas à l'aire du domaine.
+    """
+
+    def __init__(self, func: Callable, gradient: Callable, bounds: Bounds,
+                 max_step: float, tolerance: float = 1e-9) -> None:
+        """
+        Initialise le traceur.
+
+        Args:
+            func: F(x, y) scalaire
+            gradient: (x, y) -> (∂F/∂x, ∂F/∂y) scalaire
+            bounds: Domaine (x_min, x_max, y_min, y_max)
+            max_step: Pas maximal le long de la courbe
+            tolerance: Résidu |F| accepté par le correcteur
+        """
+        self.func: Callable = func
+        self.gradient: Callable = gradient
+        self.bounds: Bounds = bounds
+        self.max_step: float = max_step
+        self.min_step: float = max_step * 1e-3
+        self.tolerance: float = tolerance
+        self.evaluations: int = 0
+        self.branch_points: List[Tuple[float, float]] = []
+
+    def _f(self, x: float, y: float) -> float:
+        self.evaluations += 1
+        return float(self.func(x, y))
+
+    def _grad(self, x: float, y: float) -> Tuple[float, float]:
+        self.evaluations += 1
+        gx, gy = self.gradient(x, y)
+        return float(gx), float(gy)
+
+    def _inside(self, x: float, y: float) -> bool:
+        x_min, x_max, y_min, y_max = self.bounds
+        return x_min <= x <= x_max and y_min <= y <= y_max
+
+    def correct(self, x: float, y: float, max_shift: float) -> Optional[Tuple[float, float]]:
+        """
+        Projette un point sur la courbe par itérations de Newton.
+
+        Args:
+            x: Abscisse prédite
+            y: Ordonnée prédite
+            max_shift: Déplacement total autorisé
+
+        Returns:
+            Point corrigé, ou None en cas d'échec
+        """
+        x0, y0 = x, y
+        for _ in range(CORRECTOR_ITERATIONS):
+            value = self._f(x, y)
+            if not math.isfinite(value):
+                return None
+            if abs(value) <= self.tolerance:
+                return x, y
+            gx, gy = self._grad(x, y)
+            norm_sq = gx * gx + gy * gy
+            if not math.isfinite(norm_sq) or norm_sq < 1e-24:
+                return None
+            x -= value * gx / norm_sq
+            y -= value * gy / norm_sq
+            if math.hypot(x - x0, y - y0) > max_shift:
+                return None
+        return (x, y) if abs(self._f(x, y)) <= self.tolerance * 1e3 else None
+
+    def _record_branch_point(self, x: float, y: float) -> None:
+        for bx, by in self.branch_points:
+            if math.hypot(x - bx, y - by) < self.max_step:
+                return
+        self.branch_points.append((x, y))
+
+    def _tangent(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        gx, gy = self._grad(x, y)
+        norm = math.hypot(gx, gy)
+        if not math.isfinite(norm) or norm < 1e-12:
+            return None
+        return -gy / norm, gx / norm
+
+    def trace_branch(self, x: float, y: float, direction: float,
+                     start: Tuple[float, float]) -> Tuple[List[Tuple[float, float]], bool]:
+        """
+        Suit la courbe depuis un point dans un sens donné.
+
+        Args:
+            x: Abscisse du point de départ (sur la courbe)
+            y: Ordonnée du point de départ
+            direction: +1 ou -1 le long de la tangente
+            start: Point d'origine, pour détecter le retour (boucle fermée)
+
+        Returns:
+            Tuple (points suivis, boucle fermée)
+        """
+        points: List[Tuple[float, float]] = []
+        tangent = self._tangent(x, y)
+        if tangent is None:
+            self._record_branch_point(x, y)
+            return points, False
+        raw_x, raw_y = tangent
+        tx, ty = raw_x * direction, raw_y * direction
+        step = self.max_step
+        travelled = 0.0
+
+        while len(points) < MAX_BRANCH_POINTS:
+            corrected = self.correct(x + step * tx, y + step * ty, 0.5 * step)
+            new_tangent = self._tangent(*corrected) if corrected is not None else None
+
+            flipped = False
+            if new_tangent is not None:
+                # Orientation cohérente et limite de courbure par pas
+                nx_, ny_ = new_tangent
+                flipped = nx_ * raw_x + ny_ * raw_y < 0.0
+                if nx_ * tx + ny_ * ty < 0.0:
+                    nx_, ny_ = -nx_, -ny_
+                if nx_ * tx + ny_ * ty < 0.95:
+                    new_tangent = None
+
+            if new_tangent is None:
+                step *= 0.5
+                if step < self.min_step:
+                    # Gradient nul ou tangente instable : point de branchement
+                    self._record_branch_point(x, y)
+                    return points, False
+                continue
+
+            if flipped:
+                # Le gradient s'inverse : une autre branche croise ici
+                self._record_branch_point(0.5 * (x + corrected[0]), 0.5 * (y + corrected[1]))
+
+            x, y = corrected
+            tx, ty = nx_, ny_
+            raw_x, raw_y = new_tangent
+            travelled += step
+
+            if not self._inside(x, y):
+                return points, False
+
+            if travelled > 2.0 * step and math.hypot(x - start[0], y - start[1]) < step:
+                return points, True
+
+            points.append((x, y))
+            step = min(step * 1.5, self.max_step)
+
+        return points, False
+
+    def trace(self, seeds: np.ndarray, cells: np.ndarray, cell_shape: Tuple[int, int],
+              cell_of: Callable) -> List[Polyline]:
+        """
+        Suit toutes les composantes atteintes depuis les graines.
+
+        Les cellules grossières traversées par une branche suivie sont
+        marquées ; les graines qui s'y trouvent sont ignorées.
+
+        Args:
+            seeds: Graines (K, 2)
+            cells: Cellules (K, 2) des graines
+            cell_shape: Taille (lignes, colonnes) de la grille grossière
+            cell_of: Fonction points (M, 2) -> indices (lignes, colonnes)
+
+        Returns:
+            Polylignes (points, fermée)
+        """
+        visited = np.zeros(cell_shape, dtype=bool)
+        polylines: List[Polyline] = []
+
+        for (sx, sy), (row, col) in zip(seeds.tolist(), cells.tolist()):
+            if visited[row, col]:
+                continue
+            start = self.correct(sx, sy, self.max_step)
+            if start is None:
+                visited[row, col] = True
+                continue
+
+            forward, closed = self.trace_branch(start[0], start[1], 1.0, start)
+            if closed:
+                branch = [start] + forward
+            else:
+                backward, _ = self.trace_branch(start[0], start[1], -1.0, start)
+                branch = backward[::-1] + [start] + forward
+
+            points = np.asarray(branch, dtype=np.float64)
+            rows, cols = cell_of(points)
+            # Marque les cellules traversées et leurs voisines
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    visited[np.clip(rows + dr, 0, cell_shape[0] - 1),
+                            np.clip(cols + dc, 0, cell_shape[1] - 1)] = True
+            visited[row, col] = True
+
+            if len(points) >= 2:
+                polylines.append((points, closed))
+
+        return polylines
+
+
+def trace_implicit_curve(func: Callable, gradient: Callable, bounds: Bounds,
+                         seed_resolution: int, max_step: float) -> Tuple[List[Polyline], ImplicitCurveTracer]:
+    """
+    Trace F(x, y) = 0 par continuation depuis un balayage grossier.
+
+    Args:
+        func: F(x, y) vectorisée (accepte tableaux et scalaires)
+        gradient: (x, y) -> (∂F/∂x, ∂F/∂y) vectorisée
+        bounds: Domaine (x_min, x_max, y_min, y_max)
+        seed_resolution: Taille de la grille grossière de recherche des graines
+        max_step: Pas maximal le long de la courbe
+
+    Returns:
+        Tuple (polylignes, traceur avec ses statistiques)
+    """
+    x_min, x_max, y_min, y_max = bounds
+    x_vals = np.linspace(x_min, x_max, seed_resolution)
+    y_vals = np.linspace(y_min, y_max, seed_resolution)
+    seeds, cells = scan_seeds(func, x_vals, y_vals)
+
+    tracer = ImplicitCurveTracer(func, gradient, bounds, max_step)
+    tracer.evaluations += seed_resolution * seed_resolution
+
+    shape = (seed_resolution - 1, seed_resolution - 1)
+    dx = (x_max - x_min) / (seed_resolution - 1)
+    dy = (y_max - y_min) / (seed_resolution - 1)
+
+    def cell_of(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cols = np.clip(((points[:, 0] - x_min) / dx).astype(np.intp), 0, shape[1] - 1)
+        rows = np.clip(((points[:, 1] - y_min) / dy).astype(np.intp), 0, shape[0] - 1)
+        return rows, cols
+
+    return tracer.trace(seeds, cells, shape, cell_of), tracer
+
+
+# ===============================================
+# ARITHMÉTIQUE D'INTERVALLES
+# ===============================================
+
+Interval = Tuple[np.ndarray, np.ndarray]  # (bornes inférieures, bornes supérieures)
+
+# Taille (en cellules) des tuiles feuilles de l'élagage
+CULLING_TILE: int = 16
+
+
+def _sanitize(lo: np.ndarray, hi: np.ndarray) -> Interval:
+    """Remplace les NaN (ex: 0 * inf) par des bornes conservatrices."""
+    return np.where(np.isnan(lo), -np.inf, lo), np.where(np.isnan(hi), np.inf, hi)
+
+
+def _interval_mul(a: Interval, b: Interval) -> Interval:
+    with np.errstate(invalid='ignore'):
+        products = np.stack((a[0] * b[0], a[0] * b[1], a[1] * b[0], a[1] * b[1]))
+    products = np.where(np.isnan(products), 0.0, products)
+    return products.min(axis=0), products.max(axis=0)
+
+
+def _interval_pow(base: Interval, exponent: float) -> Interval:
+    lo, hi = base
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        if float(exponent).is_integer():
+            n = int(exponent)
+            if n == 0:
+                return np.ones_like(lo), np.ones_like(hi)
+            if n > 0:
+                a, b = lo ** n, hi ** n
+                if n % 2:
+                    return a, b
+                straddles = (lo < 0.0) & (hi > 0.0)
+                return (np.where(straddles, 0.0, np.minimum(a, b)), np.maximum(a, b))
+            # Exposant négatif : 1 / x^|n|, non borné si l'intervalle contient 0
+            a, b = _interval_pow(base, -n)
+            contains_zero = (a <= 0.0) & (b >= 0.0)
+            inv_lo, inv_hi = 1.0 / b, 1.0 / a
+            return (np.where(contains_zero, -np.inf, inv_lo),
+                    np.where(contains_zero, np.inf, inv_hi))
+
+        # Exposant réel : défini pour une base positive, monotone
+        defined = hi >= 0.0
+        clipped_lo = np.maximum(lo, 0.0)
+        a, b = clipped_lo ** exponent, hi ** exponent
+        if exponent < 0:
+            a, b = b, np.where(clipped_lo > 0.0, a, np.inf)
+        return (np.where(defined, a, -np.inf), np.where(defined, b, np.inf))
+
+
+def _interval_sin(arg: Interval) -> Interval:
+    lo, hi = arg
+    two_pi = 2.0 * np.pi
+    with np.errstate(invalid='ignore'):
+        has_max = np.ceil((lo - np.pi / 2) / two_pi) <= np.floor((hi - np.pi / 2) / two_pi)
+        has_min = np.ceil((lo + np.pi / 2) / two_pi) <= np.floor((hi + np.pi / 2) / two_pi)
+    a, b = np.sin(lo), np.sin(hi)
+    wide = ~np.isfinite(lo) | ~np.isfinite(hi) | (hi - lo >= two_pi)
+    return (np.where(has_min | wide, -1.0, np.minimum(a, b)),
+            np.where(has_max | wide, 1.0, np.maximum(a, b)))
+
+
+def _interval_tan(arg: Interval) -> Interval:
+    lo, hi = arg
+    with np.errstate(invalid='ignore'):
+        has_pole = np.ceil((lo - np.pi / 2) / np.pi) <= np.floor((hi - np.pi / 2) / np.pi)
+    has_pole |= ~np.isfinite(lo) | ~np.isfinite(hi)
+    return (np.where(has_pole, -np.inf, np.tan(lo)), np.where(has_pole, np.inf, np.tan(hi)))
+
+
+def _interval_even(arg: Interval, func: Callable, minimum: float) -> Interval:
+    """Fonction paire décroissante puis croissante, minimale en 0 (cosh, abs)."""
+    lo, hi = arg
+    straddles = (lo < 0.0) & (hi > 0.0)
+    a, b = func(lo), func(hi)
+    return np.where(straddles, minimum, np.minimum(a, b)), np.maximum(a, b)
+
+
+def interval_evaluate(expr, bounds: dict) -> Interval:
+    """
+    Encadre une expression SymPy sur des boîtes, pour toutes les boîtes à la fois.
+
+    Fonctions prises en charge : +, *, puissances constantes, sqrt, exp,
+    log, sin, cos, tan, atan, sinh, cosh, tanh, Abs. Les encadrements sont
+    conservatifs : une borne infinie signifie « inconnu ».
+
+    Args:
+        expr: Expression SymPy
+        bounds: Dictionnaire symbole -> (bornes inférieures, bornes supérieures)
+
+    Returns:
+        Encadrement (lo, hi) de l'expression sur chaque boîte
+
+    Raises:
+        NotImplementedError: Si l'expression contient une fonction non prise en charge
+    """
+    import sympy as sp
+
+    if expr.is_Symbol:
+        if expr not in bounds:
+            raise NotImplementedError(f"Symbole libre: {expr}")
+        return bounds[expr]
+    if expr.is_Number or expr.is_NumberSymbol:
+        value = float(expr)
+        shape = np.shape(next(iter(bounds.values()))[0])
+        return np.full(shape, value), np.full(shape, value)
+
+    args = [interval_evaluate(arg, bounds) for arg in expr.args] if not expr.is_Pow else None
+
+    if expr.is_Add:
+        lo = sum(a[0] for a in args)
+        hi = sum(a[1] for a in args)
+        return _sanitize(lo, hi)
+
+    if expr.is_Mul:
+        result = args[0]
+        for arg in args[1:]:
+            result = _interval_mul(result, arg)
+        return _sanitize(*result)
+
+    if expr.is_Pow:
+        base, exponent = expr.args
+        if not exponent.is_Number:
+            raise NotImplementedError(f"Exposant non constant: {expr}")
+        return _sanitize(*_interval_pow(interval_evaluate(base, bounds), float(exponent)))
+
+    (arg,) = args if len(args) == 1 else (None,)
+    if arg is None:
+        raise NotImplementedError(f"Fonction non prise en charge: {expr.func}")
+    lo, hi = arg
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        if expr.func == sp.sin:
+            return _interval_sin(arg)
+        if expr.func == sp.cos:
+            return _interval_sin((lo + np.pi / 2, hi + np.pi / 2))
+        if expr.func == sp.tan:
+            return _sanitize(*_interval_tan(arg))
+        if expr.func in (sp.exp, sp.atan, sp.sinh, sp.tanh):
+            func = {sp.exp: np.exp, sp.atan: np.arctan, sp.sinh: np.sinh, sp.tanh: np.tanh}[expr.func]
+            return _sanitize(func(lo), func(hi))
+        if expr.func == sp.log:
+            defined = hi > 0.0
+            return (np.where(lo > 0.0, np.log(np.maximum(lo, 1e-300)), -np.inf),
+                    np.where(defined, np.log(np.maximum(hi, 1e-300)), np.inf))
+        if expr.func == sp.cosh:
+            return _sanitize(*_interval_even(arg, np.cosh, 1.0))
+        if expr.func == sp.Abs:
+            return _interval_even(arg, np.abs, 0.0)
+
+    raise NotImplementedError(f"Fonction non prise en charge: {expr.func}")
+
+
+def cull_grid(expr, variables: Tuple, x_vals: np.ndarray, y_vals: np.ndarray,
+              levels: np.ndarray, tile: int = CULLING_TILE) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Écarte les zones de la grille où aucune ligne de niveau ne peut passer.
+
+    Le domaine est subdivisé en quadtree : à chaque niveau, F est encadrée
+    sur toutes les boîtes restantes en une passe vectorisée ; les boîtes dont
+    l'encadrement exclut tous les niveaux sont écartées, les autres sont
+    redécoupées jusqu'à la taille de tuile. Chaque boîte couvre ses cellules,
+    bords partagés inclus, pour qu'aucun passage entre tuiles ne soit perdu.
+
+    Args:
+        expr: Expression SymPy de F(x, y)
+        variables: Symboles (x, y)
+        x_vals: Abscisses de la grille (nx,)
+        y_vals: Ordonnées de la grille (ny,)
+        levels: Niveaux recherchés
+        tile: Taille minimale des boîtes, en cellules
+
+    Returns:
+        Tuple (masque des points à évaluer (ny, nx), valeurs de remplissage
+        des zones écartées (NaN ailleurs), fraction de l'aire écartée)
+
+    Raises:
+        NotImplementedError: Si l'expression n'est pas encadrable
+    """
+    x_sym, y_sym = variables
+    ny, nx = len(y_vals), len(x_vals)
+    levels = np.asarray(levels, dtype=np.float64)
+
+    candidates = np.zeros((ny, nx), dtype=bool)
+    fill = np.full((ny, nx), np.nan)
+    culled_area = 0.0
+    total_area = float((ny - 1) * (nx - 1))
+
+    # Boîtes en indices de points inclusifs : (r0, r1, c0, c1)
+    boxes = np.array([[0, ny - 1, 0, nx - 1]], dtype=np.intp)
+    while len(boxes):
+        r0, r1, c0, c1 = boxes.T
+        lo, hi = interval_evaluate(expr, {
+            x_sym: (x_vals[c0], x_vals[c1]),
+            y_sym: (y_vals[r0], y_vals[r1]),
+        })
+        hit = ((levels[None, :] >= lo[:, None]) & (levels[None, :] <= hi[:, None])).any(axis=1)
+
+        for (b_r0, b_r1, b_c0, b_c1), value_lo, value_hi in zip(
+                boxes[~hit].tolist(), lo[~hit].tolist(), hi[~hit].tolist()):
+            fill[b_r0:b_r1 + 1, b_c0:b_c1 + 1] = value_lo if np.isfinite(value_lo) else value_hi
+            culled_area += (b_r1 - b_r0) * (b_c1 - b_c0)
+
+        kept = boxes[hit]
+        small = ((kept[:, 1] - kept[:, 0]) <= tile) & ((kept[:, 3] - kept[:, 2]) <= tile)
+        for b_r0, b_r1, b_c0, b_c1 in kept[small].tolist():
+            candidates[b_r0:b_r1 + 1, b_c0:b_c1 + 1] = True
+
+        # Découpe en quatre (ou deux) des boîtes encore trop grandes
+        big = kept[~small]
+        r0, r1, c0, c1 = big.T
+        rm = np.where(r1 - r0 > tile, (r0 + r1) // 2, r1)
+        cm = np.where(c1 - c0 > tile, (c0 + c1) // 2, c1)
+        children = np.concatenate((
+            np.column_stack((r0, rm, c0, cm)),
+            np.column_stack((rm, r1, c0, cm)),
+            np.column_stack((r0, rm, cm, c1)),
+            np.column_stack((rm, r1, cm, c1)),
+        ))
+        # Retire les boîtes dégénérées (découpe sur un seul axe)
+        boxes = children[(children[:, 1] > children[:, 0]) & (children[:, 3] > children[:, 2])]
+
+    return candidates, fill, culled_area / total_area if total_area > 0 else 0.0
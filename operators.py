@@ -3,20 +3,48 @@
 # ===============================================
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Set, List, Tuple, Optional, Union, Callable
+from typing import TYPE_CHECKING, Dict, Set, List, Tuple, Optional, Union, Callable
 
 if TYPE_CHECKING:
-    from bpy.types import Context, Object, Curve, Spline
+    from bpy.types import Context, Object, Curve, Mesh, Spline
     import numpy.typing as npt
 
+import keyword
+import time
+import uuid
+
 import bpy
 import numpy as np
 import numpy.typing as npt
 from bpy.types import Operator
-
-from .preset_manager import SimplePresetManager, PresetData
-from .preferences import get_text, SYMPY_AVAILABLE
-from .utils import get_or_create_curve_tube_group
+from bpy.props import BoolProperty
+
+from .preset_manager import SimplePresetManager, PresetData, PresetRecord, invalidate_presets
+from .preferences import get_text, get_addon_preferences, get_eval_server_path, SYMPY_AVAILABLE
+from .utils import (
+    get_or_create_curve_tube_group, get_or_create_edge_tube_group, get_or_create_points_group,
+    geometry_hash, find_shared_curve, register_shared_curve, tube_lod, tube_statistics,
+    GROUP_VERSION_KEY, TUBE_RADIUS,
+)
+from .implicit import trace_implicit_curve, cull_grid
+from .compiler import compile_expression
+from .buffers import BUFFER_POOL, trig_table
+from .sandbox import SandboxError, SandboxSession
+from .evalserver import EvalServerClient, EvalServerError, RemoteFunction
+from .recipes import (
+    RECIPE_KEY, HASH_KEY, GROUP_KEY, PART_KEY, SHARED_SETTINGS,
+    Recipe, snapshot_recipe, apply_recipe, recipe_hash, stamp_object, read_recipe,
+)
+from .animation import (
+    ANIMATION_KEY, ANIMATED_CURVE_TYPES, TIME_SYMBOLS, frozen_settings, is_animated, mark_animated,
+    mentions_time, time_values,
+)
+from . import throughput
+from .geometry import (
+    vertices_to_array, simplify_polyline, fit_cubic_bezier,
+    cumulative_arc_length, cumulative_speed_integral, arc_length_parameters,
+    contour_polylines, newton_project, surface_mesh, polyline_edges
+)
 
 try:
     import sympy as sp
@@ -32,6 +60,242 @@ except ImportError:
 OperatorReturn = Set[str]
 Vertex3D = Tuple[float, float, float]
 VertexList = List[Vertex3D]
+CurveMember = Tuple[float, np.ndarray, Optional[np.ndarray]]  # (valeur, points, tangentes)
+ContourLevel = Tuple[float, List[Tuple[np.ndarray, bool]]]  # (niveau, [(points, fermée)])
+SplineSource = Tuple[np.ndarray, bool, Optional[np.ndarray], bool]  # (points, ordonnée, tangentes, fermée)
+
+# Facteur de suréchantillonnage pour l'estimation de la longueur d'arc
+ARC_LENGTH_OVERSAMPLING: int = 8
+
+# Nombre d'échantillons évalués par bande de grille implicite
+GRID_TILE_SIZE: int = 1 << 20
+
+# Au-delà de ce nombre de points, le conteneur automatique est un maillage d'arêtes
+AUTO_MESH_POINTS: int = 20000
+
+# Collections de bpy.data purgées par le nettoyage de scène
+PURGE_COLLECTIONS: Tuple[str, ...] = (
+    'meshes', 'curves', 'hair_curves', 'pointclouds', 'volumes', 'metaballs', 'lattices',
+    'grease_pencils', 'fonts', 'materials', 'node_groups', 'textures', 'images',
+    'actions', 'lights', 'cameras',
+)
+
+# Borne du nombre de passes de purge (une par niveau de dépendance)
+MAX_PURGE_PASSES: int = 32
+
+# Variable principale de chaque type balayable : interdite comme paramètre de balayage
+SWEEP_VARIABLES: Dict[str, str] = {'EXPLICIT': 'x', 'PARAMETRIC': 't', 'POLAR': 'theta'}
+
+
+def sweep_parameter_error(props) -> Optional[str]:
+    """
+    Vérifie le nom du paramètre de balayage.
+
+    Args:
+        props: Propriétés de l'addon
+
+    Returns:
+        Message traduit, ou None si le nom convient (ou si le balayage est inactif)
+    """
+    name: str = props.sweep_parameter.strip()
+    if not props.sweep_enabled or not name or props.curve_type not in SWEEP_VARIABLES:
+        return None
+    if not name.isidentifier() or keyword.iskeyword(name):
+        return f"{get_text('sweep_not_identifier')}: '{name}'"
+    if name == SWEEP_VARIABLES[props.curve_type]:
+        return f"{get_text('sweep_is_variable')}: '{name}'"
+    if name in TIME_SYMBOLS:
+        return f"{get_text('sweep_is_time')}: '{name}'"
+    return None
+
+
+def evaluate_on(func: Callable, values: np.ndarray, *args: np.ndarray) -> np.ndarray:
+    """
+    Évalue une fonction lambdifiée et diffuse le résultat à la forme des entrées.
+
+    Les expressions constantes (ex: r = 2) renvoient un scalaire ; les
+    paramètres de balayage (M, 1) diffusent contre les valeurs (1, N).
+
+    Args:
+        func: Fonction lambdifiée
+        values: Valeurs de la variable principale
+        *args: Valeurs des paramètres supplémentaires
+
+    Returns:
+        Tableau float de la forme diffusée des entrées
+    """
+    shape = np.broadcast_shapes(np.shape(values), *(np.shape(a) for a in args))
+    result = np.asarray(func(values, *args), dtype=np.float64)
+    return np.broadcast_to(result, shape)
+
+
+def evaluate_grid(func: Callable, x_vals: np.ndarray, y_vals: np.ndarray) -> np.ndarray:
+    """
+    Évalue F(x, y) sur la grille par bandes de lignes.
+
+    Les coordonnées sont diffusées (1, nx) × (lignes, 1) sans meshgrid, et
+    la grille de sortie provient de la réserve de tampons.
+
+    Args:
+        func: Fonction lambdifiée F(x, y)
+        x_vals: Abscisses (nx,)
+        y_vals: Ordonnées (ny,)
+
+    Returns:
+        Valeurs Z de forme (ny, nx)
+    """
+    Z: np.ndarray = BUFFER_POOL.take((len(y_vals), len(x_vals)))
+    rows: int = max(1, GRID_TILE_SIZE // max(len(x_vals), 1))
+    for start in range(0, len(y_vals), rows):
+        Z[start:start + rows] = evaluate_on(
+            func, x_vals[None, :], y_vals[start:start + rows, None]
+        )
+    return Z
+
+
+def evaluate_grid_masked(func: Callable, x_vals: np.ndarray, y_vals: np.ndarray,
+                         mask: np.ndarray, Z: np.ndarray) -> int:
+    """
+    Évalue F(x, y) sur les seuls points retenus de la grille, en place.
+
+    Args:
+        func: Fonction lambdifiée F(x, y)
+        x_vals: Abscisses (nx,)
+        y_vals: Ordonnées (ny,)
+        mask: Points à évaluer (ny, nx)
+        Z: Grille de sortie (ny, nx), complétée aux points du masque
+
+    Returns:
+        Nombre de points évalués
+    """
+    rows, cols = np.nonzero(mask)
+    for start in range(0, len(rows), GRID_TILE_SIZE):
+        r = rows[start:start + GRID_TILE_SIZE]
+        c = cols[start:start + GRID_TILE_SIZE]
+        Z[r, c] = evaluate_on(func, x_vals[c], y_vals[r])
+    return len(rows)
+
+
+def lambdify_gradient(expr: Expr, variables: Tuple[Symbol, Symbol],
+                      compiler: Callable = compile_expression) -> Optional[Tuple[Callable, Callable]]:
+    """
+    Calcule et compile le gradient (∂F/∂x, ∂F/∂y) d'une expression implicite.
+
+    Args:
+        expr: Expression SymPy F(x, y)
+        variables: Symboles (x, y)
+        compiler: Fonction de compilation (args, expr) -> fonction
+
+    Returns:
+        Composantes lambdifiées, ou None si la dérivation échoue
+    """
+    try:
+        return tuple(
+            compiler(variables, sp.diff(expr, var))
+            for var in variables
+        )
+    except Exception as e:
+        print(f"Avertissement gradient: {e}")
+        return None
+
+
+def lambdify_derivative(expr: Expr, symbol: Symbol,
+                        params: Tuple[Symbol, ...] = (),
+                        compiler: Callable = compile_expression) -> Optional[Callable]:
+    """
+    Dérive symboliquement une expression et la compile pour NumPy.
+
+    Args:
+        expr: Expression SymPy
+        symbol: Variable de dérivation
+        params: Paramètres supplémentaires passés en arguments
+        compiler: Fonction de compilation (args, expr) -> fonction
+
+    Returns:
+        Dérivée lambdifiée, ou None si la dérivation échoue
+    """
+    try:
+        return compiler((symbol, *params), sp.diff(expr, symbol))
+    except Exception as e:
+        print(f"Avertissement dérivée: {e}")
+        return None
+
+
+def copy_modifier(mod, obj: Object) -> None:
+    """
+    Recrée un modificateur sur un autre objet, réglages compris.
+
+    Args:
+        mod: Modificateur source
+        obj: Objet cible
+
+    Raises:
+        RuntimeError: Si le type de modificateur est refusé par l'objet
+    """
+    copy = obj.modifiers.new(name=mod.name, type=mod.type)
+    if copy is None:
+        raise RuntimeError(f"modificateur {mod.type} non pris en charge par {obj.type}")
+    for prop in mod.bl_rna.properties:
+        if not prop.is_readonly and prop.identifier not in ('name', 'type'):
+            try:
+                setattr(copy, prop.identifier, getattr(mod, prop.identifier))
+            except (AttributeError, TypeError, ValueError):
+                pass
+    # Entrées d'un modificateur Geometry Nodes (propriétés ID)
+    for key in mod.keys():
+        copy[key] = mod[key]
+
+
+def transfer_tube(source: Object, target: Object) -> None:
+    """
+    Reporte le groupe et les entrées du modificateur « Tube » d'un objet à l'autre.
+
+    Un maillage peut passer d'arêtes (tube) à sommets seuls (nuage de
+    points) : le groupe du modificateur doit suivre la nouvelle géométrie.
+
+    Args:
+        source: Objet régénéré (tube à jour)
+        target: Objet conservé
+    """
+    new_tube = source.modifiers.get("Tube")
+    old_tube = target.modifiers.get("Tube")
+    if new_tube is None or old_tube is None or new_tube.node_group is old_tube.node_group:
+        return
+    old_tube.node_group = new_tube.node_group
+    for key in new_tube.keys():
+        old_tube[key] = new_tube[key]
+
+
+def purgeable_collections() -> List[Tuple[str, object]]:
+    """Collections de PURGE_COLLECTIONS présentes dans cette version de Blender."""
+    return [(attr, getattr(bpy.data, attr)) for attr in PURGE_COLLECTIONS
+            if hasattr(bpy.data, attr)]
+
+
+def purge_orphans() -> Tuple[Dict[str, int], int]:
+    """
+    Supprime les blocs sans utilisateur jusqu'au point fixe.
+
+    Chaque passe libère les blocs qui n'étaient utilisés que par ceux de la
+    passe précédente (maillage, puis matériau, puis node group...).
+
+    Returns:
+        Tuple (nombre de blocs supprimés par collection, nombre de passes)
+    """
+    counts: Dict[str, int] = {}
+    passes: int = 0
+    while passes < MAX_PURGE_PASSES:
+        orphans: List = []
+        for attr, collection in purgeable_collections():
+            found = [datablock for datablock in collection if datablock.users == 0]
+            if found:
+                counts[attr] = counts.get(attr, 0) + len(found)
+                orphans.extend(found)
+        if not orphans:
+            break
+        bpy.data.batch_remove(orphans)
+        passes += 1
+    return counts, passes
 
 
 class PLAN_CURVES_OT_clean_scene(Operator):
@@ -40,27 +304,279 @@ class PLAN_CURVES_OT_clean_scene(Operator):
     bl_idname = "plan_curves.clean_scene"
     bl_label = "Nettoyer la scène (sauf Stable)"
     bl_description = "Supprime tous les objets sauf ceux de la collection 'Stable' et purge les orphelins"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: BoolProperty(  # type: ignore
+        name="Simulation",
+        description="Compte les objets et orphelins qui seraient supprimés, sans rien supprimer",
+        default=False
+    )
+
+    def execute(self, context: Context) -> OperatorReturn:
+        """
+        Supprime en un seul lot les objets hors 'Stable', puis purge les orphelins.
 
-    def execute(self, context):
+        Args:
+            context: Contexte Blender
+
+        Returns:
+            Statut d'exécution
+        """
+        start: float = time.perf_counter()
+
+        # Objets de 'Stable' et de toutes ses sous-collections
         stable_col = bpy.data.collections.get("Stable")
-        stable_objs = set()
-        if stable_col:
-            stable_objs = set(stable_col.objects)
-
-        # Supprimer tous les objets sauf ceux de 'Stable'
-        for obj in list(bpy.data.objects):
-            if obj not in stable_objs:
-                bpy.data.objects.remove(obj, do_unlink=True)
-
-        # Purge des orphelins
-        # (Depuis Blender 3.x : bpy.ops.outliner.orphans_purge() n'est accessible qu'en contexte OUTLINER, sinon il faut faire à la main)
-        for datablock in [bpy.data.meshes, bpy.data.curves, bpy.data.materials, bpy.data.images, bpy.data.textures]:
-            for datab in list(datablock):
-                if datab.users == 0:
-                    datablock.remove(datab)
-        self.report({'INFO'}, "Scène nettoyée, orphelins purgés (Stable conservé)")
+        keep: Set[Object] = set(stable_col.all_objects) if stable_col else set()
+        doomed: List[Object] = [obj for obj in bpy.data.objects if obj not in keep]
+
+        if self.dry_run:
+            orphans: Dict[str, int] = self.simulate_orphans(doomed)
+            elapsed: float = time.perf_counter() - start
+            print(f"🔍 Simulation: {len(doomed)} objets, orphelins {orphans} ({elapsed:.2f} s)")
+            self.report({'INFO'}, (
+                f"{get_text('clean_dry_run')}: {len(doomed)} {get_text('objects')}, "
+                f"{sum(orphans.values())} {get_text('orphans')} ({len(keep)} Stable)"
+            ))
+            return {'FINISHED'}
+
+        bpy.data.batch_remove(doomed)
+        removed_at: float = time.perf_counter()
+
+        orphans, passes = purge_orphans()
+        end: float = time.perf_counter()
+        print(
+            f"🧹 {len(doomed)} objets supprimés en {removed_at - start:.2f} s, "
+            f"{sum(orphans.values())} orphelins purgés en {passes} passe(s) "
+            f"({end - removed_at:.2f} s): {orphans}"
+        )
+        self.report({'INFO'}, (
+            f"{get_text('clean_done')}: {len(doomed)} {get_text('objects')}, "
+            f"{sum(orphans.values())} {get_text('orphans')} ({end - start:.2f} s)"
+        ))
         return {'FINISHED'}
 
+    def simulate_orphans(self, doomed: List[Object]) -> Dict[str, int]:
+        """
+        Compte les orphelins que laisserait la suppression, sans rien supprimer.
+
+        Un bloc devient orphelin quand tous ses utilisateurs sont supprimés ;
+        la propagation est répétée jusqu'au point fixe, comme la purge.
+
+        Args:
+            doomed: Objets à supprimer
+
+        Returns:
+            Nombre d'orphelins par collection de bpy.data
+        """
+        user_map = bpy.data.user_map()
+        removed: Set = set(doomed)
+        counts: Dict[str, int] = {}
+
+        changed: bool = True
+        while changed:
+            changed = False
+            for attr, collection in purgeable_collections():
+                for datablock in collection:
+                    if datablock in removed or datablock.use_fake_user:
+                        continue
+                    users = user_map.get(datablock, set())
+                    if datablock.users == 0 or (users and users <= removed):
+                        removed.add(datablock)
+                        counts[attr] = counts.get(attr, 0) + 1
+                        changed = True
+        return counts
+
+
+class PLAN_CURVES_OT_regenerate_all(Operator):
+    """Régénère sur place les objets dont la recette a changé."""
+
+    bl_idname: str = "plan_curves.regenerate_all"
+    bl_label: str = "Regenerate All"
+    bl_description: str = "Reconstruit les courbes générées dont la recette ou la version a changé"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_scene_settings: BoolProperty(  # type: ignore
+        name="Réglages de la scène",
+        description="Applique aux recettes les réglages communs de la scène (sortie, simplification, échantillonnage...)",
+        default=False
+    )
+
+    force: BoolProperty(  # type: ignore
+        name="Forcer",
+        description="Reconstruit tous les objets, même à jour",
+        default=False
+    )
+
+    def execute(self, context: Context) -> OperatorReturn:
+        """
+        Parcourt la scène, compare les empreintes et reconstruit les groupes périmés.
+
+        Args:
+            context: Contexte Blender
+
+        Returns:
+            Statut d'exécution
+        """
+        props = context.scene.plan_curves_props
+        scene_recipe: Recipe = snapshot_recipe(props)
+
+        # Objets tamponnés, regroupés par génération
+        groups: Dict[str, List[Object]] = {}
+        for obj in context.scene.objects:
+            if RECIPE_KEY in obj:
+                groups.setdefault(obj.get(GROUP_KEY, obj.name), []).append(obj)
+
+        stale: List[Tuple[Recipe, List[Object]]] = []
+        for members in groups.values():
+            members.sort(key=lambda obj: obj.get(PART_KEY, 0))
+            recipe: Recipe = read_recipe(members[0])
+            if self.use_scene_settings:
+                recipe.update({key: scene_recipe[key] for key in SHARED_SETTINGS if key in scene_recipe})
+            digest: str = recipe_hash(recipe)
+            if self.force or any(obj.get(HASH_KEY) != digest for obj in members):
+                stale.append((recipe, members))
+
+        if not stale:
+            self.report({'INFO'}, f"{get_text('regenerate_up_to_date')} ({len(groups)})")
+            return {'FINISHED'}
+
+        # Équations identiques à la suite : le cache de compilation les sert
+        stale.sort(key=lambda item: (item[0].get('curve_type', ''),
+                                     item[0].get('equation1', ''), item[0].get('equation2', '')))
+
+        start: float = time.perf_counter()
+        rebuilt: int = 0
+        failures: List[str] = []
+        try:
+            for recipe, members in stale:
+                if self.regenerate_group(recipe, members):
+                    rebuilt += 1
+                else:
+                    failures.append(members[0].name)
+        finally:
+            # Les réglages de la scène ne sont pas modifiés par la reconstruction
+            apply_recipe(props, scene_recipe)
+
+        print(f"🔁 {rebuilt}/{len(stale)} groupes reconstruits en "
+              f"{time.perf_counter() - start:.2f} s, {len(groups) - len(stale)} à jour")
+        if failures:
+            self.report({'WARNING'}, f"{get_text('regenerate_failed')}: {', '.join(failures)}")
+        else:
+            self.report({'INFO'}, f"{get_text('regenerate_done')}: {rebuilt}/{len(groups)}")
+        return {'FINISHED'}
+
+    def regenerate_group(self, recipe: Recipe, members: List[Object]) -> bool:
+        """
+        Reconstruit un groupe d'objets et remplace leur géométrie sur place.
+
+        Les objets existants gardent leur nom, leur transformation, leurs
+        modificateurs et leurs collections ; seules les données de courbe et
+        la recette changent. Si le type de données change (courbe <-> maillage),
+        le nouvel objet prend la place de l'ancien (voir replace_object) ; une
+        partie impossible à remplacer garde son ancienne géométrie.
+
+        Args:
+            recipe: Recette à appliquer
+            members: Objets du groupe, triés par rang
+
+        Returns:
+            True si la reconstruction a abouti
+        """
+        props = bpy.context.scene.plan_curves_props
+        before = set(bpy.data.objects)
+        try:
+            apply_recipe(props, recipe)
+            result = bpy.ops.plan_curves.generate_curve()
+        except (KeyError, TypeError, ValueError, RuntimeError) as e:
+            print(f"❌ {members[0].name}: {e}")
+            return False
+        if 'FINISHED' not in result:
+            return False
+
+        created: List[Object] = sorted((obj for obj in bpy.data.objects if obj not in before),
+                                       key=lambda obj: obj.get(PART_KEY, 0))
+        group: str = members[0].get(GROUP_KEY, members[0].name)
+        complete: bool = True
+
+        for index, new_obj in enumerate(created):
+            new_obj[GROUP_KEY] = group
+            if index >= len(members):
+                continue  # Partie supplémentaire : l'objet créé est conservé
+
+            old_obj: Object = members[index]
+            old_data = old_obj.data
+            if old_obj.type != new_obj.type:
+                # Conteneur changé (courbe <-> maillage) : l'objet entier est remplacé
+                try:
+                    self.replace_object(old_obj, new_obj)
+                except (RuntimeError, TypeError, ValueError) as e:
+                    print(f"❌ {old_obj.name}: {e}")
+                    bpy.data.objects.remove(new_obj, do_unlink=True)
+                    complete = False
+                    continue
+            else:
+                old_obj.data = new_obj.data
+                transfer_tube(new_obj, old_obj)
+                for key in (RECIPE_KEY, HASH_KEY, GROUP_KEY, PART_KEY):
+                    old_obj[key] = new_obj[key]
+                if ANIMATION_KEY in new_obj:
+                    mark_animated(old_obj)
+                elif ANIMATION_KEY in old_obj:
+                    del old_obj[ANIMATION_KEY]
+                bpy.data.objects.remove(new_obj, do_unlink=True)
+            if old_data is not None and old_data.users == 0:
+                bpy.data.batch_remove([old_data])
+
+        # Parties en trop de l'ancienne génération
+        for old_obj in members[len(created):]:
+            old_data = old_obj.data
+            bpy.data.objects.remove(old_obj, do_unlink=True)
+            if old_data is not None and old_data.users == 0:
+                bpy.data.batch_remove([old_data])
+        return complete
+
+    def replace_object(self, old_obj: Object, new_obj: Object) -> None:
+        """
+        Met un objet régénéré d'un autre type à la place de l'ancien.
+
+        Le nouvel objet reprend le nom, la transformation, le parent, les
+        enfants, les collections, les propriétés personnalisées et les
+        modificateurs de l'ancien (le tube reste celui du nouveau type) ;
+        l'ancien objet est supprimé.
+
+        Args:
+            old_obj: Objet existant
+            new_obj: Objet créé par la régénération
+
+        Raises:
+            RuntimeError: Si un modificateur ne s'applique pas au nouveau type
+        """
+        for mod in old_obj.modifiers:
+            if mod.name != "Tube":
+                copy_modifier(mod, new_obj)
+
+        name: str = old_obj.name
+        old_obj.name = f"{name}.regen"
+        new_obj.name = name
+        new_obj.parent = old_obj.parent
+        new_obj.matrix_parent_inverse = old_obj.matrix_parent_inverse.copy()
+        new_obj.matrix_world = old_obj.matrix_world.copy()
+        for child in list(old_obj.children):
+            matrix = child.matrix_world.copy()
+            child.parent = new_obj
+            child.matrix_world = matrix
+
+        for collection in list(new_obj.users_collection):
+            collection.objects.unlink(new_obj)
+        for collection in old_obj.users_collection:
+            collection.objects.link(new_obj)
+
+        for key in old_obj.keys():
+            if key not in new_obj and key != ANIMATION_KEY:
+                new_obj[key] = old_obj[key]
+        if ANIMATION_KEY in new_obj:
+            mark_animated(new_obj)  # Le registre est indexé par nom
+        bpy.data.objects.remove(old_obj, do_unlink=True)
 
 
 
@@ -81,6 +597,9 @@ class PLAN_CURVES_OT_refresh_presets(Operator):
         Returns:
             Statut d'exécution
         """
+        # Le fichier a pu être modifié hors de Blender : caches à reconstruire
+        invalidate_presets()
+
         # Forcer le rafraîchissement en changeant une propriété
         props = context.scene.plan_curves_props
         current_type: str = props.curve_type
@@ -115,7 +634,7 @@ class PLAN_CURVES_OT_load_preset_simple(Operator):
             return {'CANCELLED'}
 
         manager: SimplePresetManager = SimplePresetManager()
-        preset_data: Optional[PresetData] = manager.get_preset_by_name(
+        preset_data: Optional[PresetRecord] = manager.get_preset_by_name(
             props.curve_type, self.preset_name
         )
 
@@ -229,7 +748,7 @@ class PLAN_CURVES_OT_delete_preset_simple(Operator):
             return {'CANCELLED'}
 
         manager: SimplePresetManager = SimplePresetManager()
-        preset_data: Optional[PresetData] = manager.get_preset_by_name(
+        preset_data: Optional[PresetRecord] = manager.get_preset_by_name(
             props.curve_type, self.preset_name
         )
 
@@ -300,6 +819,12 @@ class PLAN_CURVES_OT_validate_params(Operator):
 
         props.validation_message = message
 
+        # Un balayage mal nommé écraserait la variable ou le temps : génération bloquée
+        sweep_error: Optional[str] = sweep_parameter_error(props) if valid else None
+        if sweep_error is not None:
+            valid, message = False, sweep_error
+            props.validation_message = f"{get_text('validation_failed')}: {message}"
+
         if valid:
             self.report({'INFO'}, get_text('valid_params'))
         else:
@@ -331,6 +856,55 @@ class PLAN_CURVES_OT_generate_curve(Operator):
             self.report({'INFO'}, get_text('sympy_required'))
             return {'CANCELLED'}
 
+        # Un seul évaluateur isolé pour toute la génération, sous un seul délai
+        settings: Optional[Tuple[float, int]] = self.sandbox_settings()
+        self.sandbox: Optional[SandboxSession] = SandboxSession(*settings) if settings else None
+        try:
+            return self.run_generation(context, props)
+        finally:
+            if self.sandbox is not None:
+                self.sandbox.close()
+
+    def run_generation(self, context: Context, props) -> OperatorReturn:
+        """
+        Prépare la génération (analyse isolée, résolution, recette) puis l'exécute.
+
+        Args:
+            context: Contexte Blender
+            props: Propriétés de l'addon
+
+        Returns:
+            Statut d'exécution
+        """
+        # Analyse isolée avant toute analyse dans Blender, validation comprise
+        if self.sandbox is not None:
+            equations: List[str] = [props.equation1]
+            if props.curve_type == 'PARAMETRIC':
+                equations.append(props.equation2)
+            try:
+                self.sandbox.evaluate(equations)
+            except SandboxError as e:
+                self.report({'ERROR'}, f"{get_text('sandbox_failed')}: {e}")
+                return {'CANCELLED'}
+
+        self.eval_server: Optional[EvalServerClient] = self.eval_server_client()
+
+        if props.resolution_mode == 'AUTO' and self.resolution_driven(props):
+            self.choose_resolution(props)
+
+        # Recette tamponnée sur chaque objet créé par cette génération
+        self.recipe: Recipe = snapshot_recipe(props)
+        # La recette garde la résolution retenue : la régénération la reproduit
+        self.recipe['resolution_mode'] = 'FIXED'
+        self.recipe_group: str = uuid.uuid4().hex
+        self.recipe_part: int = 0
+        self.shared_curves: int = 0
+        self.created_objects: List[Object] = []
+
+        # Équations animées : générées à l'image courante, puis marquées
+        self.time_values: Dict[str, float] = time_values(context.scene)
+        self.animated: bool = False
+
         # Valider d'abord
         bpy.ops.plan_curves.validate_params()
         if get_text('validation_failed').lower() in props.validation_message.lower():
@@ -341,20 +915,174 @@ class PLAN_CURVES_OT_generate_curve(Operator):
                 'EXPLICIT': self.generate_explicit,
                 'PARAMETRIC': self.generate_parametric,
                 'POLAR': self.generate_polar,
-                'IMPLICIT': self.generate_implicit
+                'IMPLICIT': self.generate_implicit,
+                'SURFACE': self.generate_surface,
             }
 
             generator = curve_generators.get(props.curve_type)
             if generator:
-                return generator(context, props)
+                # Les tampons pris pendant la génération sont rendus à la réserve
+                # Débit d'évaluation et d'envoi : analyse et compilation déduites
+                # Chaque générateur compte les échantillons qu'il a réellement évalués
+                self.setup_seconds: float = 0.0
+                self.sample_total: int = 0
+                start: float = time.perf_counter()
+                with BUFFER_POOL.generation():
+                    result: OperatorReturn = generator(context, props)
+                if 'FINISHED' in result:
+                    throughput.record(throughput.FINAL, props.curve_type, self.sample_total,
+                                      time.perf_counter() - start - self.setup_seconds)
+                print(f"♻️ {BUFFER_POOL.summary()}")
+                if self.shared_curves:
+                    print(f"🔗 {get_text('shared_geometry')}: {self.shared_curves} datablock(s) réutilisé(s)")
+                if self.animated and 'FINISHED' in result:
+                    self.mark_animated(props)
+                return result
             else:
                 self.report({'ERROR'}, f"Type de courbe non supporté: {props.curve_type}")
                 return {'CANCELLED'}
 
+        except SandboxError as e:
+            self.report({'ERROR'}, f"{get_text('sandbox_failed')}: {e}")
+            return {'CANCELLED'}
+
+        except EvalServerError as e:
+            self.report({'ERROR'}, f"{get_text('eval_server_failed')}: {e}")
+            return {'CANCELLED'}
+
         except Exception as e:
             self.report({'ERROR'}, f"Erreur: {e}")
             return {'CANCELLED'}
 
+    def family_size(self, props) -> int:
+        """Nombre de courbes évaluées ensemble (balayage), 1 hors famille."""
+        return props.sweep_count if props.sweep_enabled and props.sweep_parameter.strip() else 1
+
+    def resolution_driven(self, props) -> bool:
+        """
+        Vrai si le coût de la génération suit la propriété 'resolution'.
+
+        Les croisements utilisent une grille fixe et le suivi dépend de la
+        longueur de la courbe : la résolution automatique ne s'y applique pas.
+        """
+        return props.curve_type != 'IMPLICIT' or props.implicit_mode == 'CONTOURS'
+
+    def choose_resolution(self, props) -> None:
+        """
+        Résolution automatique : la plus grande qui tient dans la latence cible.
+
+        Une équation animée est réévaluée à chaque image : la cible de
+        l'aperçu direct s'applique, sinon celle de la génération. Une
+        courbe que mark_animated laissera figée (type non animable,
+        balayage, réglages non reproduits) relève de la génération.
+
+        Args:
+            props: Propriétés de l'addon
+        """
+        equations: List[str] = [props.equation1]
+        if props.curve_type == 'PARAMETRIC':
+            equations.append(props.equation2)
+        live: bool = (props.curve_type in ANIMATED_CURVE_TYPES and not props.sweep_enabled
+                      and not frozen_settings(props) and mentions_time(equations))
+        stage: str = throughput.LIVE if live else throughput.FINAL
+        props.resolution = throughput.auto_resolution(stage, props.curve_type, props.resolution,
+                                                      self.family_size(props))
+        rate: Optional[float] = throughput.points_per_ms(stage, props.curve_type)
+        if rate is not None:
+            print(f"⏱️ {get_text('auto_resolution')}: {props.resolution} "
+                  f"({rate:.0f} points/ms, {throughput.target_latency(stage):.0f} ms)")
+
+    def sandbox_settings(self) -> Optional[Tuple[float, int]]:
+        """
+        Lit les réglages d'évaluation isolée dans les préférences.
+
+        Returns:
+            Tuple (délai en secondes, mémoire en Mo), ou None si désactivée
+        """
+        prefs = get_addon_preferences()
+        if prefs is None or not getattr(prefs, 'use_sandbox', False):
+            return None
+        return prefs.sandbox_timeout, prefs.sandbox_memory
+
+    def eval_server_client(self) -> Optional[EvalServerClient]:
+        """
+        Se connecte au serveur d'évaluation s'il est activé et joignable.
+
+        Returns:
+            Client du serveur, ou None pour évaluer dans le processus
+        """
+        prefs = get_addon_preferences()
+        if prefs is None or not getattr(prefs, 'use_eval_server', False):
+            return None
+        client: EvalServerClient = EvalServerClient(get_eval_server_path())
+        if client.ping() is None:
+            print("⚠️ Serveur d'évaluation injoignable — évaluation locale")
+            return None
+        return client
+
+    def compile(self, args: Tuple[Symbol, ...], expr: Expr) -> Callable:
+        """
+        Compile une expression pour l'évaluation en bloc.
+
+        Avec l'évaluation isolée, la fonction renvoyée évalue dans le
+        sous-processus de la génération, borné en temps et en mémoire ; avec le serveur
+        d'évaluation, elle délègue au serveur (repli local en cas d'échec).
+
+        Args:
+            args: Symboles d'entrée
+            expr: Expression SymPy
+
+        Returns:
+            Fonction vectorisée
+        """
+        session: Optional[SandboxSession] = getattr(self, 'sandbox', None)
+        if session is not None:
+            return session.function(args, expr)
+        client: Optional[EvalServerClient] = getattr(self, 'eval_server', None)
+        if client is not None:
+            return RemoteFunction(client, args, expr)
+        start: float = time.perf_counter()
+        func: Callable = compile_expression(args, expr)
+        self.setup_seconds = getattr(self, 'setup_seconds', 0.0) + time.perf_counter() - start
+        return func
+
+    def parse_equation(self, text: str) -> Expr:
+        """
+        Analyse une équation ; les symboles de temps prennent leur valeur à l'image courante.
+
+        Args:
+            text: Équation saisie
+
+        Returns:
+            Expression SymPy sans 'frame' ni 'time'
+        """
+        start: float = time.perf_counter()
+        expr: Expr = sp.sympify(text)
+        if is_animated([expr]):
+            self.animated = True
+            values = getattr(self, 'time_values', None) or {name: 0.0 for name in TIME_SYMBOLS}
+            expr = expr.subs({sp.Symbol(name): value for name, value in values.items()})
+        self.setup_seconds = getattr(self, 'setup_seconds', 0.0) + time.perf_counter() - start
+        return expr
+
+    def mark_animated(self, props) -> None:
+        """
+        Marque les objets créés pour la mise à jour à chaque image.
+
+        Args:
+            props: Propriétés de l'addon
+        """
+        if props.curve_type not in ANIMATED_CURVE_TYPES or props.sweep_enabled:
+            self.report({'WARNING'}, get_text('animation_unsupported'))
+            return
+        frozen: List[str] = frozen_settings(props)
+        if frozen:
+            self.report({'WARNING'}, f"{get_text('animation_frozen')}: {', '.join(frozen)}")
+            return
+        for obj in self.created_objects:
+            mark_animated(obj)
+        self.report({'INFO'}, f"{get_text('animated_curve')}: {len(self.created_objects)}")
+
     def add_geometry_nodes(self, obj: Object) -> None:
         """
         Ajoute les geometry nodes pour le tube.
@@ -364,13 +1092,30 @@ class PLAN_CURVES_OT_generate_curve(Operator):
             obj: Objet courbe à modifier
         """
         try:
-            group = get_or_create_curve_tube_group()
+            if obj.type == 'MESH':
+                # Maillage d'arêtes : tube ; sommets seuls : nuage de points
+                group = (get_or_create_edge_tube_group() if len(obj.data.edges)
+                         else get_or_create_points_group())
+            else:
+                group = get_or_create_curve_tube_group()
             geo_mod = obj.modifiers.new(name="Tube", type='NODES')
             geo_mod.node_group = group
 
             # ✅ Configuration sécurisée des inputs
             if hasattr(geo_mod, "__setitem__"):
-                geo_mod["Input_2"] = 0.01  # Radius
+                # Entrées du modificateur indexées par identifiant (Socket_N), pas par nom
+                sockets = {item.name: item.identifier for item in group.interface.items_tree
+                           if getattr(item, 'in_out', None) == 'INPUT'}
+                radius: float = TUBE_RADIUS
+                if "Radius" in sockets:
+                    geo_mod[sockets["Radius"]] = radius
+
+                # Niveaux de détail selon les points écrits : fenêtre fluide, rendu complet
+                count, length, bezier = tube_statistics(obj.data)
+                if group.get(GROUP_VERSION_KEY) and count:
+                    for name, value in tube_lod(count, length, radius, decimate=not bezier).items():
+                        if name in sockets:
+                            geo_mod[sockets[name]] = value
             else:
                 # Méthode alternative pour les versions plus récentes
                 for input_socket in geo_mod.node_group.interface.items_tree:
@@ -382,27 +1127,258 @@ class PLAN_CURVES_OT_generate_curve(Operator):
             print(f"Avertissement Geometry Nodes: {e}")
             # L'addon continue de fonctionner sans les tubes
 
-    def create_curve_object(self, name: str, vertices: VertexList, context: Context) -> Object:
+    def simplify_points(self, points: np.ndarray, props) -> np.ndarray:
         """
-        Crée un objet courbe à partir d'une liste de vertices.
-        ✅ VERSION OPTIMISÉE POUR BLENDER 4.4.3
+        Étape optionnelle de simplification avant l'envoi des points.
 
         Args:
-            name: Nom de l'objet courbe
-            vertices: Liste des points de la courbe
-            context: Contexte Blender
+            points: Points ordonnés (N, 3)
+            props: Propriétés de l'addon
 
         Returns:
-            Objet courbe créé
+            Points conservés (inchangés si la simplification est désactivée)
+        """
+        if not props.simplify_enabled or len(points) < 3:
+            return points
+
+        simplified, removed = simplify_polyline(points, props.simplify_tolerance)
+        if removed > 0:
+            ratio: float = 100.0 * removed / len(points)
+            self.report({'INFO'}, (
+                f"{get_text('simplified')}: {len(points)} → {len(simplified)} points "
+                f"(-{ratio:.1f}%)"
+            ))
+        return simplified
+
+    def build_poly_spline(self, curve_data: Curve, points: np.ndarray,
+                          cyclic: bool = False) -> Spline:
+        """
+        Ajoute une spline POLY et y envoie les points en un seul appel.
+
+        Args:
+            curve_data: Datablock courbe
+            points: Points (N, 3)
+            cyclic: Ferme la spline (sans point dupliqué)
+
+        Returns:
+            Spline créée
+        """
+        spline: Spline = curve_data.splines.new('POLY')
+        spline.points.add(len(points) - 1)
+        spline.use_cyclic_u = cyclic
+
+        # ✅ Envoi groupé des coordonnées (x, y, z, w) en un seul appel
+        coords: np.ndarray = BUFFER_POOL.take((len(points), 4), np.float32)
+        coords[:, :3] = points
+        coords[:, 3] = 1.0
+        spline.points.foreach_set("co", coords.ravel())
+        return spline
+
+    def build_bezier_spline(self, curve_data: Curve, points: np.ndarray,
+                            tangents: Optional[np.ndarray], props,
+                            cyclic: bool = False) -> Spline:
+        """
+        Ajuste des segments de Bézier cubiques et ajoute une spline BEZIER.
+
+        Args:
+            curve_data: Datablock courbe
+            points: Points ordonnés (N, 3)
+            tangents: Tangentes analytiques (N, 3) ou None
+            props: Propriétés de l'addon
+            cyclic: Ferme la spline (le segment de fermeture est aussi ajusté)
+
+        Returns:
+            Spline créée
+        """
+        if cyclic:
+            points = np.vstack((points, points[:1]))
+            if tangents is not None:
+                tangents = np.vstack((tangents, tangents[:1]))
+
+        control: np.ndarray = fit_cubic_bezier(points, props.bezier_tolerance, tangents)
+
+        if cyclic:
+            # Le dernier point rejoint le premier : sa poignée gauche devient celle du départ
+            count: int = len(control)
+            co: np.ndarray = control[:, 0]
+            handle_right: np.ndarray = control[:, 1]
+            handle_left: np.ndarray = np.roll(control[:, 2], 1, axis=0)
+        else:
+            count = len(control) + 1
+            co = BUFFER_POOL.take((count, 3))
+            co[:-1] = control[:, 0]
+            co[-1] = control[-1, 3]
+
+            # Poignées extrêmes : symétriques de la poignée intérieure
+            handle_left = BUFFER_POOL.take((count, 3))
+            handle_left[1:] = control[:, 2]
+            handle_left[0] = 2.0 * co[0] - control[0, 1]
+            handle_right = BUFFER_POOL.take((count, 3))
+            handle_right[:-1] = control[:, 1]
+            handle_right[-1] = 2.0 * co[-1] - control[-1, 2]
+
+        spline: Spline = curve_data.splines.new('BEZIER')
+        spline.bezier_points.add(count - 1)
+        spline.use_cyclic_u = cyclic
+        for point in spline.bezier_points:
+            point.handle_left_type = 'FREE'
+            point.handle_right_type = 'FREE'
+
+        spline.bezier_points.foreach_set("co", BUFFER_POOL.cast(co).ravel())
+        spline.bezier_points.foreach_set("handle_left", BUFFER_POOL.cast(handle_left).ravel())
+        spline.bezier_points.foreach_set("handle_right", BUFFER_POOL.cast(handle_right).ravel())
+
+        self.report({'INFO'}, (
+            f"{get_text('bezier_fit')}: {len(points)} points → "
+            f"{count} points de contrôle ({len(control)} segments)"
+        ))
+        return spline
+
+    def add_spline(self, curve_data: Curve, points: np.ndarray, props,
+                   ordered: bool = True, tangents: Optional[np.ndarray] = None,
+                   cyclic: bool = False) -> Spline:
+        """
+        Ajoute une spline au datablock selon le mode de sortie.
+
+        Args:
+            curve_data: Datablock courbe
+            points: Points (N, 3)
+            props: Propriétés de l'addon
+            ordered: Les points forment une polyligne (simplification et Bézier permis)
+            tangents: Tangentes analytiques (N, 3) pour le mode Bézier
+            cyclic: Polyligne fermée (le dernier point rejoint le premier)
+
+        Returns:
+            Spline créée
+        """
+        if ordered and props.output_mode == 'BEZIER':
+            return self.build_bezier_spline(curve_data, points, tangents, props, cyclic)
+        if ordered and cyclic:
+            points = self.simplify_points(np.vstack((points, points[:1])), props)[:-1]
+        elif ordered:
+            points = self.simplify_points(points, props)
+        return self.build_poly_spline(curve_data, points, cyclic)
+
+    def container(self, splines: List[SplineSource], props) -> str:
+        """
+        Choisit le conteneur des splines : 'CURVE', 'MESH' ou 'POINTS'.
+
+        En mode automatique, les données denses en polylignes vont dans un
+        maillage d'arêtes, bien moins coûteux qu'une courbe via RNA.
+
+        Args:
+            splines: Splines (points, ordonnée, tangentes, fermée)
+            props: Propriétés de l'addon
+
+        Returns:
+            Conteneur retenu
         """
+        # Une courbe animée est réécrite spline par spline : toujours une courbe
+        if getattr(self, 'animated', False):
+            return 'CURVE'
+        if props.container != 'AUTO':
+            return props.container
+        if props.output_mode == 'BEZIER':
+            return 'CURVE'
+        count: int = sum(len(points) for points, _, _, _ in splines)
+        return 'MESH' if count >= AUTO_MESH_POINTS else 'CURVE'
+
+    def new_mesh_data(self, name: str, splines: List[SplineSource], props,
+                      edges: bool = True) -> Mesh:
+        """
+        Crée un maillage d'arêtes (ou de sommets seuls) à partir des splines.
+
+        Les polylignes ordonnées sont simplifiées comme en mode POLY ; tous
+        les points sont envoyés en un seul foreach_set, les arêtes aussi.
+
+        Args:
+            name: Nom du datablock
+            splines: Splines (points, ordonnée, tangentes, fermée)
+            props: Propriétés de l'addon
+            edges: Relie les points consécutifs ; sinon sommets seuls (nuage de points)
+
+        Returns:
+            Maillage rempli
+        """
+        polylines: List[np.ndarray] = []
+        for points, ordered, _, cyclic in splines:
+            if ordered and cyclic:
+                points = self.simplify_points(np.vstack((points, points[:1])), props)[:-1]
+            elif ordered:
+                points = self.simplify_points(points, props)
+            polylines.append(points)
+
+        vertices: np.ndarray = BUFFER_POOL.cast(np.concatenate(polylines))
+        mesh: Mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(vertices))
+        mesh.vertices.foreach_set("co", vertices.ravel())
+
+        if edges:
+            indices: np.ndarray = polyline_edges(
+                [len(points) for points in polylines], [cyclic for _, _, _, cyclic in splines]
+            )
+            mesh.edges.add(len(indices))
+            mesh.edges.foreach_set("vertices", indices.ravel())
+        mesh.update()
+        return mesh
+
+    def new_curve_data(self, name: str, splines: List[SplineSource], props) -> Union[Curve, Mesh]:
+        """
+        Crée le datablock courbe de splines, ou réutilise celui d'une courbe identique.
+
+        L'empreinte porte sur les points évalués et les réglages de
+        construction : des objets de même géométrie partagent un seul
+        datablock, évalué une seule fois par le depsgraph. Selon le
+        conteneur choisi, un maillage d'arêtes ou de sommets remplace la courbe.
+
+        Args:
+            name: Nom du datablock
+            splines: Splines (points, ordonnée, tangentes, fermée)
+            props: Propriétés de l'addon
+
+        Returns:
+            Datablock courbe (ou maillage) rempli
+        """
+        container: str = self.container(splines, props)
+        if container != 'CURVE':
+            return self.new_mesh_data(name, splines, props, edges=(container == 'MESH'))
+
+        key: Optional[str] = None
+        # Une courbe animée est réécrite à chaque image : jamais partagée
+        if props.share_geometry and not getattr(self, 'animated', False):
+            key = geometry_hash(splines, (
+                props.output_mode, props.bezier_tolerance,
+                props.simplify_enabled, props.simplify_tolerance,
+            ))
+            shared: Optional[Curve] = find_shared_curve(key)
+            if shared is not None:
+                self.shared_curves = getattr(self, 'shared_curves', 0) + 1
+                return shared
+
         curve_data: Curve = bpy.data.curves.new(name, type='CURVE')
         curve_data.dimensions = '3D'
-        spline: Spline = curve_data.splines.new('POLY')
-        spline.points.add(len(vertices) - 1)
+        for points, ordered, tangents, cyclic in splines:
+            self.add_spline(curve_data, points, props, ordered, tangents, cyclic)
 
-        for i, coord in enumerate(vertices):
-            spline.points[i].co = (*coord, 1.0)
+        if key is not None:
+            register_shared_curve(curve_data, key)
+        return curve_data
+
+    def link_curve_object(self, name: str, curve_data: Curve, context: Context,
+                          deselect: bool = True, tube: bool = True) -> Object:
+        """
+        Crée l'objet, le lie à la collection active, le sélectionne et ajoute le tube.
+
+        Args:
+            name: Nom de l'objet
+            curve_data: Datablock courbe (ou maillage) rempli
+            context: Contexte Blender
+            deselect: Désélectionne les autres objets avant la sélection
+            tube: Ajoute le modificateur de tube (courbes uniquement)
 
+        Returns:
+            Objet créé
+        """
         obj: Object = bpy.data.objects.new(name, curve_data)
 
         # ✅ AMÉLIORATION: Gestion moderne des collections
@@ -411,60 +1387,230 @@ class PLAN_CURVES_OT_generate_curve(Operator):
 
         # ✅ AMÉLIORATION: Sélection et activation modernes
         # Désélectionner tous les objets d'abord
-        try:
-            bpy.ops.object.select_all(action='DESELECT')
-        except:
-            # Méthode alternative si l'opérateur n'est pas disponible
-            for o in context.selected_objects:
-                o.select_set(False)
+        if deselect:
+            try:
+                bpy.ops.object.select_all(action='DESELECT')
+            except:
+                # Méthode alternative si l'opérateur n'est pas disponible
+                for o in context.selected_objects:
+                    o.select_set(False)
 
         # Sélectionner et activer le nouvel objet
         obj.select_set(True)
         context.view_layer.objects.active = obj
 
         # Ajouter les geometry nodes
-        self.add_geometry_nodes(obj)
+        if tube:
+            self.add_geometry_nodes(obj)
 
+        self.stamp(obj, context)
         return obj
 
-    def generate_explicit(self, context: Context, props) -> OperatorReturn:
+    def stamp(self, obj: Object, context: Context) -> None:
         """
-        Génère une courbe explicite y = f(x).
+        Enregistre la recette de la génération en cours sur un objet créé.
+
+        Args:
+            obj: Objet créé
+            context: Contexte Blender
+        """
+        if getattr(self, 'recipe', None) is None:
+            # Appel hors de execute() : recette prise sur la scène
+            self.recipe = snapshot_recipe(context.scene.plan_curves_props)
+            self.recipe_group = uuid.uuid4().hex
+            self.recipe_part = 0
+        stamp_object(obj, self.recipe, self.recipe_group, self.recipe_part)
+        self.recipe_part += 1
+        if hasattr(self, 'created_objects'):
+            self.created_objects.append(obj)
+
+    def create_curve_object(self, name: str, vertices: VertexList, context: Context,
+                            ordered: bool = True,
+                            tangents: Optional[np.ndarray] = None,
+                            deselect: bool = True) -> Object:
+        """
+        Crée un objet courbe à partir d'une liste de vertices.
+        ✅ VERSION OPTIMISÉE POUR BLENDER 4.4.3
 
         Args:
+            name: Nom de l'objet courbe
+            vertices: Liste (ou tableau (N, 3)) des points de la courbe
             context: Contexte Blender
+            ordered: Les points forment une polyligne (simplification et Bézier permis)
+            tangents: Tangentes analytiques (N, 3) pour le mode Bézier
+            deselect: Désélectionne les autres objets avant la sélection
+
+        Returns:
+            Objet courbe créé
+        """
+        props = context.scene.plan_curves_props
+
+        curve_data: Curve = self.new_curve_data(
+            name, [(vertices_to_array(vertices), ordered, tangents, False)], props
+        )
+        return self.link_curve_object(name, curve_data, context, deselect)
+
+    def create_curve_family(self, name: str, members: List[CurveMember],
+                            context: Context) -> List[Object]:
+        """
+        Crée les courbes d'une famille : plusieurs splines d'un même datablock,
+        ou un objet par membre partageant le même node group de tube.
+
+        Args:
+            name: Nom de base
+            members: Membres (valeur du paramètre, points, tangentes)
+            context: Contexte Blender
+
+        Returns:
+            Objets créés
+        """
+        props = context.scene.plan_curves_props
+        parameter: str = props.sweep_parameter.strip()
+
+        if props.sweep_output == 'SPLINES':
+            curve_data: Curve = self.new_curve_data(
+                name, [(points, True, tangents, False) for _, points, tangents in members], props
+            )
+
+            obj: Object = self.link_curve_object(name, curve_data, context)
+            obj["sweep_parameter"] = parameter
+            obj["sweep_values"] = [value for value, _, _ in members]
+            return [obj]
+
+        objects: List[Object] = []
+        for index, (value, points, tangents) in enumerate(members):
+            obj = self.create_curve_object(f"{name}_{index:03d}", points, context,
+                                           tangents=tangents, deselect=(index == 0))
+            obj["sweep_parameter"] = parameter
+            obj["sweep_value"] = value
+            objects.append(obj)
+        return objects
+
+    def sweep_arguments(self, props) -> Tuple[Tuple[Symbol, ...], Tuple[NDArrayFloat, ...],
+                                              Optional[NDArrayFloat]]:
+        """
+        Prépare le paramètre de balayage d'une famille de courbes.
+
+        Args:
             props: Propriétés de l'addon
 
         Returns:
-            Statut d'exécution
+            Tuple (symboles, valeurs en colonne (M, 1), valeurs (M,) ou None)
         """
-        if sp is None:
-            return {'CANCELLED'}
+        if not props.sweep_enabled or not props.sweep_parameter.strip():
+            return (), (), None
 
-        x: Symbol = sp.symbols('x')
-        f: Expr = sp.sympify(props.equation1)
-        f_lambd: Callable = sp.lambdify(x, f, modules=['numpy'])
+        symbol: Symbol = sp.Symbol(props.sweep_parameter.strip())
+        values: NDArrayFloat = np.linspace(props.sweep_min, props.sweep_max, props.sweep_count)
+        return (symbol,), (values[:, None],), values
 
-        x_vals: NDArrayFloat = np.linspace(props.x_min, props.x_max, props.resolution)
-        y_vals: NDArrayFloat = f_lambd(x_vals)
+    def emit_curves(self, context: Context, name: str, label: str,
+                    x_vals: NDArrayFloat, y_vals: NDArrayFloat,
+                    tangents: Optional[Tuple[NDArrayFloat, NDArrayFloat]],
+                    sweep_values: Optional[NDArrayFloat]) -> OperatorReturn:
+        """
+        Filtre les échantillons non finis et crée la courbe ou la famille.
+
+        Les points non finis sont retirés et leurs voisins finis reliés,
+        comme le fait animation.write_points à chaque image.
 
-        verts: VertexList = [
-            (float(xv), float(yv), 0.0)
-            for xv, yv in zip(x_vals, y_vals)
-            if np.isfinite(yv)
-        ]
+        Args:
+            context: Contexte Blender
+            name: Nom de l'objet
+            label: Libellé pour le rapport
+            x_vals: Abscisses (M, N)
+            y_vals: Ordonnées (M, N)
+            tangents: Composantes (tx, ty) des tangentes (M, N), ou None
+            sweep_values: Valeurs du paramètre (M,), None hors famille
 
-        if len(verts) < 2:
+        Returns:
+            Statut d'exécution
+        """
+        x_vals, y_vals = np.broadcast_arrays(np.atleast_2d(x_vals), np.atleast_2d(y_vals))
+        self.sample_total += x_vals.size
+        mask: NDArrayFloat = np.isfinite(x_vals) & np.isfinite(y_vals)
+
+        if tangents is not None:
+            tx, ty = np.broadcast_arrays(*tangents)
+
+        members: List[CurveMember] = []
+        for row in range(x_vals.shape[0]):
+            valid = mask[row]
+            if np.count_nonzero(valid) < 2:
+                continue
+            count: int = np.count_nonzero(valid)
+            points: NDArrayFloat = BUFFER_POOL.take((count, 3))
+            points[:, 0] = x_vals[row][valid]
+            points[:, 1] = y_vals[row][valid]
+            points[:, 2] = 0.0
+            member_tangents: Optional[NDArrayFloat] = None
+            if tangents is not None:
+                member_tangents = BUFFER_POOL.take((count, 3))
+                member_tangents[:, 0] = tx[row][valid]
+                member_tangents[:, 1] = ty[row][valid]
+                member_tangents[:, 2] = 0.0
+            value: float = float(sweep_values[row]) if sweep_values is not None else 0.0
+            members.append((value, points, member_tangents))
+
+        if not members:
             self.report({'ERROR'}, get_text('not_enough_points'))
             return {'CANCELLED'}
 
-        self.create_curve_object("Courbe_Explicite", verts, context)
-        self.report({'INFO'}, f"Courbe explicite créée ({len(verts)} points)")
+        if sweep_values is None:
+            _, points, member_tangents = members[0]
+            self.create_curve_object(name, points, context, tangents=member_tangents)
+            self.report({'INFO'}, f"{label} créée ({len(points)} points)")
+            return {'FINISHED'}
+
+        self.create_curve_family(name, members, context)
+        total: int = sum(len(points) for _, points, _ in members)
+        self.report({'INFO'}, (
+            f"{label}: {get_text('curve_family')} {len(members)} "
+            f"({total} points)"
+        ))
         return {'FINISHED'}
 
-    def generate_parametric(self, context: Context, props) -> OperatorReturn:
+    def uses_analytic_speed(self, props) -> bool:
         """
-        Génère une courbe paramétrique x(t), y(t).
+        Indique si la longueur d'arc doit être intégrée depuis |r'(t)| analytique.
+
+        Args:
+            props: Propriétés de l'addon
+
+        Returns:
+            True si le rééchantillonnage utilise la dérivée symbolique
+        """
+        return props.sampling_mode == 'ARC_LENGTH' and props.arc_length_analytic
+
+    def arc_length_samples(self, props, position_fn: Callable,
+                           speed_fn: Optional[Callable] = None) -> NDArrayFloat:
+        """
+        Calcule des paramètres répartis uniformément en longueur d'arc.
+
+        La courbe est d'abord échantillonnée finement ; la longueur cumulée
+        (cordes, ou intégrale de la vitesse analytique) est ensuite inversée
+        par interpolation pour placer exactement props.resolution points.
+
+        Args:
+            props: Propriétés de l'addon
+            position_fn: Fonction t -> points (..., M, 2)
+            speed_fn: Fonction t -> |r'(t)| (..., M), optionnelle
+
+        Returns:
+            Paramètres (K, resolution), une ligne par membre de la famille
+        """
+        dense: NDArrayFloat = np.linspace(
+            props.t_min, props.t_max, props.resolution * ARC_LENGTH_OVERSAMPLING
+        )
+        if speed_fn is not None:
+            cumulative: NDArrayFloat = cumulative_speed_integral(speed_fn(dense), dense)
+        else:
+            cumulative = cumulative_arc_length(position_fn(dense))
+        return np.atleast_2d(arc_length_parameters(dense, cumulative, props.resolution))
+
+    def generate_explicit(self, context: Context, props) -> OperatorReturn:
+        """
+        Génère une courbe explicite y = f(x).
 
         Args:
             context: Contexte Blender
@@ -476,30 +1622,78 @@ class PLAN_CURVES_OT_generate_curve(Operator):
         if sp is None:
             return {'CANCELLED'}
 
-        t: Symbol = sp.symbols('t')
-        fx: Expr = sp.sympify(props.equation1)
-        fy: Expr = sp.sympify(props.equation2)
+        params, args, sweep_values = self.sweep_arguments(props)
 
-        fx_lambd: Callable = sp.lambdify(t, fx, modules=['numpy'])
-        fy_lambd: Callable = sp.lambdify(t, fy, modules=['numpy'])
+        x: Symbol = sp.symbols('x')
+        f: Expr = self.parse_equation(props.equation1)
+        f_lambd: Callable = self.compile((x, *params), f)
 
-        t_vals: NDArrayFloat = np.linspace(props.t_min, props.t_max, props.resolution)
-        x_vals: NDArrayFloat = fx_lambd(t_vals)
-        y_vals: NDArrayFloat = fy_lambd(t_vals)
+        # Une seule évaluation diffusée (1, N) x (M, 1) pour toute la famille
+        x_vals: NDArrayFloat = np.linspace(props.x_min, props.x_max, props.resolution)[None, :]
+        y_vals: NDArrayFloat = evaluate_on(f_lambd, x_vals, *args)
 
-        verts: VertexList = [
-            (float(xv), float(yv), 0.0)
-            for xv, yv in zip(x_vals, y_vals)
-            if np.isfinite(xv) and np.isfinite(yv)
-        ]
+        # Tangentes analytiques (1, f'(x)) pour l'ajustement Bézier
+        tangents: Optional[Tuple[NDArrayFloat, NDArrayFloat]] = None
+        if props.output_mode == 'BEZIER':
+            df_lambd: Optional[Callable] = lambdify_derivative(f, x, params, self.compile)
+            if df_lambd is not None:
+                tangents = (np.ones_like(y_vals), evaluate_on(df_lambd, x_vals, *args))
 
-        if len(verts) < 2:
-            self.report({'ERROR'}, get_text('not_enough_points'))
+        return self.emit_curves(context, "Courbe_Explicite", "Courbe explicite",
+                                x_vals, y_vals, tangents, sweep_values)
+
+    def generate_parametric(self, context: Context, props) -> OperatorReturn:
+        """
+        Génère une courbe paramétrique x(t), y(t).
+
+        Args:
+            context: Contexte Blender
+            props: Propriétés de l'addon
+
+        Returns:
+            Statut d'exécution
+        """
+        if sp is None:
             return {'CANCELLED'}
 
-        self.create_curve_object("Courbe_Parametrique", verts, context)
-        self.report({'INFO'}, f"Courbe paramétrique créée ({len(verts)} points)")
-        return {'FINISHED'}
+        params, args, sweep_values = self.sweep_arguments(props)
+
+        t: Symbol = sp.symbols('t')
+        fx: Expr = self.parse_equation(props.equation1)
+        fy: Expr = self.parse_equation(props.equation2)
+
+        fx_lambd: Callable = self.compile((t, *params), fx)
+        fy_lambd: Callable = self.compile((t, *params), fy)
+
+        # Dérivées symboliques : tangentes Bézier et vitesse |r'(t)|
+        dx_lambd: Optional[Callable] = None
+        dy_lambd: Optional[Callable] = None
+        if props.output_mode == 'BEZIER' or self.uses_analytic_speed(props):
+            dx_lambd = lambdify_derivative(fx, t, params, self.compile)
+            dy_lambd = lambdify_derivative(fy, t, params, self.compile)
+        has_derivatives: bool = dx_lambd is not None and dy_lambd is not None
+
+        t_vals: NDArrayFloat = np.linspace(props.t_min, props.t_max, props.resolution)[None, :]
+        if props.sampling_mode == 'ARC_LENGTH':
+            t_vals = self.arc_length_samples(
+                props,
+                lambda tv: np.stack((evaluate_on(fx_lambd, tv, *args),
+                                     evaluate_on(fy_lambd, tv, *args)), axis=-1),
+                (lambda tv: np.hypot(evaluate_on(dx_lambd, tv, *args),
+                                     evaluate_on(dy_lambd, tv, *args)))
+                if has_derivatives and self.uses_analytic_speed(props) else None
+            )
+
+        x_vals: NDArrayFloat = evaluate_on(fx_lambd, t_vals, *args)
+        y_vals: NDArrayFloat = evaluate_on(fy_lambd, t_vals, *args)
+
+        # Tangentes analytiques (x'(t), y'(t)) pour l'ajustement Bézier
+        tangents: Optional[Tuple[NDArrayFloat, NDArrayFloat]] = None
+        if props.output_mode == 'BEZIER' and has_derivatives:
+            tangents = (evaluate_on(dx_lambd, t_vals, *args), evaluate_on(dy_lambd, t_vals, *args))
+
+        return self.emit_curves(context, "Courbe_Parametrique", "Courbe paramétrique",
+                                x_vals, y_vals, tangents, sweep_values)
 
     def generate_polar(self, context: Context, props) -> OperatorReturn:
         """
@@ -515,28 +1709,281 @@ class PLAN_CURVES_OT_generate_curve(Operator):
         if sp is None:
             return {'CANCELLED'}
 
+        params, args, sweep_values = self.sweep_arguments(props)
+
         theta: Symbol = sp.symbols('theta')
-        fr: Expr = sp.sympify(props.equation1)
-        fr_lambd: Callable = sp.lambdify(theta, fr, modules=['numpy'])
+        fr: Expr = self.parse_equation(props.equation1)
+        fr_lambd: Callable = self.compile((theta, *params), fr)
+
+        # Dérivée symbolique : tangentes Bézier et vitesse sqrt(r² + r'²)
+        dr_lambd: Optional[Callable] = None
+        if props.output_mode == 'BEZIER' or self.uses_analytic_speed(props):
+            dr_lambd = lambdify_derivative(fr, theta, params, self.compile)
+
+        # Table (θ, cos θ, sin θ) partagée entre générations de même intervalle
+        theta_table, cos_vals, sin_vals = trig_table(props.t_min, props.t_max, props.resolution)
+        theta_vals: NDArrayFloat = theta_table[None, :]
+        cos_vals, sin_vals = cos_vals[None, :], sin_vals[None, :]
+        if props.sampling_mode == 'ARC_LENGTH':
+            def polar_points(tv: NDArrayFloat) -> NDArrayFloat:
+                rv = evaluate_on(fr_lambd, tv, *args)
+                return np.stack((rv * np.cos(tv), rv * np.sin(tv)), axis=-1)
+
+            theta_vals = self.arc_length_samples(
+                props,
+                polar_points,
+                (lambda tv: np.hypot(evaluate_on(fr_lambd, tv, *args),
+                                     evaluate_on(dr_lambd, tv, *args)))
+                if dr_lambd is not None and self.uses_analytic_speed(props) else None
+            )
+
+            # Angles propres à chaque membre : tables recalculées dans la réserve
+            cos_vals = np.cos(theta_vals, out=BUFFER_POOL.take(theta_vals.shape))
+            sin_vals = np.sin(theta_vals, out=BUFFER_POOL.take(theta_vals.shape))
+
+        r_vals: NDArrayFloat = evaluate_on(fr_lambd, theta_vals, *args)
+        x_vals: NDArrayFloat = np.multiply(r_vals, cos_vals, out=BUFFER_POOL.take(r_vals.shape))
+        y_vals: NDArrayFloat = np.multiply(r_vals, sin_vals, out=BUFFER_POOL.take(r_vals.shape))
+
+        # Tangentes analytiques (r' cos θ - r sin θ, r' sin θ + r cos θ)
+        tangents: Optional[Tuple[NDArrayFloat, NDArrayFloat]] = None
+        if props.output_mode == 'BEZIER' and dr_lambd is not None:
+            dr_vals: NDArrayFloat = evaluate_on(dr_lambd, theta_vals, *args)
+            tx: NDArrayFloat = np.multiply(dr_vals, cos_vals, out=BUFFER_POOL.take(r_vals.shape))
+            ty: NDArrayFloat = np.multiply(dr_vals, sin_vals, out=BUFFER_POOL.take(r_vals.shape))
+            tangents = (np.subtract(tx, y_vals, out=tx), np.add(ty, x_vals, out=ty))
+
+        return self.emit_curves(context, "Courbe_Polaire", "Courbe polaire",
+                                x_vals, y_vals, tangents, sweep_values)
+
+    def refine_crossings(self, points: NDArrayFloat, F: Expr, variables: Tuple[Symbol, Symbol],
+                         f_lambd: Callable, level: float, cell_size: float,
+                         props) -> NDArrayFloat:
+        """
+        Projette les points de passage sur F = level par quelques pas de Newton.
 
-        theta_vals: NDArrayFloat = np.linspace(props.t_min, props.t_max, props.resolution)
-        r_vals: NDArrayFloat = fr_lambd(theta_vals)
+        Le gradient est dérivé symboliquement puis compilé une seule fois ;
+        les pas sont bornés par la taille de cellule de la grille.
 
-        x_vals: NDArrayFloat = r_vals * np.cos(theta_vals)
-        y_vals: NDArrayFloat = r_vals * np.sin(theta_vals)
+        Args:
+            points: Points de passage (N, 2)
+            F: Expression SymPy de F(x, y)
+            variables: Symboles (x, y)
+            f_lambd: F(x, y) compilée
+            level: Valeur de la ligne de niveau
+            cell_size: Pas de grille
+            props: Propriétés de l'addon
 
-        verts: VertexList = [
-            (float(xv), float(yv), 0.0)
-            for xv, yv in zip(x_vals, y_vals)
-            if np.isfinite(xv) and np.isfinite(yv)
-        ]
+        Returns:
+            Points projetés (N, 2), ou inchangés si le gradient est indisponible
+        """
+        grad_lambd: Optional[Tuple[Callable, Callable]] = lambdify_gradient(F, variables, self.compile)
+        if grad_lambd is None:
+            return points
+
+        gx_lambd, gy_lambd = grad_lambd
+        projected, before, after = newton_project(
+            points,
+            lambda xv, yv: evaluate_on(f_lambd, xv, yv),
+            lambda xv, yv: (evaluate_on(gx_lambd, xv, yv), evaluate_on(gy_lambd, xv, yv)),
+            level, props.newton_steps, cell_size
+        )
+        self.report({'INFO'}, f"{get_text('newton_refine')}: |F| max {before:.2e} → {after:.2e}")
+        return projected
 
-        if len(verts) < 2:
-            self.report({'ERROR'}, get_text('not_enough_points'))
+    def create_contour_objects(self, name: str, contours: List[ContourLevel],
+                               context: Context) -> List[Object]:
+        """
+        Crée les lignes de niveau : un datablock commun ou un objet par niveau.
+
+        Les valeurs de niveau sont stockées en propriétés personnalisées.
+
+        Args:
+            name: Nom de base
+            contours: Niveaux (valeur, polylignes (points, fermée))
+            context: Contexte Blender
+
+        Returns:
+            Objets créés
+        """
+        props = context.scene.plan_curves_props
+
+        if props.contour_output == 'SPLINES':
+            curve_data: Curve = self.new_curve_data(
+                name, [(points, True, None, closed)
+                       for _, polylines in contours for points, closed in polylines], props
+            )
+            spline_levels: List[float] = [level for level, polylines in contours for _ in polylines]
+
+            obj: Object = self.link_curve_object(name, curve_data, context)
+            obj["contour_levels"] = [level for level, _ in contours]
+            obj["contour_spline_levels"] = spline_levels
+            return [obj]
+
+        objects: List[Object] = []
+        for index, (level, polylines) in enumerate(contours):
+            curve_data = self.new_curve_data(
+                f"{name}_{index:03d}", [(points, True, None, closed) for points, closed in polylines], props
+            )
+
+            obj = self.link_curve_object(f"{name}_{index:03d}", curve_data, context,
+                                         deselect=(index == 0))
+            obj["contour_level"] = level
+            objects.append(obj)
+        return objects
+
+    def evaluate_implicit_grid(self, F: Expr, variables: Tuple[Symbol, Symbol], f_lambd: Callable,
+                               x_vals: NDArrayFloat, y_vals: NDArrayFloat,
+                               levels: NDArrayFloat, props) -> NDArrayFloat:
+        """
+        Évalue F sur la grille, en écartant d'abord les zones sans solution.
+
+        Avec l'élagage par intervalles, seules les tuiles dont l'encadrement
+        contient un des niveaux sont échantillonnées ; les autres reçoivent
+        une valeur de remplissage du bon côté de chaque niveau.
+
+        Args:
+            F: Expression SymPy
+            variables: Symboles (x, y)
+            f_lambd: F lambdifiée
+            x_vals: Abscisses (nx,)
+            y_vals: Ordonnées (ny,)
+            levels: Niveaux recherchés
+            props: Propriétés de l'addon
+
+        Returns:
+            Valeurs Z de forme (ny, nx)
+        """
+        # Débit mesuré par point de grille, élagué ou non, comme l'estime AUTO
+        self.sample_total += len(x_vals) * len(y_vals)
+        if not props.interval_culling:
+            return evaluate_grid(f_lambd, x_vals, y_vals)
+
+        try:
+            candidates, Z, culled = cull_grid(F, variables, x_vals, y_vals, levels)
+        except NotImplementedError as e:
+            print(f"⚠️ Élagage par intervalles impossible: {e}")
+            return evaluate_grid(f_lambd, x_vals, y_vals)
+
+        evaluated: int = evaluate_grid_masked(f_lambd, x_vals, y_vals, candidates, Z)
+        self.report({'INFO'}, (
+            f"{get_text('interval_culling')}: {culled:.1%} "
+            f"({evaluated}/{Z.size} points)"
+        ))
+        return Z
+
+    def generate_contours(self, context: Context, props) -> OperatorReturn:
+        """
+        Génère plusieurs lignes de niveau F(x,y) = c depuis une seule évaluation.
+
+        Args:
+            context: Contexte Blender
+            props: Propriétés de l'addon
+
+        Returns:
+            Statut d'exécution
+        """
+        x, y = sp.symbols('x y')
+        F: Expr = self.parse_equation(props.equation1)
+        f_lambd: Callable = self.compile((x, y), F)
+
+        x_vals: NDArrayFloat = np.linspace(props.x_min, props.x_max, props.resolution)
+        y_vals: NDArrayFloat = np.linspace(props.y_min, props.y_max, props.resolution)
+
+        if props.contour_count > 1:
+            levels: NDArrayFloat = np.linspace(
+                props.contour_min, props.contour_max, props.contour_count
+            )
+        else:
+            levels = np.array([props.contour_min])
+
+        Z: NDArrayFloat = self.evaluate_implicit_grid(F, (x, y), f_lambd, x_vals, y_vals, levels, props)
+
+        cell_size: float = max(x_vals[1] - x_vals[0], y_vals[1] - y_vals[0])
+        contours: List[ContourLevel] = []
+        for level in levels:
+            polylines = contour_polylines(x_vals, y_vals, Z, float(level))
+            if props.newton_refine and polylines:
+                # Une seule projection vectorisée pour toutes les polylignes du niveau
+                sizes: List[int] = [len(points) for points, _ in polylines]
+                refined = self.refine_crossings(
+                    np.concatenate([points for points, _ in polylines]),
+                    F, (x, y), f_lambd, float(level), cell_size, props
+                )
+                pieces = np.split(refined, np.cumsum(sizes)[:-1])
+                polylines = [(piece, closed) for piece, (_, closed) in zip(pieces, polylines)]
+
+            polylines = [
+                (np.column_stack((points, np.zeros(len(points)))), closed)
+                for points, closed in polylines
+            ]
+            if polylines:
+                contours.append((float(level), polylines))
+
+        if not contours:
+            self.report({'ERROR'}, get_text('no_curve_detected'))
+            return {'CANCELLED'}
+
+        self.create_contour_objects("Courbe_Niveaux", contours, context)
+        spline_count: int = sum(len(polylines) for _, polylines in contours)
+        self.report({'INFO'}, (
+            f"Lignes de niveau créées ({len(contours)} niveaux, {spline_count} splines)"
+        ))
+        return {'FINISHED'}
+
+    def generate_traced(self, context: Context, props) -> OperatorReturn:
+        """
+        Génère F(x,y) = 0 par suivi prédicteur–correcteur.
+
+        Seul le balayage des graines dépend de l'aire du domaine ; le suivi
+        coûte proportionnellement à la longueur de la courbe. Ses évaluations
+        point par point ne sont pas comptées dans le débit des grilles.
+
+        Args:
+            context: Contexte Blender
+            props: Propriétés de l'addon
+
+        Returns:
+            Statut d'exécution
+        """
+        x, y = sp.symbols('x y')
+        F: Expr = self.parse_equation(props.equation1)
+        # Le suivi évalue point par point : dans le processus, sauf évaluation
+        # isolée (l'évaluateur de la génération reste ouvert entre les appels)
+        compiler: Callable = self.compile if getattr(self, 'sandbox', None) is not None else compile_expression
+        f_lambd: Callable = compiler((x, y), F)
+        grad_lambd: Optional[Tuple[Callable, Callable]] = lambdify_gradient(F, (x, y), compiler)
+        if grad_lambd is None:
+            self.report({'ERROR'}, get_text('no_gradient'))
+            return {'CANCELLED'}
+
+        gx_lambd, gy_lambd = grad_lambd
+        polylines, tracer = trace_implicit_curve(
+            lambda xv, yv: evaluate_on(f_lambd, xv, yv),
+            lambda xv, yv: (evaluate_on(gx_lambd, xv, yv), evaluate_on(gy_lambd, xv, yv)),
+            (props.x_min, props.x_max, props.y_min, props.y_max),
+            props.trace_seed_resolution,
+            props.trace_step
+        )
+
+        if not polylines:
+            self.report({'ERROR'}, get_text('no_curve_detected'))
             return {'CANCELLED'}
 
-        self.create_curve_object("Courbe_Polaire", verts, context)
-        self.report({'INFO'}, f"Courbe polaire créée ({len(verts)} points)")
+        curve_data: Curve = self.new_curve_data("Courbe_Implicite", [
+            (np.column_stack((points, np.zeros(len(points)))), True, None, closed)
+            for points, closed in polylines
+        ], props)
+
+        obj: Object = self.link_curve_object("Courbe_Implicite", curve_data, context)
+        obj["branch_points"] = [coord for point in tracer.branch_points for coord in point]
+
+        point_count: int = sum(len(points) for points, _ in polylines)
+        self.report({'INFO'}, (
+            f"Courbe implicite suivie ({len(polylines)} branches, {point_count} points, "
+            f"{len(tracer.branch_points)} points de branchement, "
+            f"{tracer.evaluations} évaluations)"
+        ))
         return {'FINISHED'}
 
     def generate_implicit(self, context: Context, props) -> OperatorReturn:
@@ -553,32 +2000,114 @@ class PLAN_CURVES_OT_generate_curve(Operator):
         if sp is None:
             return {'CANCELLED'}
 
+        if props.implicit_mode == 'CONTOURS':
+            return self.generate_contours(context, props)
+        if props.implicit_mode == 'TRACE':
+            return self.generate_traced(context, props)
+
         x, y = sp.symbols('x y')
-        F: Expr = sp.sympify(props.equation1)
-        f_lambd: Callable = sp.lambdify((x, y), F, modules=['numpy'])
+        F: Expr = self.parse_equation(props.equation1)
+        f_lambd: Callable = self.compile((x, y), F)
 
         x_vals: NDArrayFloat = np.linspace(props.x_min, props.x_max, 100)
         y_vals: NDArrayFloat = np.linspace(props.y_min, props.y_max, 100)
-        X, Y = np.meshgrid(x_vals, y_vals)
-        Z: NDArrayFloat = f_lambd(X, Y)
-
-        verts: VertexList = []
-        for i in range(X.shape[0]):
-            for j in range(X.shape[1]-1):
-                if np.sign(Z[i,j]) != np.sign(Z[i,j+1]):
-                    t: float = abs(Z[i,j]) / (abs(Z[i,j]) + abs(Z[i,j+1]))
-                    x0: float = X[i,j]*(1-t) + X[i,j+1]*t
-                    y0: float = Y[i,j]*(1-t) + Y[i,j+1]*t
-                    verts.append((float(x0), float(y0), 0.0))
-
-        if len(verts) < 2:
+        Z: NDArrayFloat = self.evaluate_implicit_grid(
+            F, (x, y), f_lambd, x_vals, y_vals, np.zeros(1), props
+        )
+
+        # Changements de signe entre voisins horizontaux, interpolés linéairement
+        left: NDArrayFloat = Z[:, :-1]
+        right: NDArrayFloat = Z[:, 1:]
+        rows, cols = np.nonzero(
+            (np.sign(left) != np.sign(right)) & np.isfinite(left) & np.isfinite(right)
+        )
+        z0: NDArrayFloat = np.abs(left[rows, cols])
+        t: NDArrayFloat = z0 / (z0 + np.abs(right[rows, cols]))
+        crossings: NDArrayFloat = np.column_stack((
+            x_vals[cols] * (1 - t) + x_vals[cols + 1] * t,
+            y_vals[rows],
+        ))
+
+        if len(crossings) < 2:
             self.report({'ERROR'}, get_text('no_curve_detected'))
             return {'CANCELLED'}
 
-        self.create_curve_object("Courbe_Implicite", verts, context)
+        if props.newton_refine:
+            crossings = self.refine_crossings(crossings, F, (x, y), f_lambd, 0.0,
+                                              x_vals[1] - x_vals[0], props)
+
+        verts: NDArrayFloat = np.column_stack((crossings, np.zeros(len(crossings))))
+
+        # Les croisements sont ordonnés par ligne de grille, pas le long de la courbe
+        self.create_curve_object("Courbe_Implicite", verts, context, ordered=False)
         self.report({'INFO'}, f"Courbe implicite créée ({len(verts)} segments)")
         return {'FINISHED'}
 
+    def build_mesh(self, mesh: Mesh, vertices: np.ndarray, faces: np.ndarray) -> Mesh:
+        """
+        Remplit un maillage de quads en quelques appels foreach_set.
+
+        Args:
+            mesh: Maillage vide
+            vertices: Sommets (V, 3) float32
+            faces: Indices des coins (F, 4) int32
+
+        Returns:
+            Le maillage rempli
+        """
+        mesh.vertices.add(len(vertices))
+        mesh.vertices.foreach_set("co", vertices.ravel())
+        mesh.loops.add(faces.size)
+        mesh.loops.foreach_set("vertex_index", faces.ravel())
+        mesh.polygons.add(len(faces))
+        # loop_total est déduit des débuts de faces (lecture seule depuis Blender 4.0)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, faces.size, 4, dtype=np.int32))
+        mesh.update(calc_edges=True)
+        return mesh
+
+    def generate_surface(self, context: Context, props) -> OperatorReturn:
+        """
+        Génère une surface maillée z = f(x, y).
+
+        La grille est évaluée par bandes comme les courbes implicites ; les
+        échantillons non finis deviennent des trous du maillage.
+
+        Args:
+            context: Contexte Blender
+            props: Propriétés de l'addon
+
+        Returns:
+            Statut d'exécution
+        """
+        if sp is None:
+            return {'CANCELLED'}
+
+        x, y = sp.symbols('x y')
+        f: Expr = self.parse_equation(props.equation1)
+        f_lambd: Callable = self.compile((x, y), f)
+
+        x_vals: NDArrayFloat = np.linspace(props.x_min, props.x_max, props.resolution)
+        y_vals: NDArrayFloat = np.linspace(props.y_min, props.y_max, props.resolution)
+        # Les valeurs non réelles (NaN) sont attendues : elles font les trous
+        with np.errstate(all='ignore'):
+            Z: NDArrayFloat = evaluate_grid(f_lambd, x_vals, y_vals)
+        self.sample_total += Z.size
+
+        vertices, faces = surface_mesh(x_vals, y_vals, Z)
+        if len(faces) == 0:
+            self.report({'ERROR'}, get_text('not_enough_points'))
+            return {'CANCELLED'}
+
+        mesh: Mesh = self.build_mesh(bpy.data.meshes.new("Surface"), vertices, faces)
+        self.link_curve_object("Surface", mesh, context, tube=False)
+
+        holes: int = (len(x_vals) - 1) * (len(y_vals) - 1) - len(faces)
+        self.report({'INFO'}, (
+            f"Surface créée ({len(vertices)} sommets, {len(faces)} faces"
+            f"{f', {holes} trous' if holes else ''})"
+        ))
+        return {'FINISHED'}
+
 # Classes à enregistrer
 classes: Tuple[type, ...] = (
     PLAN_CURVES_OT_refresh_presets,
@@ -588,6 +2117,7 @@ classes: Tuple[type, ...] = (
     PLAN_CURVES_OT_validate_params,
     PLAN_CURVES_OT_generate_curve,
     PLAN_CURVES_OT_clean_scene,
+    PLAN_CURVES_OT_regenerate_all,
 )
 
 def register() -> None:
@@ -599,3 +2129,4 @@ def unregister() -> None:
     """Désenregistre les classes du module operators."""
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    BUFFER_POOL.clear()
@@ -11,8 +11,9 @@ if TYPE_CHECKING:
 import bpy
 from bpy.types import Panel
 
-from .preset_manager import SimplePresetManager, PresetData
+from .preset_manager import SimplePresetManager, PresetRecord
 from .preferences import get_text, SYMPY_AVAILABLE
+from .animation import ANIMATION_KEY
 
 class PLAN_CURVES_PT_main(Panel):
     """Panneau principal avec annotations complètes."""
@@ -49,7 +50,8 @@ class PLAN_CURVES_PT_main(Panel):
             'EXPLICIT': [("y =", "equation1")],
             'PARAMETRIC': [("x(t) =", "equation1"), ("y(t) =", "equation2")],
             'POLAR': [("r(θ) =", "equation1")],
-            'IMPLICIT': [("F(x,y) = 0", "equation1")]
+            'IMPLICIT': [("F(x,y) = 0", "equation1")],
+            'SURFACE': [("z =", "equation1")],
         }
 
         if props.curve_type in equation_configs:
@@ -59,26 +61,42 @@ class PLAN_CURVES_PT_main(Panel):
         # Paramètres
         self._draw_parameters_section(layout, props)
 
+        # Famille de courbes / lignes de niveau
+        if props.curve_type == 'IMPLICIT':
+            self._draw_contour_section(layout, props)
+        elif props.curve_type != 'SURFACE':
+            self._draw_sweep_section(layout, props)
+
+        # Post-traitement (courbes uniquement)
+        if props.curve_type != 'SURFACE':
+            self._draw_post_processing_section(layout, props)
+
         # Validation
         self._draw_validation_section(layout, props)
 
         # Génération
         self._draw_generation_section(layout)
 
+        # Animation de l'objet actif
+        self._draw_animation_section(layout, context)
+
         # === BOUTON NETTOYAGE DE SCÈNE (NOUVEAU) ===
         layout.separator()
-        layout.operator("plan_curves.clean_scene", icon='TRASH')
+        row: UILayout = layout.row(align=True)
+        row.operator("plan_curves.clean_scene", icon='TRASH')
+        row.operator("plan_curves.clean_scene", text="", icon='VIEWZOOM').dry_run = True
+        layout.operator("plan_curves.regenerate_all", text=get_text('regenerate_all'), icon='FILE_REFRESH')
 
     def _draw_parameters_section(self, layout: UILayout, props) -> None:
         param_box: UILayout = layout.box()
         param_box.label(text=get_text('parameters'), icon='SETTINGS')
 
-        if props.curve_type in ['EXPLICIT', 'IMPLICIT']:
+        if props.curve_type in ['EXPLICIT', 'IMPLICIT', 'SURFACE']:
             col: UILayout = param_box.column(align=True)
             col.prop(props, "x_min")
             col.prop(props, "x_max")
 
-        if props.curve_type == 'IMPLICIT':
+        if props.curve_type in ['IMPLICIT', 'SURFACE']:
             col = param_box.column(align=True)
             col.prop(props, "y_min")
             col.prop(props, "y_max")
@@ -92,7 +110,66 @@ class PLAN_CURVES_PT_main(Panel):
                 col.prop(props, "t_min")
                 col.prop(props, "t_max")
 
-        param_box.prop(props, "resolution", text=get_text('resolution'))
+            param_box.prop(props, "sampling_mode", text=get_text('sampling'))
+            if props.sampling_mode == 'ARC_LENGTH':
+                param_box.prop(props, "arc_length_analytic", text=get_text('analytic_speed'))
+
+        row: UILayout = param_box.row(align=True)
+        sub: UILayout = row.row(align=True)
+        sub.enabled = props.resolution_mode == 'FIXED'
+        sub.prop(props, "resolution", text=get_text('resolution'))
+        row.prop(props, "resolution_mode", text="")
+
+    def _draw_sweep_section(self, layout: UILayout, props) -> None:
+        sweep_box: UILayout = layout.box()
+        sweep_box.prop(props, "sweep_enabled", text=get_text('curve_family'), icon='MOD_ARRAY')
+
+        if props.sweep_enabled:
+            sweep_box.prop(props, "sweep_parameter", text=get_text('sweep_parameter'))
+            col: UILayout = sweep_box.column(align=True)
+            col.prop(props, "sweep_min")
+            col.prop(props, "sweep_max")
+            col.prop(props, "sweep_count", text=get_text('sweep_count'))
+            sweep_box.prop(props, "sweep_output", expand=True)
+
+    def _draw_contour_section(self, layout: UILayout, props) -> None:
+        contour_box: UILayout = layout.box()
+        contour_box.label(text=get_text('contours'), icon='MOD_WAVE')
+        contour_box.prop(props, "implicit_mode", expand=True)
+
+        if props.implicit_mode == 'CONTOURS':
+            col: UILayout = contour_box.column(align=True)
+            col.prop(props, "contour_min")
+            col.prop(props, "contour_max")
+            col.prop(props, "contour_count", text=get_text('contour_count'))
+            contour_box.prop(props, "contour_output", expand=True)
+
+        if props.implicit_mode == 'TRACE':
+            col = contour_box.column(align=True)
+            col.prop(props, "trace_step", text=get_text('trace_step'))
+            col.prop(props, "trace_seed_resolution", text=get_text('seed_grid'))
+            return
+
+        contour_box.prop(props, "interval_culling", text=get_text('interval_culling'))
+        contour_box.prop(props, "newton_refine", text=get_text('newton_refine'))
+        if props.newton_refine:
+            contour_box.prop(props, "newton_steps", text=get_text('iterations'))
+
+    def _draw_post_processing_section(self, layout: UILayout, props) -> None:
+        post_box: UILayout = layout.box()
+        post_box.label(text=get_text('post_processing'), icon='MOD_DECIM')
+        post_box.prop(props, "output_mode", text=get_text('output_mode'), expand=True)
+        post_box.prop(props, "container", text=get_text('container'))
+        post_box.prop(props, "share_geometry", text=get_text('share_geometry'))
+
+        if props.output_mode == 'BEZIER':
+            post_box.prop(props, "bezier_tolerance", text=get_text('max_error'))
+            return
+
+        post_box.prop(props, "simplify_enabled", text=get_text('simplify'))
+        row: UILayout = post_box.row()
+        row.enabled = props.simplify_enabled
+        row.prop(props, "simplify_tolerance", text=get_text('tolerance'))
 
     def _draw_validation_section(self, layout: UILayout, props) -> None:
         val_box: UILayout = layout.box()
@@ -118,6 +195,22 @@ class PLAN_CURVES_PT_main(Panel):
         row.operator("plan_curves.generate_curve",
                     text=get_text('generate_curve'),
                     icon='CURVE_DATA')
+        row = layout.row(align=True)
+        row.operator("plan_curves.import_points", text=get_text('import_points'), icon='IMPORT')
+        export: UILayout = row.row(align=True)
+        export.enabled = SYMPY_AVAILABLE
+        export.operator("plan_curves.export_curves", text=get_text('export_curves'), icon='EXPORT')
+
+    def _draw_animation_section(self, layout: UILayout, context: Context) -> None:
+        obj = context.active_object
+        if obj is None or ANIMATION_KEY not in obj:
+            return
+        anim_box: UILayout = layout.box()
+        anim_box.label(text=f"{get_text('animated_curve')}: {obj[ANIMATION_KEY]}", icon='ANIM')
+        row: UILayout = anim_box.row(align=True)
+        row.operator("plan_curves.bake_animation", text=get_text('bake_cache'), icon='DISK_DRIVE').target = 'CACHE'
+        row.operator("plan_curves.bake_animation", text=get_text('bake_shape_keys'), icon='SHAPEKEY_DATA').target = 'SHAPE_KEYS'
+        row.operator("plan_curves.bake_animation", text="", icon='X').target = 'LIVE'
 
 
 class PLAN_CURVES_PT_presets(Panel):
@@ -170,7 +263,7 @@ class PLAN_CURVES_PT_presets(Panel):
             op = row.operator("plan_curves.load_preset_simple",
                             text=name, icon='IMPORT')
             op.preset_name = name
-            preset_data: Optional[PresetData] = manager.get_preset_by_name(curve_type, name)
+            preset_data: Optional[PresetRecord] = manager.get_preset_by_name(curve_type, name)
             if preset_data and preset_data.get('editable', False):
                 op_del = row.operator("plan_curves.delete_preset_simple",
                                     text="", icon='TRASH')
@@ -195,7 +288,7 @@ class PLAN_CURVES_PT_presets(Panel):
     def draw_preset_details(self, parent_layout: UILayout, props,
                            manager: SimplePresetManager) -> None:
         try:
-            preset_data: Optional[PresetData] = manager.get_preset_by_name(
+            preset_data: Optional[PresetRecord] = manager.get_preset_by_name(
                 props.curve_type, props.selected_preset
             )
 
@@ -43,6 +43,18 @@ def get_addon_preferences() -> Optional[PLAN_CURVES_AddonPreferences]:
     except (KeyError, AttributeError):
         return None
 
+def get_eval_server_path() -> Optional[str]:
+    """
+    Chemin du socket du serveur d'évaluation choisi dans les préférences.
+
+    Returns:
+        Chemin absolu, ou None pour le chemin par défaut
+    """
+    prefs: Optional[PLAN_CURVES_AddonPreferences] = get_addon_preferences()
+    if prefs and getattr(prefs, 'eval_server_socket', ""):
+        return bpy.path.abspath(prefs.eval_server_socket)
+    return None
+
 def get_text(key: str) -> str:
     """
     Récupère le texte traduit selon la langue sélectionnée.
@@ -91,6 +103,64 @@ class PLAN_CURVES_AddonPreferences(AddonPreferences):
         description="Statut de l'installation SymPy"
     )
 
+    # === BAC À SABLE ===
+    use_sandbox: bpy.props.BoolProperty(  # type: ignore
+        name="Évaluation isolée",
+        default=False,
+        description="Analyse et évalue les équations dans un sous-processus propre à chaque génération, "
+                    "pour qu'une expression qui bloque ou sature la mémoire n'arrête pas Blender"
+    )
+
+    sandbox_timeout: bpy.props.FloatProperty(  # type: ignore
+        name="Délai",
+        default=10.0,
+        min=0.5,
+        max=600.0,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE',
+        description="Durée maximale de l'ensemble des évaluations isolées d'une génération (secondes)"
+    )
+
+    sandbox_memory: bpy.props.IntProperty(  # type: ignore
+        name="Mémoire (Mo)",
+        default=2048,
+        min=128,
+        max=65536,
+        description="Mémoire maximale du sous-processus d'évaluation"
+    )
+
+    # === SERVEUR D'ÉVALUATION ===
+    use_eval_server: bpy.props.BoolProperty(  # type: ignore
+        name="Serveur d'évaluation",
+        default=False,
+        description="Évalue via un serveur local qui garde SymPy chargé et les expressions compilées "
+                    "entre les sessions ; évaluation locale s'il est injoignable"
+    )
+
+    eval_server_socket: bpy.props.StringProperty(  # type: ignore
+        name="Socket",
+        default="",
+        subtype='FILE_PATH',
+        description="Chemin du socket Unix du serveur (vide: chemin par défaut)"
+    )
+
+    # === RÉSOLUTION AUTOMATIQUE ===
+    latency_live: bpy.props.FloatProperty(  # type: ignore
+        name="Aperçu direct (ms)",
+        default=16.0,
+        min=1.0,
+        max=1000.0,
+        description="Durée visée d'une mise à jour d'image des courbes animées en résolution automatique"
+    )
+
+    latency_final: bpy.props.FloatProperty(  # type: ignore
+        name="Génération (ms)",
+        default=500.0,
+        min=10.0,
+        max=60000.0,
+        description="Durée visée d'une génération en résolution automatique"
+    )
+
     def draw(self, context: Context) -> None:
         """
         Dessine l'interface des préférences.
@@ -107,6 +177,32 @@ class PLAN_CURVES_AddonPreferences(AddonPreferences):
 
         layout.separator()
 
+        # === SECTION BAC À SABLE ===
+        sandbox_box: UILayout = layout.box()
+        sandbox_box.label(text=get_text('sandbox'), icon='LOCKED')
+        sandbox_box.prop(self, "use_sandbox", text=get_text('use_sandbox'))
+        if self.use_sandbox:
+            col: UILayout = sandbox_box.column(align=True)
+            col.prop(self, "sandbox_timeout", text=get_text('timeout'))
+            col.prop(self, "sandbox_memory", text=get_text('memory_limit'))
+
+        server_box: UILayout = layout.box()
+        server_box.label(text=get_text('eval_server'), icon='NETWORK_DRIVE')
+        server_box.prop(self, "use_eval_server", text=get_text('use_eval_server'))
+        if self.use_eval_server:
+            server_box.prop(self, "eval_server_socket", text=get_text('socket_path'))
+            server_box.operator("plan_curves.start_eval_server",
+                                text=get_text('start_eval_server'),
+                                icon='PLAY')
+
+        latency_box: UILayout = layout.box()
+        latency_box.label(text=get_text('auto_resolution'), icon='TIME')
+        col = latency_box.column(align=True)
+        col.prop(self, "latency_live", text=get_text('latency_live'))
+        col.prop(self, "latency_final", text=get_text('latency_final'))
+
+        layout.separator()
+
         # === SECTION SYMPY ===
         sympy_box: UILayout = layout.box()
         sympy_box.label(text=get_text('sympy_management'), icon='CONSOLE')
@@ -243,10 +339,45 @@ class PLAN_CURVES_OT_install_sympy(Operator):
         return {'FINISHED'}
 
 # Classes à enregistrer
+class PLAN_CURVES_OT_start_eval_server(Operator):
+    """Démarre le serveur d'évaluation local en arrière-plan."""
+
+    bl_idname: str = "plan_curves.start_eval_server"
+    bl_label: str = "Start Evaluation Server"
+    bl_description: str = "Démarre le serveur d'évaluation local en arrière-plan"
+
+    def execute(self, context: Context) -> Set[str]:
+        """
+        Lance le serveur s'il ne répond pas déjà.
+
+        Args:
+            context: Contexte Blender
+
+        Returns:
+            Statut d'exécution
+        """
+        from .evalserver import EvalServerClient, start_server
+
+        path: Optional[str] = get_eval_server_path()
+        if EvalServerClient(path).ping() is not None:
+            self.report({'INFO'}, get_text('eval_server_running'))
+            return {'FINISHED'}
+
+        try:
+            start_server(path)
+        except OSError as e:
+            self.report({'ERROR'}, f"Erreur: {e}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, get_text('eval_server_started'))
+        return {'FINISHED'}
+
+
 classes: tuple[type, ...] = (
     PLAN_CURVES_AddonPreferences,
     PLAN_CURVES_OT_check_sympy,
     PLAN_CURVES_OT_install_sympy,
+    PLAN_CURVES_OT_start_eval_server,
 )
 
 def register() -> None:
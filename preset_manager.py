@@ -3,7 +3,7 @@
 # ===============================================
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Mapping, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -11,8 +11,10 @@ if TYPE_CHECKING:
 import bpy
 import json
 import os
+import sys
 import numpy as np
 from datetime import datetime
+from types import MappingProxyType
 
 from .preferences import get_text
 
@@ -29,6 +31,113 @@ PresetData = Dict[str, Any]
 PresetCollection = Dict[str, PresetData]
 CurveTypePresets = Dict[str, PresetCollection]
 ValidationResult = Tuple[bool, str]
+PresetView = Mapping[str, "PresetRecord"]  # {nom: preset}, en lecture seule
+
+# Révision des presets : incrémentée à chaque modification, invalide les caches
+_revision: int = 0
+
+
+def presets_revision() -> int:
+    """Révision courante des presets (voir invalidate_presets)."""
+    return _revision
+
+
+def invalidate_presets() -> None:
+    """Signale une modification des presets : les caches dérivés seront reconstruits."""
+    global _revision
+    _revision += 1
+    _merged_views.clear()
+
+
+class PresetRecord:
+    """
+    Preset immuable et compact : un slot par champ connu.
+
+    Se lit comme un dictionnaire (get, [], in, keys) ; un champ absent du
+    preset d'origine reste un slot vide. Catégorie, auteur et source sont
+    des chaînes internées, partagées par tous les presets ; les champs
+    inconnus sont gardés à plat dans 'extra' (clé, valeur, clé, valeur...).
+    """
+
+    FIELDS: Tuple[str, ...] = (
+        'equation1', 'equation2', 'x_min', 'x_max', 'y_min', 'y_max',
+        't_min', 't_max', 'resolution', 'description', 'category',
+        'author', 'created_date',
+    )
+    __slots__ = FIELDS + ('source', 'extra')
+
+    def __init__(self, data: PresetData, source: str) -> None:
+        """
+        Args:
+            data: Preset au format JSON
+            source: 'default' ou 'user'
+        """
+        extra: List[Any] = []
+        for key, value in data.items():
+            if key in PresetRecord.FIELDS:
+                if key in ('category', 'author') and isinstance(value, str):
+                    value = sys.intern(value)
+                object.__setattr__(self, key, value)
+            elif key not in ('source', 'editable'):
+                extra += (key, value)
+        object.__setattr__(self, 'source', sys.intern(source))
+        object.__setattr__(self, 'extra', tuple(extra) if extra else None)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("PresetRecord est immuable")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError("PresetRecord est immuable")
+
+    @property
+    def editable(self) -> bool:
+        """Seuls les presets utilisateur sont modifiables."""
+        return self.source == 'user'
+
+    def keys(self) -> Iterator[str]:
+        """Champs présents, métadonnées 'source' et 'editable' comprises."""
+        for key in PresetRecord.FIELDS:
+            if hasattr(self, key):
+                yield key
+        yield from (self.extra or ())[::2]
+        yield 'source'
+        yield 'editable'
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Valeur d'un champ, comme dict.get."""
+        if key in PresetRecord.FIELDS or key in ('source', 'editable'):
+            return getattr(self, key, default)
+        extra: Tuple[Any, ...] = self.extra or ()
+        for index in range(0, len(extra), 2):
+            if extra[index] == key:
+                return extra[index + 1]
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def to_dict(self) -> PresetData:
+        """Conversion en dictionnaire, pour l'écriture JSON (sans métadonnées)."""
+        data: PresetData = {key: getattr(self, key) for key in PresetRecord.FIELDS if hasattr(self, key)}
+        extra: Tuple[Any, ...] = self.extra or ()
+        data.update(zip(extra[::2], extra[1::2]))
+        return data
+
+    def __repr__(self) -> str:
+        return f"PresetRecord({self.to_dict()!r}, source={self.source!r})"
+
+
+_MISSING = object()
+
+# Vues fusionnées (défaut + utilisateur) par (fichier, type de courbe),
+# construites une fois par révision et partagées en lecture seule
+_merged_views: Dict[Tuple[type, str, str], PresetView] = {}
 
 class SimplePresetManager:
     """Gestionnaire de presets simplifié et stable avec annotations complètes."""
@@ -197,6 +306,32 @@ class SimplePresetManager:
                     "description": "Courbe en huit",
                     "category": "Courbes spéciales"
                 }
+            },
+            "SURFACE": {
+                "Selle": {
+                    "equation1": "(x**2 - y**2)/4",
+                    "x_min": -3.0, "x_max": 3.0,
+                    "y_min": -3.0, "y_max": 3.0,
+                    "resolution": 200,
+                    "description": "Paraboloïde hyperbolique",
+                    "category": "Quadriques"
+                },
+                "Ondes": {
+                    "equation1": "sin(sqrt(x**2 + y**2))/sqrt(x**2 + y**2)",
+                    "x_min": -10.0, "x_max": 10.0,
+                    "y_min": -10.0, "y_max": 10.0,
+                    "resolution": 400,
+                    "description": "Sinus cardinal radial",
+                    "category": "Ondes"
+                },
+                "Demi-sphère": {
+                    "equation1": "sqrt(4 - x**2 - y**2)",
+                    "x_min": -2.0, "x_max": 2.0,
+                    "y_min": -2.0, "y_max": 2.0,
+                    "resolution": 300,
+                    "description": "Hors du disque, les valeurs non réelles laissent un trou",
+                    "category": "Quadriques"
+                }
             }
         }
 
@@ -237,35 +372,43 @@ class SimplePresetManager:
             with open(self.preset_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
+            invalidate_presets()
             return True
         except Exception as e:
             print(f"Erreur sauvegarde: {e}")
             return False
 
-    def get_all_presets(self, curve_type: str) -> PresetCollection:
+    def get_all_presets(self, curve_type: str) -> PresetView:
         """
         Retourne tous les presets (par défaut + utilisateur) pour un type donné.
 
+        La vue est construite une fois, puis partagée jusqu'à la prochaine
+        modification des presets (voir invalidate_presets).
+
         Args:
             curve_type: Type de courbe ('EXPLICIT', 'PARAMETRIC', etc.)
 
         Returns:
-            Dictionnaire de tous les presets avec métadonnées
+            Vue en lecture seule {nom: PresetRecord}
         """
-        presets: PresetCollection = {}
+        key: Tuple[type, str, str] = (type(self), self.preset_file, curve_type)
+        view: Optional[PresetView] = _merged_views.get(key)
+        if view is not None:
+            return view
+
+        presets: Dict[str, PresetRecord] = {}
 
         # Presets par défaut
-        if curve_type in self.default_presets:
-            for name, data in self.default_presets[curve_type].items():
-                presets[name] = {**data, 'source': 'default', 'editable': False}
+        for name, data in self.default_presets.get(curve_type, {}).items():
+            presets[name] = PresetRecord(data, 'default')
 
         # Presets utilisateur
-        user_presets: CurveTypePresets = self.load_user_presets()
-        if curve_type in user_presets:
-            for name, data in user_presets[curve_type].items():
-                presets[name] = {**data, 'source': 'user', 'editable': True}
+        for name, data in self.load_user_presets().get(curve_type, {}).items():
+            presets[name] = PresetRecord(data, 'user')
 
-        return presets
+        view = MappingProxyType(presets)
+        _merged_views[key] = view
+        return view
 
     def get_preset_names(self, curve_type: str) -> List[str]:
         """
@@ -277,10 +420,9 @@ class SimplePresetManager:
         Returns:
             Liste des noms de presets
         """
-        all_presets: PresetCollection = self.get_all_presets(curve_type)
-        return list(all_presets.keys())
+        return list(self.get_all_presets(curve_type))
 
-    def get_preset_by_name(self, curve_type: str, name: str) -> Optional[PresetData]:
+    def get_preset_by_name(self, curve_type: str, name: str) -> Optional[PresetRecord]:
         """
         Récupère un preset par son nom et type de courbe.
 
@@ -289,10 +431,9 @@ class SimplePresetManager:
             name: Nom du preset
 
         Returns:
-            Données du preset ou None si non trouvé
+            Preset (lecture seule) ou None si non trouvé
         """
-        all_presets: PresetCollection = self.get_all_presets(curve_type)
-        return all_presets.get(name)
+        return self.get_all_presets(curve_type).get(name)
 
     def validate_preset_data(self, curve_type: str, data: PresetData) -> ValidationResult:
         """
@@ -309,7 +450,8 @@ class SimplePresetManager:
             'EXPLICIT': ['equation1', 'x_min', 'x_max'],
             'PARAMETRIC': ['equation1', 'equation2', 't_min', 't_max'],
             'POLAR': ['equation1', 't_min', 't_max'],
-            'IMPLICIT': ['equation1', 'x_min', 'x_max', 'y_min', 'y_max']
+            'IMPLICIT': ['equation1', 'x_min', 'x_max', 'y_min', 'y_max'],
+            'SURFACE': ['equation1', 'x_min', 'x_max', 'y_min', 'y_max']
         }
 
         if curve_type not in required_fields:
@@ -341,7 +483,7 @@ class SimplePresetManager:
                     if theta not in expr.free_symbols:
                         return False, "L'équation doit contenir 'theta'"
 
-                elif curve_type == 'IMPLICIT':
+                elif curve_type in ('IMPLICIT', 'SURFACE'):
                     x, y = sp.symbols('x y')
                     expr = sp.sympify(data['equation1'])
                     if not (x in expr.free_symbols or y in expr.free_symbols):
@@ -422,6 +564,77 @@ class SimplePresetManager:
         else:
             return False, get_text('save_error')
 
+def benchmark_preset_library(count: int = 100000, lookups: int = 10000) -> Dict[str, float]:
+    """
+    Mesure mémoire et recherche d'une bibliothèque de count presets utilisateur.
+
+    Compare les PresetRecord partagés aux dictionnaires fusionnés recopiés
+    à chaque appel ; les presets sont simulés en mémoire, aucun fichier
+    n'est écrit.
+
+    Args:
+        count: Nombre de presets simulés
+        lookups: Nombre de recherches par nom mesurées
+
+    Returns:
+        Dictionnaire des mesures (octets et secondes par recherche)
+    """
+    import time
+    import tracemalloc
+
+    library: CurveTypePresets = {'EXPLICIT': {
+        f"Preset_{index:06d}": {
+            'equation1': f"sin({index}*x)", 'x_min': -5.0, 'x_max': 5.0, 'resolution': 200,
+            'description': f"Preset simulé {index}", 'category': "Bibliothèque",
+            'created_date': "2025-01-01T00:00:00", 'author': 'Utilisateur',
+        }
+        for index in range(count)
+    }}
+    names: List[str] = list(library['EXPLICIT'])[::max(count // lookups, 1)][:lookups]
+
+    class SimulatedLibrary(SimplePresetManager):
+        def get_preset_file_path(self) -> str:
+            return ""
+
+        def load_user_presets(self) -> CurveTypePresets:
+            return library
+
+    manager = SimulatedLibrary()
+    invalidate_presets()
+
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    manager.get_all_presets('EXPLICIT')
+    records_bytes: int = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copies = {name: {**data, 'source': 'user', 'editable': True}
+              for name, data in library['EXPLICIT'].items()}
+    dicts_bytes: int = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del copies
+
+    start: float = time.perf_counter()
+    for name in names:
+        manager.get_preset_by_name('EXPLICIT', name)
+    lookup: float = (time.perf_counter() - start) / len(names)
+
+    # Ancien chemin : vue fusionnée recopiée à chaque recherche
+    start = time.perf_counter()
+    for name in names[:10]:
+        {n: {**data, 'source': 'user', 'editable': True}
+         for n, data in library['EXPLICIT'].items()}.get(name)
+    copied_lookup: float = (time.perf_counter() - start) / min(len(names), 10)
+    invalidate_presets()
+
+    print(f"📚 {count} presets: PresetRecord {records_bytes / 1e6:.1f} Mo, "
+          f"dictionnaires {dicts_bytes / 1e6:.1f} Mo ; recherche {lookup * 1e6:.2f} µs "
+          f"(copie fusionnée: {copied_lookup * 1e3:.1f} ms)")
+    return {'records_bytes': records_bytes, 'dicts_bytes': dicts_bytes,
+            'lookup': lookup, 'copied_lookup': copied_lookup}
+
 # ===============================================
 # CONTINUATION DANS LE PROCHAIN MESSAGE...
 # ===============================================
@@ -3,7 +3,7 @@
 # ===============================================
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Tuple, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from bpy.types import Context
@@ -12,13 +12,52 @@ import bpy
 import numpy as np
 from bpy.types import PropertyGroup
 
-from .preset_manager import SimplePresetManager
+from .preset_manager import SimplePresetManager, presets_revision, invalidate_presets
 from .preferences import get_text
 
 # Type alias pour les items d'enum
 EnumItem = Tuple[str, str, str]
 EnumItems = List[EnumItem]
 
+# Items du menu des presets par type de courbe : (révision, libellé, items).
+# Blender garde des pointeurs vers les chaînes renvoyées : les listes
+# restent référencées ici jusqu'à la prochaine modification des presets.
+_preset_items: Dict[str, Tuple[int, str, EnumItems]] = {}
+
+# Items renvoyés en cas d'erreur, gardés en vie comme les autres
+_PRESET_ITEMS_ERROR: EnumItems = [('NONE', 'Erreur', 'Erreur de chargement')]
+
+
+def cached_preset_items(curve_type: str,
+                        manager_factory: Callable[[], SimplePresetManager] = SimplePresetManager
+                        ) -> EnumItems:
+    """
+    Items du menu des presets d'un type, reconstruits seulement si périmés.
+
+    Le cache est invalidé par une modification des presets (révision de
+    preset_manager) ou un changement de langue ; la reconstruction lit
+    les presets une seule fois.
+
+    Args:
+        curve_type: Type de courbe
+        manager_factory: Crée le gestionnaire de presets lu lors d'une reconstruction
+
+    Returns:
+        Liste des items d'enum, identique d'un appel à l'autre
+    """
+    revision: int = presets_revision()
+    label: str = get_text('select_preset')
+    cached = _preset_items.get(curve_type)
+    if cached is not None and cached[0] == revision and cached[1] == label:
+        return cached[2]
+
+    items: EnumItems = [('NONE', label, get_text('no_preset'))]
+    for name, preset_data in manager_factory().get_all_presets(curve_type).items():
+        items.append((name, name, preset_data.get('description', 'Pas de description')))
+    _preset_items[curve_type] = (revision, label, items)
+    return items
+
+
 def get_preset_enum_items(self: PlanCurvesProperties, context: Context) -> EnumItems:
     """
     Items pour le menu des presets - Version sécurisée avec annotations.
@@ -31,23 +70,56 @@ def get_preset_enum_items(self: PlanCurvesProperties, context: Context) -> EnumI
         Liste des items d'enum pour les presets
     """
     try:
-        curve_type: str = getattr(self, 'curve_type', 'EXPLICIT')
-        manager: SimplePresetManager = SimplePresetManager()
-        preset_names: List[str] = manager.get_preset_names(curve_type)
+        return cached_preset_items(getattr(self, 'curve_type', 'EXPLICIT'))
+    except Exception as e:
+        print(f"Erreur get_preset_enum_items: {e}")
+        return _PRESET_ITEMS_ERROR
 
-        items: EnumItems = [('NONE', get_text('select_preset'), get_text('no_preset'))]
 
-        for name in preset_names:
-            preset_data = manager.get_preset_by_name(curve_type, name)
-            if preset_data:
-                desc: str = preset_data.get('description', 'Pas de description')
-                items.append((name, name, desc))
+def benchmark_preset_enum(count: int = 10000, redraws: int = 1000) -> Tuple[float, float]:
+    """
+    Mesure le menu des presets pour une bibliothèque de count presets.
 
-        return items
+    Les presets utilisateur sont simulés en mémoire, aucun fichier n'est
+    écrit ; utilisable sans Blender.
+
+    Args:
+        count: Nombre de presets utilisateur simulés
+        redraws: Nombre d'appels mesurés une fois le cache construit
+
+    Returns:
+        Tuple (construction en s, appel servi par le cache en s)
+    """
+    import time
+
+    library = {'EXPLICIT': {
+        f"Preset_{index:05d}": {'equation1': f"sin({index}*x)", 'x_min': -5.0, 'x_max': 5.0,
+                                'description': f"Preset simulé {index}"}
+        for index in range(count)
+    }}
+
+    class SimulatedLibrary(SimplePresetManager):
+        def get_preset_file_path(self) -> str:
+            return ""
+
+        def load_user_presets(self):
+            return library
+
+    invalidate_presets()
+    start: float = time.perf_counter()
+    items: EnumItems = cached_preset_items('EXPLICIT', SimulatedLibrary)
+    build: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(redraws):
+        cached_preset_items('EXPLICIT', SimulatedLibrary)
+    served: float = (time.perf_counter() - start) / redraws
+    invalidate_presets()
+
+    print(f"⏱️ Menu des presets ({len(items) - 1} presets): construction {build * 1e3:.1f} ms, "
+          f"appel en cache {served * 1e6:.2f} µs")
+    return build, served
 
-    except Exception as e:
-        print(f"Erreur get_preset_enum_items: {e}")
-        return [('NONE', 'Erreur', 'Erreur de chargement')]
 
 class PlanCurvesProperties(PropertyGroup):
     """Propriétés principales simplifiées avec annotations complètes."""
@@ -60,6 +132,7 @@ class PlanCurvesProperties(PropertyGroup):
             ('PARAMETRIC', "Paramétrique (x(t),y(t))", "Courbe paramétrique"),
             ('POLAR', "Polaire (r=f(θ))", "Coordonnées polaires"),
             ('IMPLICIT', "Implicite (F(x,y)=0)", "Équation implicite"),
+            ('SURFACE', "Surface (z=f(x,y))", "Surface maillée sur une grille"),
         ],
         default='EXPLICIT'
     )
@@ -116,8 +189,212 @@ class PlanCurvesProperties(PropertyGroup):
         name="Résolution",
         default=200,
         min=10,
-        max=2000,
-        description="Nombre de points pour la courbe"
+        max=4096,
+        soft_max=2000,
+        description="Nombre de points pour la courbe (par axe pour une surface)"
+    )
+
+    resolution_mode: bpy.props.EnumProperty(  # type: ignore
+        name="Mode de résolution",
+        items=[
+            ('FIXED', "Fixe", "Résolution choisie à la main"),
+            ('AUTO', "Auto", "Plus grande résolution tenant dans la latence cible des préférences, "
+                             "d'après le débit mesuré"),
+        ],
+        default='FIXED'
+    )
+
+    # === FAMILLE DE COURBES ===
+    sweep_enabled: bpy.props.BoolProperty(  # type: ignore
+        name="Famille de courbes",
+        default=False,
+        description="Balaye un paramètre nommé de l'équation en une seule évaluation"
+    )
+
+    sweep_parameter: bpy.props.StringProperty(  # type: ignore
+        name="Paramètre",
+        default="a",
+        description="Nom du paramètre supplémentaire utilisé dans l'équation (ex: a dans a*sin(x))"
+    )
+
+    sweep_min: bpy.props.FloatProperty(  # type: ignore
+        name="Min",
+        default=0.5,
+        description="Première valeur du paramètre"
+    )
+
+    sweep_max: bpy.props.FloatProperty(  # type: ignore
+        name="Max",
+        default=2.0,
+        description="Dernière valeur du paramètre"
+    )
+
+    sweep_count: bpy.props.IntProperty(  # type: ignore
+        name="Nombre",
+        default=10,
+        min=2,
+        max=500,
+        description="Nombre de membres de la famille"
+    )
+
+    sweep_output: bpy.props.EnumProperty(  # type: ignore
+        name="Résultat",
+        items=[
+            ('SPLINES', "Splines", "Une spline par membre dans un seul datablock"),
+            ('OBJECTS', "Objets", "Un objet par membre, tubes partagés"),
+        ],
+        default='SPLINES',
+        description="Organisation des courbes de la famille"
+    )
+
+    # === LIGNES DE NIVEAU (IMPLICITE) ===
+    implicit_mode: bpy.props.EnumProperty(  # type: ignore
+        name="Mode implicite",
+        items=[
+            ('CROSSINGS', "Courbe F = 0", "Points de passage par zéro sur les lignes de la grille"),
+            ('CONTOURS', "Lignes de niveau", "Plusieurs niveaux F = c extraits d'une seule évaluation"),
+            ('TRACE', "Suivi", "Suivi prédicteur–correcteur : coût proportionnel à la longueur de la courbe"),
+        ],
+        default='CROSSINGS',
+        description="Méthode d'extraction des courbes implicites"
+    )
+
+    contour_min: bpy.props.FloatProperty(  # type: ignore
+        name="Niveau min",
+        default=0.0,
+        description="Premier niveau c (seul niveau si le nombre vaut 1)"
+    )
+
+    contour_max: bpy.props.FloatProperty(  # type: ignore
+        name="Niveau max",
+        default=1.0,
+        description="Dernier niveau c"
+    )
+
+    contour_count: bpy.props.IntProperty(  # type: ignore
+        name="Niveaux",
+        default=1,
+        min=1,
+        max=200,
+        description="Nombre de lignes de niveau réparties entre min et max"
+    )
+
+    contour_output: bpy.props.EnumProperty(  # type: ignore
+        name="Résultat",
+        items=[
+            ('SPLINES', "Splines", "Tous les niveaux dans un seul datablock"),
+            ('OBJECTS', "Objets", "Un objet par niveau"),
+        ],
+        default='SPLINES',
+        description="Organisation des lignes de niveau"
+    )
+
+    trace_step: bpy.props.FloatProperty(  # type: ignore
+        name="Pas max",
+        default=0.05,
+        min=1e-5,
+        soft_max=10.0,
+        unit='LENGTH',
+        description="Pas maximal du suivi le long de la courbe"
+    )
+
+    trace_seed_resolution: bpy.props.IntProperty(  # type: ignore
+        name="Grille de départ",
+        default=64,
+        min=8,
+        max=1024,
+        description="Taille de la grille grossière de recherche des points de départ"
+    )
+
+    interval_culling: bpy.props.BoolProperty(  # type: ignore
+        name="Élagage par intervalles",
+        default=False,
+        description="Écarte avant échantillonnage les zones où F ne peut pas s'annuler (arithmétique d'intervalles)"
+    )
+
+    newton_refine: bpy.props.BoolProperty(  # type: ignore
+        name="Projection de Newton",
+        default=False,
+        description="Projette les points de passage sur la courbe exacte avec le gradient symbolique"
+    )
+
+    newton_steps: bpy.props.IntProperty(  # type: ignore
+        name="Itérations",
+        default=3,
+        min=1,
+        max=10,
+        description="Nombre maximal de pas de Newton"
+    )
+
+    # === POST-TRAITEMENT ===
+    output_mode: bpy.props.EnumProperty(  # type: ignore
+        name="Sortie",
+        items=[
+            ('POLY', "Polyligne", "Spline POLY passant par tous les points échantillonnés"),
+            ('BEZIER', "Bézier", "Segments de Bézier cubiques ajustés sous une borne d'erreur"),
+        ],
+        default='POLY',
+        description="Type de spline créée"
+    )
+
+    bezier_tolerance: bpy.props.FloatProperty(  # type: ignore
+        name="Erreur max",
+        default=0.001,
+        min=0.0,
+        soft_max=0.1,
+        precision=4,
+        unit='LENGTH',
+        description="Distance maximale entre les segments de Bézier et les points échantillonnés"
+    )
+
+    simplify_enabled: bpy.props.BoolProperty(  # type: ignore
+        name="Simplifier",
+        default=False,
+        description="Supprime les points redondants avant la création de la courbe (Ramer–Douglas–Peucker)"
+    )
+
+    simplify_tolerance: bpy.props.FloatProperty(  # type: ignore
+        name="Tolérance",
+        default=0.001,
+        min=0.0,
+        soft_max=0.1,
+        precision=4,
+        unit='LENGTH',
+        description="Écart maximal autorisé entre la courbe simplifiée et les points échantillonnés"
+    )
+
+    container: bpy.props.EnumProperty(  # type: ignore
+        name="Conteneur",
+        items=[
+            ('CURVE', "Courbe", "Objet courbe (splines POLY ou Bézier)"),
+            ('MESH', "Maillage d'arêtes", "Maillage d'arêtes, bien plus léger pour des données denses"),
+            ('POINTS', "Nuage de points", "Sommets seuls, convertis en points par Geometry Nodes"),
+            ('AUTO', "Automatique", "Maillage d'arêtes au-delà de 20 000 points, courbe sinon"),
+        ],
+        default='CURVE',
+        description="Type de données de l'objet créé"
+    )
+
+    share_geometry: bpy.props.BoolProperty(  # type: ignore
+        name="Partager la géométrie",
+        default=True,
+        description="Réutilise le datablock d'une courbe identique déjà générée au lieu d'en créer un nouveau"
+    )
+
+    sampling_mode: bpy.props.EnumProperty(  # type: ignore
+        name="Échantillonnage",
+        items=[
+            ('UNIFORM', "Uniforme en t", "Pas constant sur le paramètre"),
+            ('ARC_LENGTH', "Longueur d'arc", "Points équidistants le long de la courbe"),
+        ],
+        default='UNIFORM',
+        description="Répartition des points pour les courbes paramétriques et polaires"
+    )
+
+    arc_length_analytic: bpy.props.BoolProperty(  # type: ignore
+        name="Vitesse analytique",
+        default=True,
+        description="Intègre |r'(t)| obtenu par dérivation SymPy plutôt que les cordes"
     )
 
     # === PRESETS (VERSION SÉCURISÉE) ===
@@ -0,0 +1,150 @@
+# ===============================================
+# FICHIER: recipes.py (Recettes de génération tamponnées sur les objets)
+# ===============================================
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from bpy.types import Object
+
+import hashlib
+import json
+import sys
+
+# Type aliases
+Recipe = Dict[str, Any]
+
+# Propriétés personnalisées posées sur les objets générés
+RECIPE_KEY: str = "plan_curves_recipe"
+HASH_KEY: str = "plan_curves_hash"
+GROUP_KEY: str = "plan_curves_group"
+PART_KEY: str = "plan_curves_part"
+
+# Version du format de recette : à incrémenter si la génération change de sens
+RECIPE_FORMAT: int = 1
+
+# Propriétés d'interface, sans effet sur la géométrie
+UI_STATE_KEYS: Tuple[str, ...] = (
+    'selected_preset', 'preset_search', 'show_preset_details',
+    'new_preset_name', 'new_preset_description',
+    'validation_message', 'preset_message',
+)
+
+# Métadonnées des presets (PresetRecord), sans propriété correspondante
+METADATA_KEYS: Tuple[str, ...] = (
+    'name', 'description', 'category', 'author', 'created_date', 'source', 'editable',
+)
+
+# Réglages communs, réappliqués depuis la scène par « Tout régénérer »
+SHARED_SETTINGS: Tuple[str, ...] = (
+    'output_mode', 'bezier_tolerance', 'simplify_enabled', 'simplify_tolerance',
+    'sampling_mode', 'arc_length_analytic', 'interval_culling',
+    'newton_refine', 'newton_steps',
+)
+
+
+def snapshot_recipe(props) -> Recipe:
+    """
+    Capture toutes les propriétés de génération sous forme sérialisable.
+
+    Args:
+        props: Propriétés de l'addon (PlanCurvesProperties)
+
+    Returns:
+        Recette {nom de propriété: valeur}
+    """
+    recipe: Recipe = {}
+    for prop in props.bl_rna.properties:
+        key: str = prop.identifier
+        if key in ('rna_type', 'name') or key in UI_STATE_KEYS or prop.is_readonly:
+            continue
+        value = getattr(props, key)
+        recipe[key] = list(value) if hasattr(value, '__len__') and not isinstance(value, str) else value
+    return recipe
+
+
+def apply_recipe(props, recipe: Recipe) -> None:
+    """
+    Remet les propriétés à leurs valeurs par défaut puis applique une recette.
+
+    Les métadonnées d'un preset (METADATA_KEYS) sont ignorées : un preset
+    utilisateur ou un enregistrement de get_all_presets s'applique tel quel.
+
+    Args:
+        props: Propriétés de l'addon (PlanCurvesProperties)
+        recipe: Recette au schéma PresetData, ou capturée par snapshot_recipe
+
+    Raises:
+        KeyError: Si une autre clé ne correspond à aucune propriété
+    """
+    for prop in props.bl_rna.properties:
+        if (prop.identifier not in ('rna_type', 'name') and prop.identifier not in UI_STATE_KEYS
+                and not prop.is_readonly):
+            props.property_unset(prop.identifier)
+
+    # Le type d'abord : il conditionne les autres réglages
+    props.curve_type = recipe['curve_type']
+    for key, value in recipe.items():
+        if key == 'curve_type' or key in METADATA_KEYS:
+            continue
+        if not hasattr(props, key):
+            raise KeyError(f"propriété inconnue: {key}")
+        setattr(props, key, value)
+
+
+def addon_version() -> str:
+    """Version de l'addon (bl_info), prise en compte dans l'empreinte."""
+    package = sys.modules.get(__package__ or "")
+    version = getattr(package, 'bl_info', {}).get('version', ())
+    return ".".join(map(str, version))
+
+
+def recipe_hash(recipe: Recipe) -> str:
+    """
+    Empreinte d'une recette, de la version de l'addon et du format.
+
+    Args:
+        recipe: Recette
+
+    Returns:
+        Empreinte hexadécimale (16 caractères)
+    """
+    payload: str = json.dumps(
+        {'recipe': recipe, 'version': addon_version(), 'format': RECIPE_FORMAT},
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def stamp_object(obj: Object, recipe: Recipe, group: str, part: int) -> None:
+    """
+    Enregistre la recette et son empreinte sur un objet généré.
+
+    Args:
+        obj: Objet créé
+        recipe: Recette de génération
+        group: Identifiant de la génération (objets créés ensemble)
+        part: Rang de l'objet dans sa génération
+    """
+    obj[RECIPE_KEY] = recipe
+    # Empreinte calculée sur la recette relue, telle que Blender l'a stockée
+    obj[HASH_KEY] = recipe_hash(read_recipe(obj))
+    obj[GROUP_KEY] = group
+    obj[PART_KEY] = part
+
+
+def read_recipe(obj: Object) -> Optional[Recipe]:
+    """
+    Relit la recette d'un objet généré.
+
+    Args:
+        obj: Objet de la scène
+
+    Returns:
+        Recette, ou None si l'objet n'en porte pas
+    """
+    stored = obj.get(RECIPE_KEY)
+    if stored is None:
+        return None
+    return stored.to_dict() if hasattr(stored, 'to_dict') else dict(stored)
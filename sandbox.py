@@ -0,0 +1,405 @@
+# ===============================================
+# FICHIER: sandbox.py (Évaluation isolée dans un sous-processus)
+# ===============================================
+#
+# Le module s'exécute aussi comme script : le sous-processus le lance
+# directement, sans importer l'addon (ni bpy).
+#
+# Protocole : une tâche JSON par ligne sur l'entrée standard de l'évaluateur,
+# un statut JSON par ligne en retour. Un même évaluateur sert toutes les
+# évaluations d'une génération (SandboxSession).
+
+from __future__ import annotations
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import errno
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+from multiprocessing import shared_memory
+
+# Délai maximal d'une évaluation isolée (secondes)
+SANDBOX_TIMEOUT: float = 10.0
+
+# Mémoire maximale du sous-processus (Mo)
+SANDBOX_MEMORY_MB: int = 2048
+
+
+class SandboxError(Exception):
+    """Échec d'une analyse ou d'une évaluation isolée (délai, mémoire, erreur)."""
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Ouvre un bloc partagé existant sans le confier au resource tracker."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 : le tracker détruirait le bloc à la sortie du processus
+        block = shared_memory.SharedMemory(name=name)
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(block._name, 'shared_memory')
+        return block
+
+
+def release(block: shared_memory.SharedMemory) -> None:
+    """
+    Ferme et détruit un bloc créé par pack_inputs.
+
+    Un évaluateur à court de mémoire peut l'avoir déjà détruit : CPython
+    appelle unlink() quand l'ouverture d'un bloc existant échoue.
+    """
+    block.close()
+    try:
+        block.unlink()
+    except FileNotFoundError:
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(block._name, 'shared_memory')
+        except Exception:
+            pass
+
+
+def pack_inputs(expressions: Sequence[str], symbols: Sequence[str],
+                inputs: Sequence[np.ndarray]) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+    """
+    Copie les entrées dans un nouveau bloc partagé et décrit la tâche.
+
+    Le bloc contient les entrées puis une place par résultat ; la
+    description JSON ne transporte que les formes et les décalages.
+
+    Args:
+        expressions: Expressions (chaînes SymPy ou srepr)
+        symbols: Noms des symboles d'entrée
+        inputs: Valeurs des entrées, diffusées entre elles
+
+    Returns:
+        Tuple (bloc partagé, description de la tâche)
+    """
+    inputs = [np.ascontiguousarray(values, dtype=np.float64) for values in inputs]
+    shape = np.broadcast_shapes(*(values.shape for values in inputs)) if inputs else ()
+    output_bytes: int = int(np.prod(shape)) * 8 if inputs else 0
+
+    layout: List[Dict[str, Any]] = []
+    offset: int = 0
+    for values in inputs:
+        layout.append({'shape': values.shape, 'offset': offset})
+        offset += values.nbytes
+
+    block = shared_memory.SharedMemory(create=True, size=max(offset + output_bytes * len(expressions), 1))
+    for values, entry in zip(inputs, layout):
+        np.ndarray(values.shape, np.float64, block.buf, entry['offset'])[...] = values
+
+    job: Dict[str, Any] = {
+        'shm': block.name,
+        'expressions': list(expressions),
+        'symbols': list(symbols),
+        'inputs': layout,
+        'shape': shape,
+        'outputs_offset': offset,
+    }
+    return block, job
+
+
+def unpack_outputs(block: shared_memory.SharedMemory, job: Dict[str, Any]) -> List[np.ndarray]:
+    """
+    Copie les résultats hors du bloc partagé.
+
+    Args:
+        block: Bloc partagé de la tâche
+        job: Description de la tâche
+
+    Returns:
+        Un tableau par expression (liste vide pour une simple analyse)
+    """
+    if not job['inputs']:
+        return []
+    shape = tuple(job['shape'])
+    size: int = int(np.prod(shape)) * 8
+    return [
+        np.ndarray(shape, np.float64, block.buf, job['outputs_offset'] + index * size).copy()
+        for index in range(len(job['expressions']))
+    ]
+
+
+def evaluate_job(job: Dict[str, Any], compile_fn: Callable[[Tuple[str, ...], str], Callable]) -> None:
+    """
+    Exécute une tâche côté évaluateur : lit les entrées, écrit les résultats.
+
+    Args:
+        job: Description de la tâche
+        compile_fn: (noms des symboles, expression) -> fonction NumPy ; appelée
+            même sans entrées, pour vérifier l'analyse
+
+    Raises:
+        Exception: Toute erreur d'analyse ou d'évaluation
+    """
+    block = _attach(job['shm'])
+    try:
+        values = [np.ndarray(tuple(entry['shape']), np.float64, block.buf, entry['offset'])
+                  for entry in job['inputs']]
+        shape = tuple(job['shape'])
+        size: int = int(np.prod(shape)) * 8
+
+        for index, text in enumerate(job['expressions']):
+            func = compile_fn(tuple(job['symbols']), text)
+            if not values:
+                continue
+            with np.errstate(all='ignore'):
+                result = np.asarray(func(*values), dtype=np.float64)
+            out = np.ndarray(shape, np.float64, block.buf, job['outputs_offset'] + index * size)
+            out[...] = np.broadcast_to(result, shape)
+            del out
+        del values
+    finally:
+        try:
+            block.close()
+        except BufferError:
+            pass  # Vues encore ouvertes après une erreur : libérées avec le processus
+
+
+class SandboxSession:
+    """
+    Évaluateur isolé d'une génération : un seul sous-processus pour toutes
+    les évaluations (équations, dérivées, gradients), et un seul délai
+    mesuré depuis l'ouverture de la session.
+
+    Le délai dépassé, l'évaluateur est tué et la session devient inutilisable.
+    """
+
+    def __init__(self, timeout: float = SANDBOX_TIMEOUT, memory_mb: int = SANDBOX_MEMORY_MB) -> None:
+        """
+        Args:
+            timeout: Délai total de la session en secondes
+            memory_mb: Mémoire maximale du sous-processus en Mo
+        """
+        self.timeout: float = timeout
+        self.memory_mb: int = memory_mb
+        self.deadline: float = time.monotonic() + timeout
+        self.process: Optional[subprocess.Popen] = None
+        self.replies: queue.Queue = queue.Queue()
+        self.errors: Deque[str] = deque(maxlen=20)
+        self.evaluations: int = 0
+
+    def __enter__(self) -> SandboxSession:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def start(self) -> subprocess.Popen:
+        """Lance l'évaluateur au premier besoin ; ses sorties sont lues par des fils dédiés."""
+        if self.process is None:
+            env = dict(os.environ, OPENBLAS_NUM_THREADS='1', OMP_NUM_THREADS='1')
+            self.process = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                env=env, text=True, bufsize=1,
+            )
+            for stream, sink in ((self.process.stdout, self.replies.put),
+                                 (self.process.stderr, self.errors.append)):
+                threading.Thread(target=self._drain, args=(stream, sink), daemon=True).start()
+        return self.process
+
+    @staticmethod
+    def _drain(stream, sink: Callable[[Optional[str]], None]) -> None:
+        """Recopie les lignes d'un tube jusqu'à sa fermeture (None en fin de flux)."""
+        for line in stream:
+            sink(line.rstrip("\n"))
+        sink(None)
+
+    def evaluate(self, expressions: Sequence[str], symbols: Sequence[str] = (),
+                 inputs: Sequence[np.ndarray] = ()) -> List[np.ndarray]:
+        """
+        Analyse et évalue des expressions dans l'évaluateur de la session.
+
+        Les entrées et les résultats transitent par un bloc de mémoire
+        partagée ; seule une courte description JSON passe par les tubes.
+        Sans entrées, seule l'analyse (sympify) est vérifiée.
+
+        Args:
+            expressions: Expressions (chaînes SymPy ou srepr)
+            symbols: Noms des symboles d'entrée, dans l'ordre des entrées
+            inputs: Valeurs des entrées, diffusées entre elles
+
+        Returns:
+            Un tableau float64 par expression, de la forme diffusée des entrées
+
+        Raises:
+            SandboxError: Délai dépassé, mémoire épuisée ou erreur d'évaluation
+        """
+        remaining: float = self.deadline - time.monotonic()
+        if remaining <= 0.0:
+            self.close(kill=True)
+            raise SandboxError(f"délai de {self.timeout:g} s dépassé")
+
+        process: subprocess.Popen = self.start()
+        block, job = pack_inputs(expressions, symbols, inputs)
+        try:
+            job.update(path=sys.path, memory_mb=self.memory_mb)
+            try:
+                process.stdin.write(json.dumps(job) + "\n")
+                process.stdin.flush()
+                line: Optional[str] = self.replies.get(timeout=remaining)
+            except queue.Empty:
+                self.close(kill=True)
+                raise SandboxError(f"délai de {self.timeout:g} s dépassé")
+            except OSError:
+                line = None  # Évaluateur déjà arrêté
+
+            if line is None:
+                code: Optional[int] = self.close()
+                detail: str = next((text for text in reversed(self.errors) if text and text.strip()), "")
+                raise SandboxError(f"processus interrompu (code {code}) {detail}".strip())
+            status: Dict[str, Any] = json.loads(line)
+            if not status['ok']:
+                raise SandboxError(status['error'])
+
+            self.evaluations += 1
+            return unpack_outputs(block, job)
+        finally:
+            release(block)
+
+    def function(self, symbols: Sequence, expression) -> SandboxedFunction:
+        """Fonction vectorisée évaluée par cette session."""
+        return SandboxedFunction(symbols, expression, self)
+
+    def close(self, kill: bool = False) -> Optional[int]:
+        """
+        Arrête l'évaluateur (fin de l'entrée standard, sinon kill).
+
+        Args:
+            kill: Tue l'évaluateur sans attendre (calcul en cours abandonné)
+
+        Returns:
+            Code de sortie, ou None si aucun évaluateur n'a été lancé
+        """
+        process: Optional[subprocess.Popen] = self.process
+        if process is None:
+            return None
+        self.deadline = 0.0  # Session close : plus aucune évaluation
+        if process.poll() is None:
+            try:
+                if kill:
+                    raise subprocess.TimeoutExpired(process.args, 0.0)
+                process.stdin.close()
+                process.wait(timeout=0.5)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+        return process.returncode
+
+
+def run_sandboxed(expressions: Sequence[str], symbols: Sequence[str] = (),
+                  inputs: Sequence[np.ndarray] = (), timeout: float = SANDBOX_TIMEOUT,
+                  memory_mb: int = SANDBOX_MEMORY_MB) -> List[np.ndarray]:
+    """
+    Analyse et évalue des expressions dans un sous-processus jetable.
+
+    Args:
+        expressions: Expressions (chaînes SymPy ou srepr)
+        symbols: Noms des symboles d'entrée, dans l'ordre des entrées
+        inputs: Valeurs des entrées, diffusées entre elles
+        timeout: Délai maximal en secondes
+        memory_mb: Mémoire maximale du sous-processus en Mo
+
+    Returns:
+        Un tableau float64 par expression, de la forme diffusée des entrées
+
+    Raises:
+        SandboxError: Délai dépassé, mémoire épuisée ou erreur d'évaluation
+    """
+    with SandboxSession(timeout, memory_mb) as session:
+        return session.evaluate(expressions, symbols, inputs)
+
+
+class SandboxedFunction:
+    """
+    Équivalent isolé d'une fonction lambdifiée, évalué par l'évaluateur
+    d'une SandboxSession.
+
+    Réservé aux évaluations vectorisées en bloc : chaque appel traverse
+    les tubes et la mémoire partagée.
+    """
+
+    def __init__(self, symbols: Sequence, expression, session: SandboxSession) -> None:
+        """
+        Args:
+            symbols: Symboles d'entrée (SymPy ou noms)
+            expression: Expression SymPy ou chaîne
+            session: Session de la génération en cours
+        """
+        if not isinstance(expression, str):
+            from sympy import srepr
+            expression = srepr(expression)
+        self.symbols: List[str] = [str(symbol) for symbol in symbols]
+        self.expression: str = expression
+        self.session: SandboxSession = session
+
+    def __call__(self, *values: np.ndarray) -> np.ndarray:
+        return self.session.evaluate([self.expression], self.symbols, values)[0]
+
+
+def _limit_memory(memory_mb: int) -> None:
+    """Borne l'espace d'adressage du processus courant (POSIX uniquement)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    limit: int = memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError, AttributeError):
+        pass
+
+
+def _worker() -> None:
+    """
+    Point d'entrée du sous-processus : une tâche JSON par ligne sur l'entrée
+    standard, jusqu'à sa fermeture. Les expressions compilées sont gardées
+    pour les tâches suivantes de la même génération.
+    """
+    compiled: Dict[Tuple[Tuple[str, ...], str], Callable] = {}
+    limited: bool = False
+
+    def compile_fn(symbols: Tuple[str, ...], text: str) -> Callable:
+        func = compiled.get((symbols, text))
+        if func is None:
+            import sympy as sp
+            func = sp.lambdify([sp.Symbol(name) for name in symbols], sp.sympify(text),
+                               modules=['numpy'])
+            compiled[(symbols, text)] = func
+        return func
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job: Dict[str, Any] = json.loads(line)
+        if not limited:
+            sys.path[:0] = [path for path in job['path'] if path not in sys.path]
+            _limit_memory(job['memory_mb'])
+            limited = True
+
+        try:
+            evaluate_job(job, compile_fn)
+            status: Dict[str, Any] = {'ok': True}
+        except (MemoryError, OSError) as e:
+            if isinstance(e, OSError) and e.errno != errno.ENOMEM:
+                status = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            else:
+                status = {'ok': False, 'error': f"limite mémoire de {job['memory_mb']} Mo atteinte"}
+        except Exception as e:
+            status = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+        sys.stdout.write(json.dumps(status) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    _worker()
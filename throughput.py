@@ -0,0 +1,113 @@
+# ===============================================
+# FICHIER: throughput.py (Débit mesuré et résolution automatique)
+# ===============================================
+#
+# Chaque génération et chaque mise à jour d'image d'une courbe animée est
+# chronométrée (évaluation + envoi des points) ; une moyenne glissante des
+# échantillons par milliseconde est tenue par étape et par type de courbe.
+# En mode de résolution AUTO, la résolution retenue est la plus grande dont
+# le coût estimé tient dans la latence cible des préférences.
+
+from __future__ import annotations
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .preferences import get_addon_preferences
+
+# Étapes mesurées : génération complète, mise à jour d'image (aperçu direct)
+FINAL: str = 'FINAL'
+LIVE: str = 'LIVE'
+
+# Latences cibles par défaut (ms), si les préférences sont indisponibles
+DEFAULT_LATENCY: Dict[str, float] = {LIVE: 16.0, FINAL: 500.0}
+
+# Poids d'une nouvelle mesure dans la moyenne glissante
+SMOOTHING: float = 0.3
+
+# Bornes de la propriété 'resolution'
+MIN_RESOLUTION: int = 10
+MAX_RESOLUTION: int = 4096
+
+# Types évalués sur une grille résolution × résolution
+GRID_TYPES: Tuple[str, ...] = ('IMPLICIT', 'SURFACE')
+
+# Échantillons par milliseconde, par (étape, type de courbe)
+_rates: Dict[Tuple[str, str], float] = {}
+
+
+def record(stage: str, curve_type: str, samples: int, seconds: float) -> None:
+    """
+    Ajoute une mesure à la moyenne glissante du débit.
+
+    Args:
+        stage: FINAL ou LIVE
+        curve_type: Type de courbe
+        samples: Échantillons évalués et envoyés
+        seconds: Durée mesurée
+    """
+    if samples <= 0 or seconds <= 0.0:
+        return
+    rate: float = samples / (seconds * 1000.0)
+    previous: Optional[float] = _rates.get((stage, curve_type))
+    _rates[(stage, curve_type)] = rate if previous is None else previous + SMOOTHING * (rate - previous)
+
+
+def points_per_ms(stage: str, curve_type: str) -> Optional[float]:
+    """
+    Débit estimé, en échantillons par milliseconde.
+
+    Une étape sans mesure reprend le débit de la génération complète.
+
+    Args:
+        stage: FINAL ou LIVE
+        curve_type: Type de courbe
+
+    Returns:
+        Débit, ou None sans aucune mesure pour ce type
+    """
+    return _rates.get((stage, curve_type), _rates.get((FINAL, curve_type)))
+
+
+def target_latency(stage: str) -> float:
+    """
+    Latence cible d'une étape (ms), lue dans les préférences.
+
+    Args:
+        stage: FINAL ou LIVE
+
+    Returns:
+        Latence en millisecondes
+    """
+    prefs = get_addon_preferences()
+    name: str = 'latency_live' if stage == LIVE else 'latency_final'
+    return float(getattr(prefs, name, DEFAULT_LATENCY[stage]))
+
+
+def auto_resolution(stage: str, curve_type: str, fallback: int, members: int = 1) -> int:
+    """
+    Plus grande résolution dont le coût estimé tient dans la latence cible.
+
+    Args:
+        stage: FINAL ou LIVE
+        curve_type: Type de courbe
+        fallback: Résolution gardée tant qu'aucune mesure n'existe
+        members: Courbes d'une famille (balayage)
+
+    Returns:
+        Résolution, dans les bornes de la propriété
+    """
+    rate: Optional[float] = points_per_ms(stage, curve_type)
+    if rate is None:
+        return fallback
+    samples: float = rate * target_latency(stage)
+    if curve_type in GRID_TYPES:
+        resolution: float = np.sqrt(samples)
+    else:
+        resolution = samples / max(members, 1)
+    return int(np.clip(resolution, MIN_RESOLUTION, MAX_RESOLUTION))
+
+
+def reset() -> None:
+    """Oublie toutes les mesures."""
+    _rates.clear()
@@ -27,8 +27,69 @@ TRANSLATIONS: LanguageDict = {
         'parameters': "Paramètres:",
         'validation': "Validation:",
         'resolution': "Résolution",
+        'sampling': "Échantillonnage",
+        'analytic_speed': "Vitesse analytique",
         'generate_curve': "Générer courbe",
         'validate': "Valider",
+        'curve_family': "Famille de courbes",
+        'sweep_parameter': "Paramètre",
+        'sweep_count': "Nombre",
+        'sweep_not_identifier': "Le paramètre de balayage doit être un identifiant valide",
+        'sweep_is_variable': "Le paramètre de balayage ne peut pas être la variable de la courbe",
+        'sweep_is_time': "Le paramètre de balayage ne peut pas être 'frame' ou 'time'",
+        'contours': "Lignes de niveau:",
+        'contour_count': "Niveaux",
+        'interval_culling': "Élagage par intervalles",
+        'sandbox': "Bac à sable",
+        'use_sandbox': "Évaluation isolée (sous-processus)",
+        'timeout': "Délai",
+        'memory_limit': "Mémoire (Mo)",
+        'sandbox_failed': "Évaluation isolée interrompue",
+        'eval_server': "Serveur d'évaluation",
+        'use_eval_server': "Utiliser le serveur local",
+        'socket_path': "Socket",
+        'start_eval_server': "Démarrer le serveur",
+        'eval_server_running': "Serveur d'évaluation déjà actif",
+        'eval_server_started': "Serveur d'évaluation démarré",
+        'eval_server_failed': "Évaluation sur le serveur en échec",
+        'regenerate_all': "Tout régénérer",
+        'regenerate_done': "Objets régénérés",
+        'regenerate_up_to_date': "Tous les objets sont à jour",
+        'regenerate_failed': "Régénération échouée",
+        'share_geometry': "Partager les courbes identiques",
+        'container': "Conteneur",
+        'clean_done': "Scène nettoyée",
+        'clean_dry_run': "Simulation du nettoyage",
+        'objects': "objets",
+        'orphans': "orphelins",
+        'animated_curve': "Courbe animée",
+        'animation_unsupported': "Animation non prise en charge pour ce type (courbe figée à l'image courante)",
+        'animation_frozen': "Réglages non reproduits à chaque image (courbe figée à l'image courante)",
+        'animation_baked': "Animation précalculée",
+        'no_animated_curve': "Aucune courbe animée sélectionnée",
+        'bake_cache': "Cache disque",
+        'bake_shape_keys': "Clés de forme",
+        'shared_geometry': "Géométrie partagée",
+        'export_curves': "Exporter les points",
+        'export_done': "Courbes exportées",
+        'export_unsupported': "Export réservé aux courbes (surfaces non prises en charge)",
+        'import_points': "Importer des points",
+        'import_done': "Points importés",
+        'import_failed': "Import impossible",
+        'auto_resolution': "Résolution automatique",
+        'latency_live': "Aperçu direct (ms)",
+        'latency_final': "Génération (ms)",
+        'newton_refine': "Projection de Newton",
+        'iterations': "Itérations",
+        'trace_step': "Pas max",
+        'seed_grid': "Grille de départ",
+        'post_processing': "Post-traitement:",
+        'simplify': "Simplifier",
+        'tolerance': "Tolérance",
+        'simplified': "Simplification",
+        'output_mode': "Sortie",
+        'max_error': "Erreur max",
+        'bezier_fit': "Ajustement Bézier",
 
         # Presets
         'presets': "Presets",
@@ -60,6 +121,7 @@ TRANSLATIONS: LanguageDict = {
         'name_required': "Nom du preset requis",
         'not_enough_points': "Pas assez de points valides",
         'no_curve_detected': "Pas de courbe détectée",
+        'no_gradient': "Gradient symbolique indisponible",
         'sympy_not_installed': "SymPy non installé !",
 
         # Préférences
@@ -97,8 +159,69 @@ TRANSLATIONS: LanguageDict = {
         'parameters': "Parameters:",
         'validation': "Validation:",
         'resolution': "Resolution",
+        'sampling': "Sampling",
+        'analytic_speed': "Analytic speed",
         'generate_curve': "Generate Curve",
         'validate': "Validate",
+        'curve_family': "Curve family",
+        'sweep_parameter': "Parameter",
+        'sweep_count': "Count",
+        'sweep_not_identifier': "The sweep parameter must be a valid identifier",
+        'sweep_is_variable': "The sweep parameter cannot be the curve's variable",
+        'sweep_is_time': "The sweep parameter cannot be 'frame' or 'time'",
+        'contours': "Contour levels:",
+        'contour_count': "Levels",
+        'interval_culling': "Interval culling",
+        'sandbox': "Sandbox",
+        'use_sandbox': "Isolated evaluation (subprocess)",
+        'timeout': "Timeout",
+        'memory_limit': "Memory (MB)",
+        'sandbox_failed': "Isolated evaluation aborted",
+        'eval_server': "Evaluation server",
+        'use_eval_server': "Use local server",
+        'socket_path': "Socket",
+        'start_eval_server': "Start server",
+        'eval_server_running': "Evaluation server already running",
+        'eval_server_started': "Evaluation server started",
+        'eval_server_failed': "Evaluation on the server failed",
+        'regenerate_all': "Regenerate all",
+        'regenerate_done': "Regenerated objects",
+        'regenerate_up_to_date': "All objects are up to date",
+        'regenerate_failed': "Regeneration failed",
+        'share_geometry': "Share identical curves",
+        'container': "Container",
+        'clean_done': "Scene cleaned",
+        'clean_dry_run': "Cleanup dry run",
+        'objects': "objects",
+        'orphans': "orphans",
+        'animated_curve': "Animated curve",
+        'animation_unsupported': "Animation not supported for this type (curve frozen at current frame)",
+        'animation_frozen': "Settings not reproduced on each frame (curve frozen at current frame)",
+        'animation_baked': "Animation baked",
+        'no_animated_curve': "No animated curve selected",
+        'bake_cache': "Disk cache",
+        'bake_shape_keys': "Shape keys",
+        'shared_geometry': "Shared geometry",
+        'export_curves': "Export points",
+        'export_done': "Curves exported",
+        'export_unsupported': "Export is limited to curves (surfaces not supported)",
+        'import_points': "Import points",
+        'import_done': "Points imported",
+        'import_failed': "Import failed",
+        'auto_resolution': "Automatic resolution",
+        'latency_live': "Live preview (ms)",
+        'latency_final': "Generation (ms)",
+        'newton_refine': "Newton projection",
+        'iterations': "Iterations",
+        'trace_step': "Max step",
+        'seed_grid': "Seed grid",
+        'post_processing': "Post-processing:",
+        'simplify': "Simplify",
+        'tolerance': "Tolerance",
+        'simplified': "Simplification",
+        'output_mode': "Output",
+        'max_error': "Max error",
+        'bezier_fit': "Bézier fit",
 
         # Presets
         'presets': "Presets",
@@ -130,6 +253,7 @@ TRANSLATIONS: LanguageDict = {
         'name_required': "Preset name required",
         'not_enough_points': "Not enough valid points",
         'no_curve_detected': "No curve detected",
+        'no_gradient': "Symbolic gradient unavailable",
         'sympy_not_installed': "SymPy not installed!",
 
         # Preferences
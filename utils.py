@@ -3,18 +3,43 @@
 # ===============================================
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 
 if TYPE_CHECKING:
-    from bpy.types import GeometryNodeTree, NodeSocket
+    from bpy.types import Curve, GeometryNodeTree, NodeSocket
+
+import hashlib
+import zlib
 
 import bpy
+import numpy as np
+
+# Propriété personnalisée des datablocks courbe : empreinte de leur géométrie
+GEOMETRY_KEY: str = "plan_curves_geometry"
+# Contrôle du contenu construit (nombre de points et somme), pour détecter les retouches
+CONTENT_KEY: str = "plan_curves_content"
+
+# Index {empreinte: nom du datablock} des courbes partageables
+_shared_curves: Dict[str, str] = {}
+_indexed_count: int = -1
+
+# Version des groupes de tube : 2 ajoute les niveaux de détail fenêtre / rendu
+GROUP_VERSION_KEY: str = "plan_curves_version"
+TUBE_GROUP_VERSION: int = 2
+
+# Rayon par défaut des tubes et budget de sommets d'un tube dans la fenêtre
+TUBE_RADIUS: float = 0.05
+VIEWPORT_TUBE_VERTICES: int = 1_000_000
+MIN_VIEWPORT_POINTS: int = 256
 
 def get_or_create_curve_tube_group() -> GeometryNodeTree:
     """
     Crée ou récupère le node group pour les tubes de courbes.
     ✅ VERSION CORRIGÉE POUR BLENDER 4.4.3
 
+    Un groupe « Curve Tube » d'une version antérieure (sans niveaux de
+    détail) est renommé et laissé aux objets qui l'utilisent.
+
     Returns:
         Node group pour la conversion courbe vers tube
 
@@ -22,82 +47,409 @@ def get_or_create_curve_tube_group() -> GeometryNodeTree:
         RuntimeError: Si impossible de créer le node group
     """
     group_name: str = "Curve Tube"
+    gn: Optional[GeometryNodeTree] = _current_group(group_name)
+    if gn is not None:
+        return gn
+
+    try:
+        group, group_input, group_output = _new_modifier_group(group_name, "Curve", lod=True)
+        tube = _add_tube_sweep(group, group_input.outputs["Curve"], group_input)
+        group.links.new(tube, group_output.inputs["Geometry"])
+        return group
+
+    except Exception as e:
+        raise RuntimeError(f"Impossible de créer le node group: {e}")
+
+
+def _current_group(group_name: str) -> Optional[GeometryNodeTree]:
+    """
+    Renvoie le node group s'il est à jour ; sinon le renomme et renvoie None.
+
+    Args:
+        group_name: Nom du node group
+
+    Returns:
+        Node group à la version TUBE_GROUP_VERSION, ou None
+    """
     gn: Optional[GeometryNodeTree] = bpy.data.node_groups.get(group_name)
+    if gn is None:
+        return None
+    if gn.get(GROUP_VERSION_KEY, 1) >= TUBE_GROUP_VERSION:
+        return gn
+    gn.name = f"{group_name} (v{gn.get(GROUP_VERSION_KEY, 1)})"
+    return None
+
+
+def _new_modifier_group(group_name: str, input_name: str,
+                        lod: bool = False) -> Tuple[GeometryNodeTree, object, object]:
+    """
+    Crée un node group de modificateur (Géométrie, Rayon) -> Géométrie.
+
+    Args:
+        group_name: Nom du node group
+        input_name: Nom de l'entrée géométrie
+        lod: Ajoute les entrées de niveaux de détail (résolution, décimation)
+
+    Returns:
+        Tuple (node group, nœud d'entrée, nœud de sortie)
+    """
+    group: GeometryNodeTree = bpy.data.node_groups.new(type='GeometryNodeTree', name=group_name)
+    group.is_modifier = True
+    group.interface.new_socket(name="Geometry", socket_type='NodeSocketGeometry', in_out='OUTPUT')
+    group.interface.new_socket(name=input_name, socket_type='NodeSocketGeometry', in_out='INPUT')
+    radius: NodeSocket = group.interface.new_socket(name="Radius", socket_type='NodeSocketFloat',
+                                                    in_out='INPUT')
+    if hasattr(radius, 'default_value'):
+        radius.default_value = TUBE_RADIUS
+
+    if lod:
+        # Valeurs distinctes fenêtre / rendu, choisies par Is Viewport
+        group[GROUP_VERSION_KEY] = TUBE_GROUP_VERSION
+        for name, default in (("Viewport Resolution", 8), ("Render Resolution", 16),
+                              ("Viewport Decimation", 1), ("Render Decimation", 1)):
+            socket: NodeSocket = group.interface.new_socket(name=name, socket_type='NodeSocketInt',
+                                                            in_out='INPUT')
+            socket.default_value = default
+            socket.min_value = 3 if name.endswith("Resolution") else 1
+
+    group_input = group.nodes.new("NodeGroupInput")
+    group_output = group.nodes.new("NodeGroupOutput")
+    group_input.location = (-800, 0)
+    group_output.location = (600, 0)
+    return group, group_input, group_output
+
+
+def _add_lod_switch(group: GeometryNodeTree, group_input, name: str, is_viewport, location):
+    """Ajoute un Switch entier « Viewport <name> » / « Render <name> » selon Is Viewport."""
+    switch = group.nodes.new("GeometryNodeSwitch")
+    switch.input_type = 'INT'
+    switch.location = location
+    group.links.new(is_viewport, switch.inputs["Switch"])
+    group.links.new(group_input.outputs[f"Render {name}"], switch.inputs["False"])
+    group.links.new(group_input.outputs[f"Viewport {name}"], switch.inputs["True"])
+    return switch.outputs["Output"]
+
+
+def _add_tube_sweep(group: GeometryNodeTree, curve, group_input):
+    """
+    Ajoute la décimation des points puis le balayage d'un cercle le long des courbes.
+
+    Un point sur « Decimation » est gardé par spline (extrémités toujours
+    gardées), et le cercle de profil compte « Resolution » segments ; les
+    deux valeurs dépendent de Is Viewport.
+
+    Args:
+        group: Node group en construction
+        curve: Sortie portant les courbes
+        group_input: Nœud d'entrée du groupe
+
+    Returns:
+        Sortie maillage du tube
+    """
+    nodes, links = group.nodes, group.links
+    is_viewport = nodes.new("GeometryNodeIsViewport")
+    is_viewport.location = (-600, -300)
+    resolution = _add_lod_switch(group, group_input, "Resolution", is_viewport.outputs[0], (-400, -300))
+    decimation = _add_lod_switch(group, group_input, "Decimation", is_viewport.outputs[0], (-400, -500))
+
+    # Supprime les points dont l'indice dans la spline n'est pas multiple de la décimation
+    spline_parameter = nodes.new("GeometryNodeSplineParameter")
+    modulo = nodes.new("ShaderNodeMath")
+    modulo.operation = 'MODULO'
+    endpoints = nodes.new("GeometryNodeCurveEndpointSelection")
+    drop = nodes.new("FunctionNodeBooleanMath")
+    drop.operation = 'NIMPLY'
+    delete = nodes.new("GeometryNodeDeleteGeometry")
+    delete.domain = 'POINT'
+    spline_parameter.location = (-400, 200)
+    modulo.location = (-200, 200)
+    endpoints.location = (-200, 350)
+    drop.location = (0, 250)
+    delete.location = (200, 0)
+
+    links.new(spline_parameter.outputs["Index"], modulo.inputs[0])
+    links.new(decimation, modulo.inputs[1])
+    links.new(modulo.outputs[0], drop.inputs[0])
+    links.new(endpoints.outputs["Selection"], drop.inputs[1])
+    links.new(curve, delete.inputs["Geometry"])
+    links.new(drop.outputs[0], delete.inputs["Selection"])
+
+    curve_circle = nodes.new("GeometryNodeCurvePrimitiveCircle")
+    curve_circle.mode = 'RADIUS'
+    curve_circle.location = (200, -300)
+    links.new(resolution, curve_circle.inputs["Resolution"])
+    links.new(group_input.outputs["Radius"], curve_circle.inputs["Radius"])
+
+    curve_to_mesh = nodes.new("GeometryNodeCurveToMesh")
+    curve_to_mesh.location = (400, 0)
+    links.new(delete.outputs["Geometry"], curve_to_mesh.inputs["Curve"])
+    links.new(curve_circle.outputs["Curve"], curve_to_mesh.inputs["Profile Curve"])
+    return curve_to_mesh.outputs["Mesh"]
+
+
+def get_or_create_edge_tube_group() -> GeometryNodeTree:
+    """
+    Crée ou récupère le node group de tube pour les maillages d'arêtes.
+
+    Les arêtes sont converties en courbes (Mesh to Curve) avant le même
+    balayage de cercle que le groupe « Curve Tube ».
+
+    Returns:
+        Node group pour la conversion arêtes vers tube
+
+    Raises:
+        RuntimeError: Si impossible de créer le node group
+    """
+    group_name: str = "Curve Tube (Edges)"
+    gn: Optional[GeometryNodeTree] = _current_group(group_name)
+    if gn is not None:
+        return gn
+
+    try:
+        group, group_input, group_output = _new_modifier_group(group_name, "Mesh", lod=True)
+        mesh_to_curve = group.nodes.new("GeometryNodeMeshToCurve")
+        mesh_to_curve.location = (-600, 200)
+        group.links.new(group_input.outputs["Mesh"], mesh_to_curve.inputs["Mesh"])
+        tube = _add_tube_sweep(group, mesh_to_curve.outputs["Curve"], group_input)
+        group.links.new(tube, group_output.inputs["Geometry"])
+        return group
+
+    except Exception as e:
+        raise RuntimeError(f"Impossible de créer le node group: {e}")
+
+
+def tube_lod(point_count: int, length: float, radius: float = TUBE_RADIUS,
+             decimate: bool = True) -> Dict[str, int]:
+    """
+    Niveaux de détail par défaut d'un tube selon la taille de la courbe.
+
+    Le rendu garde tous les points et un profil de 16 segments. Dans la
+    fenêtre, les points plus proches qu'un demi-rayon sont décimés, puis
+    profil et décimation sont ajustés pour tenir dans VIEWPORT_TUBE_VERTICES.
+    Les points de contrôle Bézier ne sont jamais décimés : retirer un point
+    sur deux déformerait la courbe ; seul le profil s'adapte alors au budget.
+
+    Args:
+        point_count: Nombre de points de la courbe
+        length: Longueur totale des polylignes
+        radius: Rayon du tube
+        decimate: False si la courbe contient des splines Bézier
+
+    Returns:
+        Valeurs des entrées « Viewport/Render Resolution/Decimation »
+    """
+    render_resolution: int = 16
+    decimation: int = 1
+    if point_count > 0 and length > 0:
+        spacing: float = length / point_count
+        decimation = max(1, int(0.5 * radius / spacing))
+
+    # Au moins MIN_VIEWPORT_POINTS points par objet, quel que soit le budget
+    max_decimation: int = max(1, point_count // MIN_VIEWPORT_POINTS)
+    kept: int = max(1, point_count // decimation)
+    resolution: int = int(np.clip(VIEWPORT_TUBE_VERTICES // kept, 4, render_resolution))
+    if kept * resolution > VIEWPORT_TUBE_VERTICES:
+        decimation = int(np.ceil(point_count * resolution / VIEWPORT_TUBE_VERTICES))
+    if not decimate:
+        decimation = 1
+
+    return {
+        "Viewport Resolution": resolution,
+        "Render Resolution": render_resolution,
+        "Viewport Decimation": int(min(decimation, max_decimation)),
+        "Render Decimation": 1,
+    }
+
+
+def tube_statistics(data) -> Tuple[int, float, bool]:
+    """
+    Taille de la géométrie réellement écrite dans un datablock.
+
+    Les points sont lus après simplification et ajustement Bézier, par
+    foreach_get : les niveaux de détail portent sur ce que reçoit le tube,
+    y compris pour un datablock partagé réutilisé tel quel.
 
+    Args:
+        data: Datablock courbe ou maillage
+
+    Returns:
+        Tuple (nombre de points, longueur cumulée, présence de splines Bézier)
+    """
+    if not hasattr(data, "splines"):
+        vertices: np.ndarray = np.empty(len(data.vertices) * 3, dtype=np.float32)
+        data.vertices.foreach_get("co", vertices)
+        vertices = vertices.reshape(-1, 3)
+        edges: np.ndarray = np.empty(len(data.edges) * 2, dtype=np.int32)
+        data.edges.foreach_get("vertices", edges)
+        edges = edges.reshape(-1, 2)
+        length: float = float(np.linalg.norm(
+            vertices[edges[:, 1]] - vertices[edges[:, 0]], axis=1).sum()) if len(edges) else 0.0
+        return len(vertices), length, False
+
+    count: int = 0
+    length = 0.0
+    bezier: bool = False
+    for spline in data.splines:
+        if spline.type == 'BEZIER':
+            points = spline.bezier_points
+            width: int = 3
+            bezier = True
+        else:
+            points = spline.points
+            width = 4
+        size: int = len(points)
+        values: np.ndarray = np.empty(size * width, dtype=np.float32)
+        points.foreach_get("co", values)
+        coordinates: np.ndarray = values.reshape(-1, width)[:, :3]
+        if spline.use_cyclic_u and size > 1:
+            coordinates = np.vstack((coordinates, coordinates[:1]))
+        count += size
+        if len(coordinates) > 1:
+            length += float(np.linalg.norm(np.diff(coordinates, axis=0), axis=1).sum())
+    return count, length, bezier
+
+
+def get_or_create_points_group() -> GeometryNodeTree:
+    """
+    Crée ou récupère le node group qui convertit des sommets en nuage de points.
+
+    Returns:
+        Node group Mesh to Points (rayon des points en entrée)
+
+    Raises:
+        RuntimeError: Si impossible de créer le node group
+    """
+    group_name: str = "Curve Points"
+    gn: Optional[GeometryNodeTree] = bpy.data.node_groups.get(group_name)
     if gn is not None:
         return gn
 
     try:
-        curve_tube: GeometryNodeTree = bpy.data.node_groups.new(
-            type='GeometryNodeTree',
-            name=group_name
-        )
-        curve_tube.is_modifier = True
-
-        # ✅ CORRECTION CRITIQUE: Interface corrigée pour Blender 4.4.3
-        # Ancien: new_socket(name, in_out, socket_type)
-        # Nouveau: new_socket(name, socket_type, in_out)
-        
-        out_socket: NodeSocket = curve_tube.interface.new_socket(
-            name="Geometry",
-            socket_type='NodeSocketGeometry',
-            in_out='OUTPUT'
-        )
-        
-        in_socket_curve: NodeSocket = curve_tube.interface.new_socket(
-            name="Curve",
-            socket_type='NodeSocketGeometry',
-            in_out='INPUT'
-        )
-        
-        in_socket_radius: NodeSocket = curve_tube.interface.new_socket(
-            name="Radius",
-            socket_type='NodeSocketFloat',
-            in_out='INPUT'
-        )
-        
-        # ✅ Configuration valeur par défaut sécurisée
-        if hasattr(in_socket_radius, 'default_value'):
-            in_socket_radius.default_value = 0.05
-
-        # Nodes
-        nodes = curve_tube.nodes
-        group_input = nodes.new("NodeGroupInput")
-        group_output = nodes.new("NodeGroupOutput")
-        curve_to_mesh = nodes.new("GeometryNodeCurveToMesh")
-        curve_circle = nodes.new("GeometryNodeCurvePrimitiveCircle")
-        
-        # ✅ Configuration du cercle avec vérifications
-        curve_circle.mode = 'RADIUS'
-        if len(curve_circle.inputs) > 0 and hasattr(curve_circle.inputs[0], 'default_value'):
-            curve_circle.inputs[0].default_value = 16
-
-        # ✅ Positionnement pour une meilleure lisibilité
-        group_input.location = (-200, 0)
-        curve_to_mesh.location = (0, 0)
-        curve_circle.location = (-200, -150)
-        group_output.location = (200, 0)
-
-        # ✅ Links avec vérifications sécurisées
-        links = curve_tube.links
-        
-        try:
-            links.new(curve_to_mesh.outputs[0], group_output.inputs[0])
-            links.new(group_input.outputs[0], curve_to_mesh.inputs[0])
-            links.new(curve_circle.outputs[0], curve_to_mesh.inputs[1])
-            
-            # Connexion radius si disponible
-            if len(group_input.outputs) > 1 and len(curve_circle.inputs) > 4:
-                links.new(group_input.outputs[1], curve_circle.inputs[4])
-                
-        except IndexError as e:
-            print(f"Avertissement connexions geometry nodes: {e}")
-
-        return curve_tube
+        group, group_input, group_output = _new_modifier_group(group_name, "Mesh")
+        mesh_to_points = group.nodes.new("GeometryNodeMeshToPoints")
+        mesh_to_points.mode = 'VERTICES'
+
+        links = group.links
+        links.new(group_input.outputs["Mesh"], mesh_to_points.inputs["Mesh"])
+        links.new(group_input.outputs["Radius"], mesh_to_points.inputs["Radius"])
+        links.new(mesh_to_points.outputs["Points"], group_output.inputs["Geometry"])
+        return group
 
     except Exception as e:
         raise RuntimeError(f"Impossible de créer le node group: {e}")
 
+
+def geometry_hash(splines: Iterable[Tuple], settings: Tuple) -> str:
+    """
+    Empreinte d'une géométrie avant construction des splines.
+
+    Args:
+        splines: Splines (points, ordonnée, tangentes ou None, fermée)
+        settings: Réglages qui modifient la construction (mode de sortie, tolérances)
+
+    Returns:
+        Empreinte hexadécimale
+    """
+    digest = hashlib.blake2b(repr(settings).encode(), digest_size=16)
+    for points, ordered, tangents, cyclic in splines:
+        for array in (points, tangents):
+            if array is None:
+                digest.update(b"-")
+                continue
+            array = np.ascontiguousarray(array, dtype=np.float64)
+            digest.update(repr(array.shape).encode())
+            digest.update(array.data)
+        digest.update(bytes((bool(ordered), bool(cyclic))))
+    return digest.hexdigest()
+
+
+def curve_content(curve: Curve) -> str:
+    """
+    Contrôle bon marché du contenu d'un datablock courbe.
+
+    Les coordonnées (et poignées Bézier) sont lues par foreach_get puis
+    résumées par une somme CRC, avec le type, la taille et la fermeture
+    de chaque spline ; le nombre de points et de splines figure en tête.
+
+    Args:
+        curve: Datablock courbe
+
+    Returns:
+        Chaîne "points:splines:crc"
+    """
+    digest: int = 0
+    count: int = 0
+    for spline in curve.splines:
+        if spline.type == 'BEZIER':
+            points = spline.bezier_points
+            attributes: Tuple[Tuple[str, int], ...] = (("co", 3), ("handle_left", 3), ("handle_right", 3))
+        else:
+            points = spline.points
+            attributes = (("co", 4),)
+        size: int = len(points)
+        count += size
+        digest = zlib.crc32(f"{spline.type}{size}{int(spline.use_cyclic_u)}".encode(), digest)
+        for attribute, width in attributes:
+            values: np.ndarray = np.empty(size * width, dtype=np.float32)
+            points.foreach_get(attribute, values)
+            digest = zlib.crc32(values.data, digest)
+    return f"{count}:{len(curve.splines)}:{digest:08x}"
+
+
+def _index_shared_curves() -> None:
+    """Reconstruit l'index des courbes partageables (après chargement d'un fichier...)."""
+    global _indexed_count
+    _shared_curves.clear()
+    for curve in bpy.data.curves:
+        key = curve.get(GEOMETRY_KEY)
+        if key:
+            _shared_curves.setdefault(key, curve.name)
+    _indexed_count = len(bpy.data.curves)
+
+
+def find_shared_curve(key: str) -> Optional[Curve]:
+    """
+    Cherche un datablock courbe de même empreinte.
+
+    Args:
+        key: Empreinte calculée par geometry_hash
+
+    Returns:
+        Datablock existant, ou None
+    """
+    for attempt in range(2):
+        name: Optional[str] = _shared_curves.get(key)
+        curve = bpy.data.curves.get(name) if name else None
+        if curve is not None and curve.get(GEOMETRY_KEY) == key:
+            if curve.get(CONTENT_KEY) == curve_content(curve):
+                return curve
+            # Datablock retouché depuis sa construction : il n'est plus partageable
+            del curve[GEOMETRY_KEY]
+            _shared_curves.pop(key, None)
+            return None
+        # Entrée absente ou périmée : réindexe si les courbes ont changé depuis
+        if attempt or (curve is None and name is None and len(bpy.data.curves) == _indexed_count):
+            return None
+        _index_shared_curves()
+    return None
+
+
+def register_shared_curve(curve: Curve, key: str) -> None:
+    """
+    Rend un datablock courbe partageable sous son empreinte.
+
+    Args:
+        curve: Datablock nouvellement rempli
+        key: Empreinte calculée par geometry_hash
+    """
+    global _indexed_count
+    curve[GEOMETRY_KEY] = key
+    curve[CONTENT_KEY] = curve_content(curve)
+    _shared_curves[key] = curve.name
+    if _indexed_count == len(bpy.data.curves) - 1:
+        _indexed_count += 1
+
+
 def check_blender_version_compatibility() -> bool:
     """
     Vérifie la compatibilité avec Blender 4.4.3+
@@ -125,4 +477,4 @@ def register() -> None:
 
 def unregister() -> None:
     """Désenregistre les fonctions du module utils."""
-    pass
\ No newline at end of file
+    _shared_curves.clear()
\ No newline at end of file